@@ -2,10 +2,12 @@
 
 from __future__ import annotations
 
-import json
 from pathlib import Path
 from typing import Optional
 
+from agentbeats.artifacts import iter_records, write_records
+from agentbeats.models import EventSpec, ResolutionRecord
+
 
 INPUT_EVENTS = Path("data/generated/events/watchlist_latest.jsonl")
 OUTPUT_RESOLUTIONS = Path("data/generated/resolutions/watchlist_latest.jsonl")
@@ -16,23 +18,11 @@ def main(events_path: Optional[Path] = None, output_path: Optional[Path] = None)
     output_path = output_path or OUTPUT_RESOLUTIONS
     output_path.parent.mkdir(parents=True, exist_ok=True)
 
-    with events_path.open("r", encoding="utf-8") as ev_handle, output_path.open(
-        "w", encoding="utf-8"
-    ) as out_handle:
-        for line in ev_handle:
-            line = line.strip()
-            if not line:
-                continue
-            event = json.loads(line)
-            resolution = {
-                "id": event["id"],
-                "outcome": 0,
-                "verified_value": None,
-                "verified_source": "manual",
-                "resolved_at": None,
-            }
-            out_handle.write(json.dumps(resolution))
-            out_handle.write("\n")
+    placeholders = (
+        ResolutionRecord(id=event.id, outcome=0, verified_source="manual")
+        for event in iter_records(events_path, EventSpec)
+    )
+    write_records(output_path, placeholders, ResolutionRecord)
     print(f"Wrote placeholder resolutions to {output_path}")
 
 
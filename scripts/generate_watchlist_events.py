@@ -2,11 +2,11 @@
 
 from __future__ import annotations
 
-import json
-from datetime import datetime, timedelta
+import argparse
+from datetime import date, datetime, timedelta, timezone
 from pathlib import Path
 
-from pydantic import BaseModel
+from agentbeats.models import EventSource, EventSpec
 
 WATCHLIST = {
     "TSLA": {
@@ -60,60 +60,59 @@ OUTPUT_PATH = Path("data/generated/events/watchlist_latest.jsonl")
 EVENTS_PER_TICKER = 4
 
 
-def future_date(days: int) -> str:
-    return (datetime.utcnow() + timedelta(days=days)).strftime("%Y-%m-%d")
+def future_date(as_of: date, days: int) -> str:
+    return (as_of + timedelta(days=days)).isoformat()
 
 
-def future_quarter(offset: int) -> str:
-    base = datetime.utcnow()
+def future_quarter(as_of: date, offset: int) -> str:
+    base = as_of
     quarter_index = ((base.month - 1) // 3 + offset) % 4
     year = base.year + ((base.month - 1) // 3 + offset) // 4
     return f"Q{quarter_index + 1} {year}"
 
 
-class EventSpec(BaseModel):
-    id: str
-    question: str
-    domain: str = "finance"
-    resolution_date: str
-    source: dict
-    ground_truth_source: str
-    forecast_horizon_days: int | None = None
-    tags: list[str] = []
-    baseline_probability: float | None = None
-
-
-def generate_event(ticker: str, template: str, idx: int) -> EventSpec:
-    date = future_date(30 + idx * 30)
-    quarter = future_quarter(idx % 4)
+def generate_event(ticker: str, template: str, idx: int, as_of: date) -> EventSpec:
+    day = future_date(as_of, 30 + idx * 30)
+    quarter = future_quarter(as_of, idx % 4)
     question = template.format(
         target=round(100 + idx * 25, 2),
-        date=date,
+        date=day,
         quarter=quarter,
         units=100 + idx * 20,
     )
     return EventSpec(
         id=f"watch_{ticker.lower()}_{idx}",
         question=question,
-        resolution_date=f"{date}T16:00:00Z",
-        source={"type": "watchlist", "market_id": ticker},
+        domain="finance",
+        resolution_date=f"{day}T16:00:00Z",
+        source=EventSource(type="watchlist", market_id=ticker),
         ground_truth_source="manual",
+        forecast_horizon_days=30 + idx * 30,
         tags=[ticker.lower()],
         baseline_probability=WATCHLIST[ticker]["baseline_probability"],
     )
 
 
 def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--as-of",
+        type=date.fromisoformat,
+        default=datetime.now(timezone.utc).date(),
+        help="Date (YYYY-MM-DD) the horizons are counted from; pin it for reproducible output.",
+    )
+    args = parser.parse_args()
     OUTPUT_PATH.parent.mkdir(parents=True, exist_ok=True)
     with OUTPUT_PATH.open("w", encoding="utf-8") as handle:
         for ticker, config in WATCHLIST.items():
             templates = config["question_templates"]
             for idx in range(EVENTS_PER_TICKER):
                 template = templates[idx % len(templates)]
-                event = generate_event(ticker, template, idx)
+                event = generate_event(ticker, template, idx, args.as_of)
                 handle.write(event.model_dump_json())
                 handle.write("\n")
     print(f"Generated {len(WATCHLIST) * EVENTS_PER_TICKER} events at {OUTPUT_PATH}")
+    print("For large seeded corpora use `agentbeats bench generate` (agentbeats.synthetic).")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,109 @@
+"""Read/write pipeline artifacts in the format their path names (JSONL, Parquet or Arrow)."""
+
+from __future__ import annotations
+
+import json
+import os
+import tempfile
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Type, TypeVar
+
+from pydantic import BaseModel
+
+from . import columnar
+from .codec import get_codec
+from .jsonl import iter_jsonl, iter_line_chunks, open_jsonl_writer
+
+M = TypeVar("M", bound=BaseModel)
+
+
+def iter_records(path: Path, model: Type[M], fields: Optional[Sequence[str]] = None, **options: Any) -> Iterator[Any]:
+    """
+    Yield `model` records from `path`: `.parquet` / `.arrow` / `.feather` via pyarrow, else JSONL
+    (`.jsonl.gz` / `.jsonl.zst` are decompressed as they stream).
+
+    With `fields` only those (dotted) fields are decoded, and rows are dicts shaped like `model`;
+    columnar files then read just the matching columns. `options` are passed to `iter_jsonl`
+    (workers, parse, skip_invalid, ...) for JSONL inputs.
+
+    Examples
+    --------
+    >>> for row in iter_records(path, PredictionRecord, fields=["id", "prediction.probability"]):
+    ...     row["prediction"]["probability"]
+    """
+    if columnar.columnar_format(path):
+        if not path.exists():
+            raise FileNotFoundError(path)
+        if fields is not None:
+            yield from columnar.iter_projected(path, model, fields)
+        else:
+            yield from columnar.iter_models(path, model)
+        return
+    yield from iter_jsonl(path, model, fields=fields, **options)
+
+
+def read_records(path: Path, model: Type[M], fields: Optional[Sequence[str]] = None, **options: Any) -> List[Any]:
+    return list(iter_records(path, model, fields=fields, **options))
+
+
+def write_records(path: Path, records: Iterable[M], model: Type[M], level: Optional[int] = None) -> Path:
+    """
+    Write `records` in the format `path` names, replacing the file atomically once done.
+
+    The temp file sits next to `path`, so `records` may safely be a stream over `path` itself.
+    `level` sets the zstd / gzip level for compressed JSONL (AGENTBEATS_COMPRESSION_LEVEL otherwise).
+    """
+    return _write_atomic(
+        path,
+        level,
+        lambda target: columnar.write_models(target, records, model),
+        lambda handle: handle.writelines(get_codec(model).encode_lines(records)),
+    )
+
+
+def write_dict_rows(
+    path: Path, rows: Iterable[Dict[str, Any]], model: Type[M], level: Optional[int] = None
+) -> Path:
+    """
+    Like `write_records` for plain dict rows (e.g. resolver output).
+
+    JSONL keeps each row verbatim, extra keys such as `debug` included; columnar formats store
+    the `model` fields only.
+    """
+
+    def write_jsonl(handle: Any) -> None:
+        for row in rows:
+            handle.write(json.dumps(row))
+            handle.write("\n")
+
+    return _write_atomic(
+        path,
+        level,
+        lambda target: columnar.write_models(target, (model.model_validate(row) for row in rows), model),
+        write_jsonl,
+    )
+
+
+def _write_atomic(path: Path, level: Optional[int], write_columnar: Any, write_jsonl: Any) -> Path:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    # Keeping the suffix keeps the temp file's format (and compression) the same as `path`'s.
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.stem}.", suffix=path.suffix)
+    os.close(fd)
+    try:
+        if columnar.columnar_format(path):
+            write_columnar(Path(tmp_name))
+        else:
+            with open_jsonl_writer(Path(tmp_name), level) as handle:
+                write_jsonl(handle)
+        os.replace(tmp_name, path)
+    except BaseException:
+        Path(tmp_name).unlink(missing_ok=True)
+        raise
+    return path
+
+
+def count_records(path: Path) -> int:
+    """Row count without decoding records."""
+    if columnar.columnar_format(path):
+        return columnar.count_rows(path)
+    return sum(1 for lines in iter_line_chunks(path) for line in lines if line.strip())
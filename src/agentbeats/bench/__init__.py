@@ -0,0 +1,19 @@
+"""Benchmark suite for ingestion, prediction, resolution and evaluation."""
+
+from .dataset import BenchDataset, write_dataset
+from .stubs import StubTransport, stub_clients
+from .suite import DEFAULT_SCALES, STAGES, BenchResult, compare, load_results, run_suite, write_results
+
+__all__ = [
+    "BenchDataset",
+    "BenchResult",
+    "DEFAULT_SCALES",
+    "STAGES",
+    "StubTransport",
+    "compare",
+    "load_results",
+    "run_suite",
+    "stub_clients",
+    "write_dataset",
+    "write_results",
+]
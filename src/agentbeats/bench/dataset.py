@@ -0,0 +1,23 @@
+"""Deterministic JSONL datasets for benchmark runs."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from pathlib import Path
+
+from ..synthetic import SyntheticGenerator
+from .stubs import STUB_TICKERS
+
+
+@dataclass
+class BenchDataset:
+    events: Path
+    predictions: Path
+    resolutions: Path
+    size: int
+
+
+def write_dataset(directory: Path, size: int, seed: int = 7) -> BenchDataset:
+    """Write `size` events plus matching predictions/resolutions under `directory`."""
+    paths = SyntheticGenerator(seed=seed, tickers=list(STUB_TICKERS)).write(directory, size, prices=False)
+    return BenchDataset(events=paths.events, predictions=paths.predictions, resolutions=paths.resolutions, size=size)
@@ -0,0 +1,179 @@
+"""Offline stand-ins for the external services the tool clients call."""
+
+from __future__ import annotations
+
+import json
+import threading
+from datetime import date, timedelta
+from pathlib import Path
+from typing import Any, Dict, Mapping, Optional
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+from ..tools import AlphaVantageClient, EdgarEvidenceFetcher, NewsEvidenceFetcher, ToolCache, ToolLogger
+from ..tools.cache import MemoryCache
+
+# Tickers the synthetic datasets draw from, with the CIKs the stub SEC endpoints answer for.
+STUB_TICKERS: Dict[str, int] = {
+    "TSLA": 1318605,
+    "AAPL": 320193,
+    "MSFT": 789019,
+    "AMZN": 1018724,
+    "NVDA": 1045810,
+}
+
+
+def _response(url: str, body: bytes, content_type: str, status: int = 200) -> requests.Response:
+    response = requests.Response()
+    response.status_code = status
+    response.reason = "OK" if status < 400 else "Not Found"
+    response.url = url
+    response.headers = CaseInsensitiveDict({"Content-Type": content_type})
+    response._content = body
+    response._content_consumed = True
+    return response
+
+
+def _rss(items: int = 20) -> bytes:
+    entries = "".join(
+        f"<item><title>Headline {i}</title><link>https://news.example.com/{i}</link>"
+        f"<guid>stub-{i}</guid><pubDate>Mon, 06 Oct 2025 10:00:00 GMT</pubDate>"
+        f"<description>Summary {i}</description></item>"
+        for i in range(items)
+    )
+    return f'<?xml version="1.0"?><rss version="2.0"><channel><title>stub</title>{entries}</channel></rss>'.encode()
+
+
+def _daily_series(days: int = 400, end: date = date(2025, 12, 31)) -> Dict[str, Any]:
+    points = {}
+    for offset in range(days):
+        day = end - timedelta(days=offset)
+        close = 100.0 + (offset % 37) * 1.5
+        points[day.isoformat()] = {
+            "1. open": f"{close - 1:.2f}",
+            "2. high": f"{close + 2:.2f}",
+            "3. low": f"{close - 2:.2f}",
+            "4. close": f"{close:.2f}",
+            "5. volume": "1000000",
+        }
+    return {"Meta Data": {"2. Symbol": "STUB"}, "Time Series (Daily)": points}
+
+
+def _submissions(cik: int) -> Dict[str, Any]:
+    forms = ["8-K", "10-Q", "10-K", "8-K", "10-Q"] * 20
+    return {
+        "cik": str(cik),
+        "filings": {
+            "recent": {
+                "form": forms,
+                "accessionNumber": [f"0000000000-25-{i:06d}" for i in range(len(forms))],
+                "filingDate": [(date(2025, 11, 1) - timedelta(days=9 * i)).isoformat() for i in range(len(forms))],
+                "primaryDocument": [f"doc{i}.htm" for i in range(len(forms))],
+            }
+        },
+    }
+
+
+def _company_facts() -> Dict[str, Any]:
+    def entries(base: float) -> list:
+        return [
+            {
+                "val": base + i,
+                "start": (date(2020, 1, 1) + timedelta(days=91 * i)).isoformat(),
+                "end": (date(2020, 3, 31) + timedelta(days=91 * i)).isoformat(),
+                "filed": (date(2020, 5, 1) + timedelta(days=91 * i)).isoformat(),
+                "accn": f"0000000000-{i:02d}-000001",
+                "form": "10-Q",
+                "contextRef": f"Q{i}",
+            }
+            for i in range(24)
+        ]
+
+    return {
+        "facts": {
+            "us-gaap": {
+                "EarningsPerShareDiluted": {"units": {"USD/shares": entries(1.0)}},
+                "Revenues": {"units": {"USD": entries(1e9)}},
+            }
+        }
+    }
+
+
+class StubTransport:
+    """
+    Drop-in for `HttpTransport` answering news, SEC and Alpha Vantage URLs from canned payloads.
+
+    Bodies are serialized once up front so the benchmark measures client-side work, not stub
+    construction. `calls` counts requests per host for sanity checks.
+    """
+
+    def __init__(self) -> None:
+        self._bodies: Dict[str, tuple[bytes, str]] = {
+            "news": (_rss(), "application/rss+xml"),
+            "alpha": (json.dumps(_daily_series()).encode(), "application/json"),
+            "tickers": (
+                json.dumps(
+                    {str(i): {"cik_str": cik, "ticker": ticker, "title": ticker} for i, (ticker, cik) in enumerate(STUB_TICKERS.items())}
+                ).encode(),
+                "application/json",
+            ),
+            "facts": (json.dumps(_company_facts()).encode(), "application/json"),
+        }
+        self._submissions = {
+            str(cik).zfill(10): json.dumps(_submissions(cik)).encode() for cik in STUB_TICKERS.values()
+        }
+        self.calls: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def get(
+        self,
+        url: str,
+        params: Optional[Mapping[str, Any]] = None,
+        headers: Optional[Mapping[str, str]] = None,
+        timeout: float = 30,
+        stream: bool = False,
+    ) -> requests.Response:
+        host = url.split("/")[2]
+        with self._lock:
+            self.calls[host] = self.calls.get(host, 0) + 1
+        if "news.google.com" in url:
+            return _response(url, *self._bodies["news"])
+        if "alphavantage.co" in url:
+            return _response(url, *self._bodies["alpha"])
+        if url.endswith("company_tickers.json"):
+            return _response(url, *self._bodies["tickers"])
+        if "/submissions/CIK" in url:
+            cik = url.rsplit("CIK", 1)[1].split(".")[0]
+            body = self._submissions.get(cik)
+            if body is not None:
+                return _response(url, body, "application/json")
+        if "/companyfacts/CIK" in url:
+            return _response(url, *self._bodies["facts"])
+        return _response(url, b"{}", "application/json", status=404)
+
+
+def stub_clients(workdir: Path) -> Dict[str, Any]:
+    """Tool clients wired to a `StubTransport` with caches and logs isolated under `workdir`."""
+    transport = StubTransport()
+    tool_cache = ToolCache(workdir / "tools.sqlite3", memory_cache=MemoryCache())
+    logs = workdir / "tool_logs"
+    return {
+        "transport": transport,
+        "tool_cache": tool_cache,
+        "news": NewsEvidenceFetcher(logger=ToolLogger("news", logs), transport=transport, tool_cache=tool_cache),
+        "alpha": AlphaVantageClient(
+            api_key="stub",
+            logger=ToolLogger("alpha_vantage", logs),
+            cache_dir=workdir / "alpha_vantage",
+            transport=transport,
+            tool_cache=tool_cache,
+        ),
+        "edgar": EdgarEvidenceFetcher(
+            user_agent="agentbeats-bench/0.1",
+            cache_dir=workdir / "edgar",
+            logger=ToolLogger("edgar", logs),
+            transport=transport,
+            tool_cache=tool_cache,
+        ),
+    }
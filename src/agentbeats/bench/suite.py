@@ -0,0 +1,212 @@
+"""Stage timings and memory profiles for the ingestion -> prediction -> evaluation pipeline."""
+
+from __future__ import annotations
+
+import gc
+import itertools
+import json
+import platform
+import tempfile
+import time
+import tracemalloc
+from dataclasses import asdict, dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+from ..config import EvaluatorConfig, IngestionConfig, PredictorConfig
+from ..evaluator import BaselineEvaluator
+from ..ingestion import EventIngestion
+from ..predictor import PurpleAgent
+from ..resolution import PriceCloseResolver
+from .dataset import BenchDataset, write_dataset
+from .stubs import stub_clients
+
+DEFAULT_SCALES = (1_000, 100_000, 1_000_000)
+RESULTS_VERSION = 1
+
+# A prepared stage: setup happens when it is built, calling it runs the measured work and
+# returns how many items it processed.
+StageRun = Callable[[], int]
+
+
+@dataclass
+class BenchResult:
+    stage: str
+    scale: int
+    seconds: float
+    items_per_second: float
+    peak_bytes: Optional[int] = None
+
+
+def _prepare_ingest(dataset: BenchDataset, workdir: Path) -> StageRun:
+    pipeline = EventIngestion(IngestionConfig(source="fixture", fixture_events=dataset.events))
+    output = workdir / "ingested.jsonl"
+
+    def run() -> int:
+        pipeline.run(output_path=output)
+        return dataset.size
+
+    return run
+
+
+def _prepare_predict(dataset: BenchDataset, workdir: Path) -> StageRun:
+    clients = stub_clients(workdir)
+    agent = PurpleAgent(
+        PredictorConfig(),
+        news_fetcher=clients["news"],
+        alpha_client=clients["alpha"],
+        edgar_fetcher=clients["edgar"],
+    )
+    events = agent.ingest_events(dataset.events)
+
+    def run() -> int:
+        return len(agent.predict(events))
+
+    return run
+
+
+def _prepare_resolve(dataset: BenchDataset, workdir: Path) -> StageRun:
+    resolver = PriceCloseResolver(stub_clients(workdir)["alpha"])
+    events = EventIngestion(IngestionConfig(source="fixture")).load_events(dataset.events)
+
+    def run() -> int:
+        resolver.resolve(events)
+        return len(events)
+
+    return run
+
+
+def _prepare_evaluate(dataset: BenchDataset, workdir: Path) -> StageRun:
+    evaluator = BaselineEvaluator(EvaluatorConfig(run_log_dir=workdir / "runs"))
+
+    def run() -> int:
+        return int(evaluator.evaluate(dataset.predictions, dataset.resolutions, dataset.events)["events"])
+
+    return run
+
+
+STAGES: Dict[str, Callable[[BenchDataset, Path], StageRun]] = {
+    "ingest": _prepare_ingest,
+    "predict": _prepare_predict,
+    "resolve": _prepare_resolve,
+    "evaluate": _prepare_evaluate,
+}
+
+
+def _measure(prepare: Callable[[], StageRun], trace_memory: bool) -> tuple[float, int, Optional[int]]:
+    """Wall time of one untraced run, plus tracemalloc peak from a second run when requested."""
+    run = prepare()
+    gc.collect()
+    started = time.perf_counter()
+    items = run()
+    seconds = time.perf_counter() - started
+    del run
+    peak: Optional[int] = None
+    if trace_memory:
+        # Tracing slows allocation-heavy code severalfold, so memory gets its own run.
+        run = prepare()
+        gc.collect()
+        tracemalloc.start()
+        try:
+            run()
+            peak = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+        del run
+    return seconds, items, peak
+
+
+def run_suite(
+    scales: Iterable[int] = DEFAULT_SCALES,
+    stages: Optional[Iterable[str]] = None,
+    trace_memory: bool = True,
+    workdir: Optional[Path] = None,
+    log: Optional[Callable[[str], None]] = None,
+) -> Dict[str, Any]:
+    """Run each stage at each scale on a generated dataset; returns a JSON-ready results document."""
+    selected = list(stages or STAGES)
+    unknown = [stage for stage in selected if stage not in STAGES]
+    if unknown:
+        raise ValueError(f"Unknown stage(s): {', '.join(unknown)} (expected {', '.join(STAGES)})")
+    results: List[BenchResult] = []
+    with tempfile.TemporaryDirectory(prefix="agentbeats-bench-", dir=workdir) as tmp:
+        root = Path(tmp)
+        for scale in scales:
+            dataset = write_dataset(root / f"data_{scale}", scale)
+            for stage in selected:
+                stage_dir = root / f"{stage}_{scale}"
+                counter = itertools.count()
+
+                def prepare() -> StageRun:
+                    # Fresh caches/logs per run so timing and memory passes see the same cold state.
+                    run_dir = stage_dir / str(next(counter))
+                    run_dir.mkdir(parents=True, exist_ok=True)
+                    return STAGES[stage](dataset, run_dir)
+
+                seconds, items, peak = _measure(prepare, trace_memory)
+                result = BenchResult(
+                    stage=stage,
+                    scale=scale,
+                    seconds=round(seconds, 6),
+                    items_per_second=round(items / seconds, 2) if seconds else 0.0,
+                    peak_bytes=peak,
+                )
+                results.append(result)
+                if log:
+                    memory = f", peak {peak / 2**20:.1f} MiB" if peak is not None else ""
+                    log(f"{stage:<9} n={scale:<9} {seconds:9.3f}s  {result.items_per_second:12.1f} items/s{memory}")
+    return {
+        "version": RESULTS_VERSION,
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "results": [asdict(result) for result in results],
+    }
+
+
+def write_results(document: Dict[str, Any], path: Path) -> Path:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with path.open("w", encoding="utf-8") as handle:
+        json.dump(document, handle, indent=2)
+    return path
+
+
+def load_results(path: Path) -> Dict[str, Any]:
+    with path.open("r", encoding="utf-8") as handle:
+        return json.load(handle)
+
+
+def compare(
+    current: Dict[str, Any],
+    baseline: Dict[str, Any],
+    threshold: float = 0.2,
+) -> List[Dict[str, Any]]:
+    """
+    Return regressions: (stage, scale) pairs whose time or peak memory grew beyond `threshold`.
+
+    Only pairs present in both documents are compared; e.g. 0.2 tolerates 20% slower/larger.
+    """
+    reference = {(row["stage"], row["scale"]): row for row in baseline.get("results", [])}
+    regressions: List[Dict[str, Any]] = []
+    for row in current.get("results", []):
+        base = reference.get((row["stage"], row["scale"]))
+        if base is None:
+            continue
+        for metric in ("seconds", "peak_bytes"):
+            now, before = row.get(metric), base.get(metric)
+            if not now or not before:
+                continue
+            ratio = now / before
+            if ratio > 1 + threshold:
+                regressions.append(
+                    {
+                        "stage": row["stage"],
+                        "scale": row["scale"],
+                        "metric": metric,
+                        "baseline": before,
+                        "current": now,
+                        "ratio": round(ratio, 3),
+                    }
+                )
+    return regressions
@@ -1,12 +1,16 @@
 """AgentBeats command-line interface."""
 
+from pathlib import Path
+from typing import Optional
+
 import typer
 
+from .bench import bench_app, bench_run, bench_compare
 from .ingest import ingest_app, ingest_events
 from .resolve import resolve_app, generate_resolutions, resolve_prices
 from .run import run_app, run_predictor, run_evaluator
 from .status import status_app, status
-from .tool import tool_app, fetch_edgar, fetch_alpha
+from .tool import tool_app, fetch_edgar, fetch_alpha, warm_tools
 
 app = typer.Typer(help="AgentBeats evaluator/predictor utilities")
 app.add_typer(ingest_app, name="ingest")
@@ -14,10 +18,35 @@ app.add_typer(run_app, name="run")
 app.add_typer(tool_app, name="tool")
 app.add_typer(resolve_app, name="resolve")
 app.add_typer(status_app, name="status")
+app.add_typer(bench_app, name="bench")
 
 @app.callback(invoke_without_command=True)
-def _main(ctx: typer.Context):
+def _main(
+    ctx: typer.Context,
+    cassette: Optional[str] = typer.Option(
+        None, help="Record or replay all tool HTTP traffic: off, record or replay (default: AGENTBEATS_CASSETTE_MODE)"
+    ),
+    cassette_path: Optional[Path] = typer.Option(
+        None, help="Cassette file (default: AGENTBEATS_CASSETTE_PATH or data/generated/cassettes/tools.sqlite3)"
+    ),
+    cassette_latency: Optional[str] = typer.Option(
+        None, help="Replay delay per response: seconds, or 'recorded' to reuse recorded timings"
+    ),
+):
     """Entry point that shows a short quickstart when no command is provided."""
+    if cassette is not None:
+        from ..tools import Cassette, set_cassette
+
+        latency = cassette_latency
+        if latency not in (None, "recorded"):
+            try:
+                latency = float(latency)
+            except ValueError:
+                raise typer.BadParameter("--cassette-latency must be seconds or 'recorded'")
+        try:
+            set_cassette(None if cassette == "off" else Cassette(cassette_path, mode=cassette, latency=latency))
+        except ValueError as exc:
+            raise typer.BadParameter(str(exc))
     if ctx.invoked_subcommand is None:
         typer.secho("AgentBeats CLI - no command provided.\n", fg="yellow")
         typer.echo("Common commands:")
@@ -25,8 +54,10 @@ def _main(ctx: typer.Context):
         typer.echo("  agentbeats run predictor         # generate predictions")
         typer.echo("  agentbeats run evaluator         # score predictions")
         typer.echo("  agentbeats tool edgar            # pull EDGAR filings/facts")
+        typer.echo("  agentbeats tool warm             # prefetch tool caches for events")
         typer.echo("  agentbeats resolve prices        # price-close resolutions")
         typer.echo("  agentbeats status show           # show data files")
+        typer.echo("  agentbeats bench run             # benchmark pipeline stages")
         typer.echo("  agentbeats --help                # full command list")
         raise typer.Exit()
 
@@ -0,0 +1,131 @@
+from pathlib import Path
+from typing import Optional
+
+import typer
+
+bench_app = typer.Typer(help="Benchmark commands")
+
+
+def _parse_scales(raw: str) -> list[int]:
+    try:
+        scales = [int(float(part)) for part in raw.split(",") if part.strip()]
+    except ValueError:
+        raise typer.BadParameter(f"Invalid scales '{raw}' (expected e.g. 1000,100000)")
+    if not scales or any(scale <= 0 for scale in scales):
+        raise typer.BadParameter("Scales must be positive integers")
+    return scales
+
+
+def _report_regressions(regressions: list[dict], ok_message: str) -> None:
+    """Print each regression and exit with status 1 if there are any, else print `ok_message`."""
+    for row in regressions:
+        typer.secho(
+            f"REGRESSION {row['stage']} n={row['scale']} {row['metric']}: "
+            f"{row['baseline']} -> {row['current']} (x{row['ratio']})",
+            fg="red",
+        )
+    if regressions:
+        raise typer.Exit(code=1)
+    typer.secho(ok_message, fg="green")
+
+
+@bench_app.command("run")
+def bench_run(
+    scales: str = typer.Option("1000,100000,1000000", help="Comma-separated event counts (1e5 style accepted)"),
+    stages: str = typer.Option("ingest,predict,resolve,evaluate", help="Comma-separated stages to run"),
+    output_path: Path = typer.Option(
+        Path("data/generated/bench/latest.json"), help="Where to write machine-readable results"
+    ),
+    baseline: Optional[Path] = typer.Option(None, help="Baseline results JSON to compare against"),
+    threshold: float = typer.Option(0.2, min=0.0, help="Allowed slowdown/memory growth vs baseline (0.2 = 20%)"),
+    memory: bool = typer.Option(True, help="Also profile peak memory (tracemalloc, one extra run per stage)"),
+    save_baseline: Optional[Path] = typer.Option(None, help="Also write these results as a new baseline"),
+):
+    """
+    Time and memory-profile pipeline stages on generated data with stubbed tools (no network).
+
+    Exits with status 1 when any stage regresses beyond --threshold against --baseline.
+
+    \b
+    Examples:
+      Quick local run:
+        agentbeats bench run --scales 1000 --no-memory
+      Record a baseline, then gate on it:
+        agentbeats bench run --scales 1000,100000 --save-baseline benchmarks/baseline.json
+        agentbeats bench run --scales 1000,100000 --baseline benchmarks/baseline.json
+    """
+    from ..bench import compare, load_results, run_suite, write_results
+
+    try:
+        document = run_suite(
+            scales=_parse_scales(scales),
+            stages=[stage.strip() for stage in stages.split(",") if stage.strip()],
+            trace_memory=memory,
+            log=lambda line: typer.echo(line),
+        )
+    except ValueError as exc:
+        raise typer.BadParameter(str(exc))
+    write_results(document, output_path)
+    typer.secho(f"Results written to {output_path}", fg="green")
+    if save_baseline:
+        write_results(document, save_baseline)
+        typer.secho(f"Baseline written to {save_baseline}", fg="green")
+    if baseline:
+        if not baseline.exists():
+            raise typer.BadParameter(f"Baseline not found: {baseline}")
+        regressions = compare(document, load_results(baseline), threshold=threshold)
+        _report_regressions(regressions, f"No regressions beyond {threshold:.0%} against {baseline}")
+
+
+@bench_app.command("generate")
+def bench_generate(
+    size: str = typer.Option("1000000", help="Number of events (1e7 style accepted)"),
+    seed: int = typer.Option(0, help="Seed; identical seed and size give byte-identical files"),
+    output_dir: Path = typer.Option(Path("data/generated/synthetic"), help="Directory for the generated corpus"),
+    tickers: str = typer.Option("TSLA,AAPL,MSFT,AMZN,NVDA", help="Comma-separated tickers to draw from"),
+    chunk_size: int = typer.Option(250_000, min=1, help="Rows generated and written per chunk"),
+    prices: bool = typer.Option(True, help="Also write matching Alpha Vantage style daily series per ticker"),
+    compression: str = typer.Option("none", help="Compress the JSONL files: none, gz or zst"),
+):
+    """
+    Generate a seeded load-test corpus: events, predictions, resolutions and price series.
+
+    \b
+    Examples:
+      agentbeats bench generate --size 1e7 --seed 42 --output-dir data/generated/load
+      agentbeats bench generate --size 1e6 --compression zst
+    """
+    import time
+
+    from ..synthetic import SyntheticGenerator
+
+    (count,) = _parse_scales(size)
+    symbols = [ticker.strip() for ticker in tickers.split(",") if ticker.strip()]
+    if not symbols:
+        raise typer.BadParameter("At least one ticker is required")
+    suffixes = {"none": ".jsonl", "gz": ".jsonl.gz", "zst": ".jsonl.zst"}
+    if compression not in suffixes:
+        raise typer.BadParameter("--compression must be one of: none, gz, zst")
+    started = time.perf_counter()
+    paths = SyntheticGenerator(seed=seed, tickers=symbols, chunk_size=chunk_size).write(
+        output_dir, count, prices=prices, suffix=suffixes[compression]
+    )
+    typer.secho(
+        f"Generated {count} events in {time.perf_counter() - started:.1f}s under {output_dir} "
+        f"({paths.events.name}, {paths.predictions.name}, {paths.resolutions.name}"
+        f"{', ' + paths.prices.name + '/' if prices else ''})",
+        fg="green",
+    )
+
+
+@bench_app.command("compare")
+def bench_compare(
+    current: Path = typer.Argument(..., help="Results JSON to check"),
+    baseline: Path = typer.Argument(..., help="Baseline results JSON"),
+    threshold: float = typer.Option(0.2, min=0.0, help="Allowed slowdown/memory growth (0.2 = 20%)"),
+):
+    """Compare two results files; exits with status 1 on regressions."""
+    from ..bench import compare, load_results
+
+    regressions = compare(load_results(current), load_results(baseline), threshold=threshold)
+    _report_regressions(regressions, "No regressions")
@@ -4,6 +4,8 @@ from typing import Optional
 
 import typer
 
+from ..artifacts import count_records
+
 
 def parse_timestamp(value: Optional[str]) -> Optional[datetime]:
     if not value:
@@ -46,7 +48,7 @@ def stat_file(path: Path) -> dict:
     if not path.exists():
         return {"exists": False}
     try:
-        lines = sum(1 for _ in path.open("r", encoding="utf-8"))
+        lines = count_records(path)
     except Exception:
         lines = None
     mtime = datetime.fromtimestamp(path.stat().st_mtime).isoformat()
@@ -19,7 +19,13 @@ def ingest_events(
         "polymarket", help="Ingestion source (polymarket or fixture)"
     ),
     limit: int = typer.Option(
-        10, help="Number of events to fetch when source=polymarket"
+        10, help="Number of markets to scan when source=polymarket (0 = all)"
+    ),
+    page_size: int = typer.Option(
+        100, min=1, help="Markets per page when paginating Polymarket"
+    ),
+    concurrency: int = typer.Option(
+        1, min=1, help="Polymarket pages fetched concurrently"
     ),
     include_active: bool = typer.Option(
         True, help="Include active markets (polymarket)"
@@ -36,6 +42,8 @@ def ingest_events(
     Examples:
       Polymarket source:
         agentbeats ingest events --source polymarket --limit 10
+      Every active market, four pages at a time:
+        agentbeats ingest events --source polymarket --limit 0 --concurrency 4
     \b
       Fixture source (offline):
         agentbeats ingest events --source fixture --output-path data/generated/events/latest.jsonl
@@ -48,6 +56,8 @@ def ingest_events(
     config_kwargs = {
         "source": source,
         "polymarket_limit": limit,
+        "polymarket_page_size": page_size,
+        "polymarket_concurrency": concurrency,
         "include_active": include_active,
     }
     if keyword_list is not None:
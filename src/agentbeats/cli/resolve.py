@@ -3,13 +3,13 @@ from typing import Optional
 
 import typer
 
-from ..models import EventSpec
+from ..artifacts import iter_records, write_dict_rows, write_records
+from ..models import EventSpec, ResolutionRecord
 from ..resolution import PriceCloseResolver
 from ..config import IngestionConfig, PredictorConfig
 from ..ingestion import EventIngestion
 from ..tools import AlphaVantageClient
 from .common import get_default_path
-import json
 
 resolve_app = typer.Typer(help="Resolvers for ground truth")
 
@@ -37,21 +37,11 @@ def generate_resolutions(
         raise typer.Exit(code=1)
 
     try:
-        with eloc.open("r", encoding="utf-8") as ev_handle, out.open("w", encoding="utf-8") as out_handle:
-            for line in ev_handle:
-                line = line.strip()
-                if not line:
-                    continue
-                event = EventSpec.model_validate_json(line)
-                resolution = {
-                    "id": event.id,
-                    "outcome": 0,
-                    "verified_value": None,
-                    "verified_source": "manual",
-                    "resolved_at": None,
-                }
-                out_handle.write(json.dumps(resolution))
-                out_handle.write("\n")
+        placeholders = (
+            ResolutionRecord(id=event.id, outcome=0, verified_source="manual")
+            for event in iter_records(eloc, EventSpec)
+        )
+        write_records(out, placeholders, ResolutionRecord)
         typer.echo(f"Wrote placeholder resolutions to {out}")
     except Exception as exc:
         typer.secho(f"✗ Error generating resolutions: {exc}", fg="red")
@@ -95,8 +85,5 @@ def resolve_prices(
     if not resolutions:
         typer.secho("No price-close style events found to resolve.", fg="yellow")
         return
-    with out.open("w", encoding="utf-8") as handle:
-        for row in resolutions:
-            handle.write(json.dumps(row))
-            handle.write("\n")
+    write_dict_rows(out, resolutions, ResolutionRecord)
     typer.secho(f"Resolved {len(resolutions)} events to {out}", fg="green")
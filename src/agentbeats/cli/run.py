@@ -4,9 +4,11 @@ from typing import Optional
 import typer
 from pydantic import ValidationError
 
+from ..artifacts import write_dict_rows
 from ..config import EvaluatorConfig, PredictorConfig
 from ..evaluator import BaselineEvaluator
 from ..predictor import PurpleAgent
+from ..tools import CassetteMiss
 from .common import get_default_path, parse_timestamp
 
 run_app = typer.Typer(help="Run commands (purple/green)")
@@ -20,6 +22,15 @@ def run_predictor(
         None,
         help="ISO8601 timestamp for metadata (default: now, UTC)",
     ),
+    concurrency: int = typer.Option(
+        1, min=1, help="Max concurrent evidence tool calls (1 = serial)"
+    ),
+    prefetch: bool = typer.Option(
+        False, help="Warm tool caches for the whole batch before gathering evidence"
+    ),
+    market_evidence: bool = typer.Option(
+        False, help="Use Polymarket odds as evidence (batched market lookups for events without a baseline)"
+    ),
 ):
     """
     Generate predictions using the stub purple agent.
@@ -30,9 +41,15 @@ def run_predictor(
         agentbeats run predictor
       Explicit inputs with timestamp:
         agentbeats run predictor --events-path data/generated/events/latest.jsonl --as-of 2025-01-01T00:00:00Z
+      Concurrent evidence gathering:
+        agentbeats run predictor --concurrency 8
+      Prefetch all tool requests first, then predict from cache:
+        agentbeats run predictor --prefetch
+      Blend in Polymarket odds as evidence:
+        agentbeats run predictor --market-evidence
     """
 
-    config = PredictorConfig()
+    config = PredictorConfig(max_concurrency=concurrency, prefetch=prefetch, market_evidence=market_evidence)
     agent = PurpleAgent(config)
 
     def console_log(message: str, color: str = "cyan") -> None:
@@ -49,9 +66,21 @@ def run_predictor(
 
 @run_app.command("evaluator")
 def run_evaluator(
-    predictions_path: Optional[Path] = typer.Option(None, help="JSONL predictions file"),
-    resolutions_path: Optional[Path] = typer.Option(None, help="JSONL resolutions file"),
-    events_path: Optional[Path] = typer.Option(None, help="Event snapshot JSONL"),
+    predictions_path: Optional[Path] = typer.Option(None, help="Predictions file (JSONL, .jsonl.gz/.zst, .parquet or .arrow)"),
+    resolutions_path: Optional[Path] = typer.Option(None, help="Resolutions file (JSONL, .jsonl.gz/.zst, .parquet or .arrow)"),
+    events_path: Optional[Path] = typer.Option(None, help="Event snapshot (JSONL, .jsonl.gz/.zst, .parquet or .arrow)"),
+    records_format: str = typer.Option("jsonl", help="Run records format: jsonl, jsonl.gz, jsonl.zst, parquet or arrow"),
+    stream: bool = typer.Option(False, help="Join and score predictions as they are read (bounded memory)"),
+    memory_budget_mb: int = typer.Option(
+        512, min=1, help="With --stream: resolution/event maps above this spill to an on-disk sort-merge join"
+    ),
+    spill_dir: Optional[Path] = typer.Option(None, help="With --stream: directory for spilled sort runs (default: system temp)"),
+    incremental: bool = typer.Option(
+        False, help="Score only the last run's newly resolved predictions and merge them into its metric state"
+    ),
+    base_run: Optional[Path] = typer.Option(
+        None, help="With --incremental: run directory to build on (default: latest run over the same inputs)"
+    ),
 ):
     """
     Run the MVP evaluator on fixture or user-provided data.
@@ -64,9 +93,25 @@ def run_evaluator(
         agentbeats run evaluator --predictions-path data/generated/predictions/latest.jsonl \\
           --resolutions-path data/generated/resolutions/latest.jsonl \\
           --events-path data/generated/events/latest.jsonl
+      Columnar inputs and run records (needs pyarrow):
+        agentbeats run evaluator --predictions-path predictions.parquet --records-format parquet
+      Very large inputs in bounded memory:
+        agentbeats run evaluator --stream --memory-budget-mb 256 --spill-dir /mnt/scratch
+      Only score resolutions that arrived since the last run:
+        agentbeats run evaluator --incremental
     """
 
-    config = EvaluatorConfig()
+    try:
+        config = EvaluatorConfig(
+            records_format=records_format,
+            streaming=stream,
+            memory_budget_mb=memory_budget_mb,
+            spill_dir=spill_dir,
+            incremental=incremental,
+            base_run=base_run,
+        )
+    except ValidationError:
+        raise typer.BadParameter("--records-format must be one of: jsonl, jsonl.gz, jsonl.zst, parquet, arrow")
     evaluator = BaselineEvaluator(config)
     default_predictions = get_default_path("predictions")
     default_resolutions = get_default_path("resolutions")
@@ -134,6 +179,9 @@ def run_pipeline(
     events_path: Optional[Path] = typer.Option(None, help="Override events path"),
     predictions_path: Optional[Path] = typer.Option(None, help="Override predictions output"),
     resolutions_path: Optional[Path] = typer.Option(None, help="Override resolutions output"),
+    concurrency: int = typer.Option(1, min=1, help="Max concurrent evidence tool calls (1 = serial)"),
+    prefetch: bool = typer.Option(False, help="Warm tool caches for the whole batch before predicting"),
+    market_evidence: bool = typer.Option(False, help="Use Polymarket odds as evidence when predicting"),
 ):
     """
     Run the pipeline: ingest -> predict -> (optional) resolve prices -> evaluate.
@@ -165,7 +213,7 @@ def run_pipeline(
     # Predict
     typer.secho("⠋ Generating predictions...", fg="cyan")
     pred_path = predictions_path or get_default_path("predictions")
-    agent = PurpleAgent(PredictorConfig())
+    agent = PurpleAgent(PredictorConfig(max_concurrency=concurrency, prefetch=prefetch, market_evidence=market_evidence))
     preds_out = agent.run(
         events_path=ev_path,
         output_path=pred_path,
@@ -178,6 +226,7 @@ def run_pipeline(
     res_path = resolutions_path or get_default_path("resolutions")
     if not skip_resolve:
         try:
+            from ..models import ResolutionRecord
             from ..resolution import PriceCloseResolver
             from ..tools import AlphaVantageClient
             cfg = PredictorConfig()
@@ -189,15 +238,12 @@ def run_pipeline(
             events = list(EventIngestion(IngestionConfig(fixture_events=ev_path)).load_events(ev_path))
             resolutions = resolver.resolve(events)
             if resolutions:
-                res_path.parent.mkdir(parents=True, exist_ok=True)
-                with res_path.open("w", encoding="utf-8") as handle:
-                    import json
-                    for row in resolutions:
-                        handle.write(json.dumps(row))
-                        handle.write("\n")
+                write_dict_rows(res_path, resolutions, ResolutionRecord)
                 typer.secho(f"✓ Resolved {len(resolutions)} price events to {res_path}", fg="green")
             else:
                 typer.secho("↷ No price-close events found to resolve.", fg="yellow")
+        except CassetteMiss:
+            raise
         except Exception as exc:  # noqa: BLE001
             typer.secho(f"✗ Price resolution skipped due to error: {exc}", fg="red")
             typer.secho(f"↷ Using existing/placeholder resolutions at {res_path}", fg="yellow")
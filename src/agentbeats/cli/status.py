@@ -2,6 +2,7 @@ from pathlib import Path
 
 import typer
 
+from ..artifacts import iter_records
 from ..config import EvaluatorConfig
 from ..models import EventSpec, ResolutionRecord
 from .common import get_default_path, stat_file
@@ -49,29 +50,20 @@ def coverage(
         typer.secho(f"✗ Resolutions file not found: {res_path}", fg="red")
         raise typer.Exit(code=1)
 
-    events = {}
-    with ev_path.open("r", encoding="utf-8") as handle:
-        for line in handle:
-            line = line.strip()
-            if line:
-                event = EventSpec.model_validate_json(line)
-                events[event.id] = event
-    resolutions = {}
-    with res_path.open("r", encoding="utf-8") as handle:
-        for line in handle:
-            line = line.strip()
-            if line:
-                try:
-                    res = ResolutionRecord.model_validate_json(line)
-                    resolutions[res.id] = res
-                except Exception:
-                    continue
+    # Only ids and provenance flags are needed; other fields are not decoded.
+    events = {row["id"] for row in iter_records(ev_path, EventSpec, fields=["id"])}
+    resolutions = {
+        row["id"]: row
+        for row in iter_records(
+            res_path, ResolutionRecord, fields=["id", "outcome", "verified_source", "resolved_at"], skip_invalid=True
+        )
+    }
 
-    missing = [eid for eid in events.keys() if eid not in resolutions]
+    missing = [eid for eid in events if eid not in resolutions]
     weak = [
         rid
         for rid, res in resolutions.items()
-        if not res.verified_source or not res.resolved_at
+        if not res["verified_source"] or not res["resolved_at"]
     ]
 
     typer.secho("Coverage check", fg="cyan")
@@ -4,8 +4,11 @@ from typing import Optional
 
 import typer
 
+from ..artifacts import iter_records
+from ..config import PredictorConfig
+from ..jsonl import open_jsonl_writer
 from ..models import EventSpec
-from ..tools import AlphaVantageClient, EdgarEvidenceFetcher
+from ..tools import AlphaVantageClient, EdgarEvidenceFetcher, PolymarketClient
 from .common import get_default_path
 
 tool_app = typer.Typer(help="Tool debug/fetch commands")
@@ -14,7 +17,7 @@ tool_app = typer.Typer(help="Tool debug/fetch commands")
 @tool_app.command("edgar")
 def fetch_edgar(
     events_path: Optional[Path] = typer.Option(None, help="Events JSONL to fetch EDGAR evidence for"),
-    output_path: Optional[Path] = typer.Option(None, help="Where to write EDGAR evidence JSONL"),
+    output_path: Optional[Path] = typer.Option(None, help="Where to write EDGAR evidence (JSONL, .jsonl.gz/.zst)"),
     forms: str = typer.Option("8-K,10-Q,10-K", help="Comma-separated form types to include"),
     fact_tags: str = typer.Option(
         "us-gaap:EarningsPerShareDiluted,us-gaap:Revenues", help="Comma-separated XBRL tags to fetch"
@@ -46,12 +49,8 @@ def fetch_edgar(
 
     fetcher = EdgarEvidenceFetcher()
     written = 0
-    with eloc.open("r", encoding="utf-8") as ev_handle, out.open("w", encoding="utf-8") as out_handle:
-        for line in ev_handle:
-            line = line.strip()
-            if not line:
-                continue
-            event = EventSpec.model_validate_json(line)
+    with open_jsonl_writer(out) as out_handle:
+        for event in iter_records(eloc, EventSpec):
             filings = fetcher.fetch_latest(event, forms=form_list, limit=limit)
             facts = fetcher.fetch_facts(event, tags=tags_list, forms=form_list, limit=limit)
             if not filings and not facts:
@@ -102,3 +101,53 @@ def fetch_alpha(
     else:
         payload = json.dumps(data)
         typer.echo(payload[:2000] + ("..." if len(payload) > 2000 else ""))
+
+
+def _parse_budgets(raw: str) -> dict[str, int]:
+    budgets: dict[str, int] = {}
+    for item in raw.split(","):
+        if not item.strip():
+            continue
+        tool, _, count = item.partition("=")
+        try:
+            budgets[tool.strip()] = max(int(count), 1)
+        except ValueError:
+            raise typer.BadParameter(f"Invalid budget '{item}' (expected tool=count)")
+    return budgets
+
+
+@tool_app.command("warm")
+def warm_tools(
+    events_path: Optional[Path] = typer.Option(None, help="Events JSONL whose tool requests should be prefetched"),
+    budgets: str = typer.Option(
+        "", help="Per-tool concurrency overrides, e.g. news=8,edgar=4 (tools: news, alpha_vantage, edgar, polymarket)"
+    ),
+    markets: bool = typer.Option(True, help="Also prefetch Polymarket markets for events without a baseline"),
+):
+    """
+    Prefetch every deduplicated tool request an events snapshot needs into the tool caches.
+
+    Scans the events for unique news queries, Alpha Vantage symbols, EDGAR tickers and Polymarket
+    ids, then fetches them concurrently (per-tool budgets) so a following `run predictor` is served
+    from cache.
+
+    \b
+    Examples:
+      agentbeats tool warm --events-path data/generated/events/latest.jsonl
+      agentbeats tool warm --budgets news=8,edgar=6
+    """
+    from ..predictor import PurpleAgent
+
+    eloc = events_path or get_default_path("events")
+    if not eloc.exists():
+        raise typer.BadParameter(f"Events file not found: {eloc}")
+    agent = PurpleAgent(PredictorConfig(prefetch_budgets=_parse_budgets(budgets)))
+    events = agent.ingest_events(eloc)
+    planner = agent.build_planner(PolymarketClient() if markets else None)
+    plan = planner.plan(events)
+    counts = ", ".join(f"{tool}={count}" for tool, count in plan.counts().items() if count)
+    typer.secho(f"Planned tool requests for {len(events)} events: {counts or 'none'}", fg="cyan")
+    summary = planner.warm(plan)
+    for tool, result in summary.items():
+        color = "green" if not result["missed"] else "yellow"
+        typer.secho(f"{tool}: {result['ok']}/{result['requested']} warmed ({result['missed']} failed or empty)", fg=color)
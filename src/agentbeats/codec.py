@@ -0,0 +1,430 @@
+"""JSONL (de)serialization for the artifact models (events, predictions, resolutions)."""
+
+from __future__ import annotations
+
+import gc
+import os
+import threading
+import types
+from contextlib import contextmanager
+from datetime import datetime
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Generic,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+    get_args,
+    get_origin,
+    get_type_hints,
+)
+
+import annotated_types
+from pydantic import BaseModel, TypeAdapter, ValidationError
+from typing_extensions import Annotated, NotRequired, TypedDict
+
+try:  # Optional: faster encoding of model rows.
+    import msgspec
+except ImportError:  # pragma: no cover - depends on environment
+    msgspec = None
+
+CODEC_BACKENDS = ("auto", "msgspec", "pydantic")
+DECODE_BATCH = 4096
+
+M = TypeVar("M", bound=BaseModel)
+
+_gc_lock = threading.Lock()
+_gc_pauses = 0
+_gc_was_enabled = False
+
+
+@contextmanager
+def gc_paused() -> Iterator[None]:
+    """
+    Suspend the cyclic garbage collector while bulk-allocating acyclic objects (parsed rows).
+
+    Every few hundred allocations CPython otherwise re-scans all live rows, which roughly doubles
+    the cost of loading millions of records. Nested and concurrent pauses are reference counted.
+    """
+    global _gc_pauses, _gc_was_enabled
+    with _gc_lock:
+        if _gc_pauses == 0:
+            _gc_was_enabled = gc.isenabled()
+            gc.disable()
+        _gc_pauses += 1
+    try:
+        yield
+    finally:
+        with _gc_lock:
+            _gc_pauses -= 1
+            if _gc_pauses == 0 and _gc_was_enabled:
+                gc.enable()
+
+
+def _model_fields(value: Any) -> Dict[str, Any]:
+    # Nested models encode as their field dict, in declaration order like model_dump_json.
+    if isinstance(value, BaseModel):
+        return value.__dict__
+    raise TypeError(f"Cannot encode {type(value).__name__}")
+
+
+class ModelCodec(Generic[M]):
+    """
+    JSON codec for one artifact model.
+
+    Decoding always goes through the model's pydantic-core validator (Rust), so results are the
+    models `model_validate_json` returns; `strict` switches it to pydantic's strict mode. Building
+    model instances dominates load time and a Python-side struct decoder cannot beat it, so the
+    bulk path instead parses in batches with the garbage collector paused. Encoding uses msgspec
+    when installed (several times faster than `model_dump_json`); the text may spell floats
+    (`1e16` vs `1e+16`) or UTC (`Z` vs `+00:00`) differently, but decodes to identical models.
+
+    Examples
+    --------
+    >>> codec = get_codec(PredictionRecord)
+    >>> record = codec.decode('{"id": "e1", "prediction": {"probability": 0.6}}')
+    >>> codec.encode(record)
+    '{"id":"e1","prediction":{"probability":0.6,"rationale":null,"analysis":null},"metadata":null}'
+    """
+
+    def __init__(self, model: Type[M], strict: bool = False, backend: str = "auto"):
+        if backend not in CODEC_BACKENDS:
+            raise ValueError(f"Unknown codec backend '{backend}' (expected one of {', '.join(CODEC_BACKENDS)})")
+        if backend == "msgspec" and msgspec is None:
+            raise ValueError("Codec backend 'msgspec' requested but msgspec is not installed")
+        self.model = model
+        self.strict = strict
+        self._validate_json = model.__pydantic_validator__.validate_json
+        self._encoder = None
+        if backend != "pydantic" and msgspec is not None:
+            self._encoder = msgspec.json.Encoder(enc_hook=_model_fields)
+        self.backend = "msgspec" if self._encoder is not None else "pydantic"
+
+    def decode(self, line: Union[str, bytes]) -> M:
+        """Same result, or the same `ValidationError`, as `model_validate_json(line, strict=...)`."""
+        return self._validate_json(line, strict=self.strict or None)
+
+    def decode_lines(self, lines: Iterable[Union[str, bytes]], batch_size: int = DECODE_BATCH) -> Iterator[M]:
+        """Decode each non-blank line in order, a batch at a time with the GC paused."""
+        batch: List[Union[str, bytes]] = []
+        for line in lines:
+            if line.strip():
+                batch.append(line)
+                if len(batch) >= batch_size:
+                    yield from self._decode_batch(batch)
+                    batch = []
+        if batch:
+            yield from self._decode_batch(batch)
+
+    def _decode_batch(self, batch: List[Union[str, bytes]]) -> List[M]:
+        validate, strict = self._validate_json, self.strict or None
+        with gc_paused():
+            return [validate(line, strict=strict) for line in batch]
+
+    def encode(self, record: M) -> str:
+        if self._encoder is not None:
+            return self._encoder.encode(record).decode("utf-8")
+        return record.model_dump_json()
+
+    def encode_lines(self, records: Iterable[M]) -> Iterator[str]:
+        """Newline-terminated JSON rows, ready for `handle.writelines`."""
+        encode = self.encode
+        for record in records:
+            yield encode(record) + "\n"
+
+
+# Field tree of a projection: field name -> None (whole value) or a nested tree.
+FieldTree = Dict[str, Optional["FieldTree"]]
+_CONSTRAINTS = {
+    annotated_types.Ge: "ge",
+    annotated_types.Gt: "gt",
+    annotated_types.Le: "le",
+    annotated_types.Lt: "lt",
+    annotated_types.MinLen: "min_length",
+    annotated_types.MaxLen: "max_length",
+}
+
+
+def field_tree(fields: Sequence[str]) -> FieldTree:
+    """`["id", "prediction.probability"]` -> `{"id": None, "prediction": {"probability": None}}`."""
+    tree: FieldTree = {}
+    for path in fields:
+        node = tree
+        *parents, leaf = path.split(".")
+        for name in parents:
+            child = node.get(name, {})
+            if child is None:  # Already selected whole.
+                break
+            node = node.setdefault(name, child)
+        else:
+            node[leaf] = None
+    return tree
+
+
+def _unwrap(annotation: Any) -> Tuple[Any, Callable[[Any], Any]]:
+    """(model inside Optional[...] / list[...], function re-applying those wrappers)."""
+    origin = get_origin(annotation)
+    if origin in (Union, types.UnionType):
+        args = get_args(annotation)
+        inner = [arg for arg in args if arg is not type(None)]
+        if len(inner) == 1 and len(args) == 2:
+            model, wrap = _unwrap(inner[0])
+            return model, lambda value: Optional[wrap(value)]
+    if origin is list:
+        (item,) = get_args(annotation)
+        model, wrap = _unwrap(item)
+        return model, lambda value: List[wrap(value)]
+    return annotation, lambda value: value
+
+
+class _Projection:
+    """TypedDict schema for a field tree, plus a pass filling in defaults of absent fields."""
+
+    def __init__(self, model: Type[BaseModel], tree: Optional[FieldTree], path: str = ""):
+        hints = get_type_hints(model)
+        selected = tree if tree is not None else {name: None for name in model.model_fields}
+        fields: Dict[str, Any] = {}
+        self.msgspec_ok = True
+        self.defaults: List[Tuple[str, Callable[[], Any]]] = []
+        self.children: List[Tuple[str, "_Projection"]] = []
+        # Fields msgspec hands over as text, for pydantic's datetime parser (msgspec rounds
+        # sub-microsecond digits where pydantic truncates, and accepts different formats).
+        self.datetimes: List[str] = []
+        for name, subtree in selected.items():
+            info = model.model_fields.get(name)
+            if info is None:
+                raise ValueError(f"{model.__name__} has no field '{path}{name}'")
+            annotation = hints[name]
+            inner, wrap = _unwrap(annotation)
+            if isinstance(inner, type) and issubclass(inner, BaseModel):
+                child = _Projection(inner, subtree, f"{path}{name}.")
+                self.msgspec_ok = self.msgspec_ok and child.msgspec_ok
+                self.children.append((name, child))
+                annotation = wrap(child.schema)
+            elif subtree is not None:
+                raise ValueError(f"Field '{path}{name}' of {model.__name__} has no sub-fields")
+            elif inner is datetime:
+                self.msgspec_ok = self.msgspec_ok and annotation in (datetime, Optional[datetime])
+                self.datetimes.append(name)
+            if info.metadata:
+                self.msgspec_ok = self.msgspec_ok and all(type(item) in _CONSTRAINTS for item in info.metadata)
+                annotation = Annotated[(annotation, *info.metadata)]
+            if not info.is_required():
+                annotation = NotRequired[annotation]
+                if info.default_factory is not None:
+                    self.defaults.append((name, info.default_factory))
+                else:
+                    default = info.default
+                    self.defaults.append((name, lambda default=default: default))
+            fields[name] = annotation
+        self.schema = TypedDict(f"{model.__name__}Projection", fields)  # type: ignore[operator]
+        # Subtrees each pass has to visit; both passes are skipped entirely when empty.
+        self.default_children = [(name, child) for name, child in self.children if child.has_defaults]
+        self.datetime_children = [(name, child) for name, child in self.children if child.has_datetimes]
+        self.has_defaults = bool(self.defaults or self.default_children)
+        self.has_datetimes = bool(self.datetimes or self.datetime_children)
+
+    def parse_datetimes(self, row: Dict[str, Any], parse: Callable[[str], datetime]) -> None:
+        """Turn the text msgspec left in datetime fields into pydantic's datetimes (in place)."""
+        for name in self.datetimes:
+            value = row.get(name)
+            if isinstance(value, str):
+                row[name] = parse(value)
+        for name, child in self.datetime_children:
+            for item in _nested(row.get(name)):
+                child.parse_datetimes(item, parse)
+
+    def fill(self, row: Dict[str, Any]) -> None:
+        for name, default in self.defaults:
+            if name not in row:
+                row[name] = default()
+        for name, child in self.default_children:
+            for item in _nested(row.get(name)):
+                child.fill(item)
+
+
+def _nested(value: Any) -> List[Dict[str, Any]]:
+    if isinstance(value, dict):
+        return [value]
+    if isinstance(value, list):
+        return [item for item in value if isinstance(item, dict)]
+    return []
+
+
+_validate_datetime = TypeAdapter(datetime).validate_json
+
+
+def _msgspec_type(annotation: Any) -> Any:
+    """
+    msgspec equivalent of a projection annotation: pydantic constraint metadata
+    (`annotated_types.Ge`, ...) becomes `msgspec.Meta`, and datetimes are left as text.
+    """
+    if annotation is datetime:
+        return str
+    origin = get_origin(annotation)
+    if origin is Annotated:
+        base, *metadata = get_args(annotation)
+        constraints = {_CONSTRAINTS[type(item)]: getattr(item, _CONSTRAINTS[type(item)]) for item in metadata}
+        return Annotated[_msgspec_type(base), msgspec.Meta(**constraints)]
+    if origin is NotRequired:
+        return NotRequired[_msgspec_type(get_args(annotation)[0])]
+    if origin in (Union, types.UnionType):
+        return Union[tuple(_msgspec_type(arg) for arg in get_args(annotation))]
+    if origin is list:
+        return List[_msgspec_type(get_args(annotation)[0])]
+    if _is_typed_dict(annotation):
+        hints = get_type_hints(annotation, include_extras=True)
+        return TypedDict(annotation.__name__, {name: _msgspec_type(hint) for name, hint in hints.items()})
+    return annotation
+
+
+def _is_typed_dict(annotation: Any) -> bool:
+    return isinstance(annotation, type) and issubclass(annotation, dict) and hasattr(annotation, "__total__")
+
+
+class ProjectionCodec(Generic[M]):
+    """
+    Decode only the named fields of a model's JSON rows, into plain dicts shaped like the model.
+
+    Fields are dotted paths (`"prediction.probability"`); naming a nested model whole returns all
+    of its fields as dicts. Unnamed fields (e.g. `prediction.rationale` evidence lists) are skipped
+    by the parser without being validated or materialized, which is most of the cost of a full
+    row. Selected fields are validated exactly as the model would (types, `ge`/`le` bounds,
+    defaults filled in). msgspec is used when installed; rows it rejects are re-checked by
+    pydantic, so the result, or the `ValidationError`, always matches pydantic's.
+
+    Examples
+    --------
+    >>> codec = get_projection(PredictionRecord, ["id", "prediction.probability"])
+    >>> codec.decode('{"id": "e1", "prediction": {"probability": 0.6, "rationale": [...]}}')
+    {'id': 'e1', 'prediction': {'probability': 0.6}}
+    """
+
+    def __init__(
+        self,
+        model: Type[M],
+        fields: Sequence[str],
+        strict: bool = False,
+        backend: str = "auto",
+    ):
+        if backend not in CODEC_BACKENDS:
+            raise ValueError(f"Unknown codec backend '{backend}' (expected one of {', '.join(CODEC_BACKENDS)})")
+        if backend == "msgspec" and msgspec is None:
+            raise ValueError("Codec backend 'msgspec' requested but msgspec is not installed")
+        self.model = model
+        self.fields = tuple(fields)
+        self.strict = strict
+        self._projection = _Projection(model, field_tree(self.fields))
+        self._validate_json = TypeAdapter(self._projection.schema).validate_json
+        self._decoder = None
+        if backend != "pydantic" and msgspec is not None and self._projection.msgspec_ok:
+            self._decoder = msgspec.json.Decoder(_msgspec_type(self._projection.schema), strict=strict)
+        self.backend = "msgspec" if self._decoder is not None else "pydantic"
+        # Timestamps repeat heavily across rows (one per predictor run), so parses are memoized.
+        self._datetimes: Dict[str, datetime] = {}
+
+    def decode(self, line: Union[str, bytes]) -> Dict[str, Any]:
+        if self._decoder is not None:
+            try:
+                return self._finish([self._decoder.decode(line)])[0]
+            except (msgspec.ValidationError, msgspec.DecodeError, ValidationError):
+                pass
+        row = self._validate_json(line, strict=self.strict or None)
+        if self._projection.has_defaults:
+            self._projection.fill(row)
+        return row
+
+    def _parse_datetime(self, text: str) -> datetime:
+        value = self._datetimes.get(text)
+        if value is None:
+            if len(self._datetimes) >= DECODE_BATCH:
+                self._datetimes.clear()
+            value = _validate_datetime(msgspec.json.encode(text), strict=self.strict or None)
+            self._datetimes[text] = value
+        return value
+
+    def _finish(self, rows: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        projection = self._projection
+        if projection.has_datetimes:
+            parse = self._parse_datetime
+            for row in rows:
+                projection.parse_datetimes(row, parse)
+        if projection.has_defaults:
+            for row in rows:
+                projection.fill(row)
+        return rows
+
+    def decode_lines(self, lines: Iterable[Union[str, bytes]], batch_size: int = DECODE_BATCH) -> Iterator[Dict[str, Any]]:
+        batch: List[Union[str, bytes]] = []
+        for line in lines:
+            if line.strip():
+                batch.append(line)
+                if len(batch) >= batch_size:
+                    yield from self._decode_batch(batch)
+                    batch = []
+        if batch:
+            yield from self._decode_batch(batch)
+
+    def _decode_batch(self, batch: List[Union[str, bytes]]) -> List[Dict[str, Any]]:
+        with gc_paused():
+            if self._decoder is not None:
+                # One msgspec call per batch; any bad row sends the batch down the per-row path,
+                # which reports the same error pydantic would.
+                try:
+                    newline = "\n" if isinstance(batch[0], str) else b"\n"
+                    return self._finish(self._decoder.decode_lines(newline.join(batch)))
+                except (msgspec.ValidationError, msgspec.DecodeError, ValidationError, TypeError):
+                    pass
+            decode = self.decode
+            return [decode(line) for line in batch]
+
+
+_codecs: Dict[Tuple[type, bool, str], ModelCodec] = {}
+_codecs_lock = threading.Lock()
+
+
+def codec_settings() -> Tuple[str, bool]:
+    """(backend, strict) from AGENTBEATS_JSON_CODEC / AGENTBEATS_JSON_STRICT."""
+    backend = os.getenv("AGENTBEATS_JSON_CODEC", "auto").strip().lower() or "auto"
+    strict = os.getenv("AGENTBEATS_JSON_STRICT", "").strip().lower() in {"1", "true", "yes", "on"}
+    return backend, strict
+
+
+def get_codec(model: Type[M], strict: Optional[bool] = None, backend: Optional[str] = None) -> ModelCodec[M]:
+    """Process-wide codec for `model`; unspecified settings come from the environment."""
+    env_backend, env_strict = codec_settings()
+    key = (model, env_strict if strict is None else strict, backend or env_backend)
+    with _codecs_lock:
+        codec = _codecs.get(key)
+        if codec is None:
+            codec = ModelCodec(model, strict=key[1], backend=key[2])
+            _codecs[key] = codec
+        return codec
+
+
+_projections: Dict[Tuple[type, Tuple[str, ...], bool, str], ProjectionCodec] = {}
+
+
+def get_projection(
+    model: Type[M],
+    fields: Sequence[str],
+    strict: Optional[bool] = None,
+    backend: Optional[str] = None,
+) -> ProjectionCodec[M]:
+    """Process-wide `ProjectionCodec` for `model` restricted to `fields`."""
+    env_backend, env_strict = codec_settings()
+    key = (model, tuple(fields), env_strict if strict is None else strict, backend or env_backend)
+    with _codecs_lock:
+        codec = _projections.get(key)
+        if codec is None:
+            codec = ProjectionCodec(model, key[1], strict=key[2], backend=key[3])
+            _projections[key] = codec
+        return codec
@@ -0,0 +1,466 @@
+"""Parquet / Arrow IPC storage for events, predictions, resolutions and run records (optional pyarrow)."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Type
+
+import numpy as np
+from pydantic import BaseModel
+
+from .codec import get_codec, get_projection
+from .models import EventSpec, EvidenceItem, PredictionRecord, ResolutionRecord
+
+try:  # Optional: columnar artifacts (`pip install -e .[arrow]`).
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.ipc as pa_ipc
+    import pyarrow.parquet as pq
+except ImportError:  # pragma: no cover - depends on environment
+    pa = None
+    pc = None
+    pa_ipc = None
+    pq = None
+
+COLUMNAR_SUFFIXES = {".parquet": "parquet", ".arrow": "arrow", ".feather": "arrow"}
+WRITE_BATCH_ROWS = 65_536
+
+
+def columnar_format(path: Path) -> Optional[str]:
+    """"parquet" / "arrow" for columnar paths, None for anything else (JSONL)."""
+    return COLUMNAR_SUFFIXES.get(path.suffix.lower())
+
+
+def _require() -> None:
+    if pa is None:
+        raise RuntimeError("Parquet/Arrow artifacts need pyarrow (pip install -e .[arrow])")
+
+
+def _timestamp() -> Any:
+    # Stored as UTC instants; naive datetimes are taken to be UTC and flagged (see `_Layout`).
+    return pa.timestamp("us", tz="UTC")
+
+
+def _naive_column(column: str) -> str:
+    return f"{column}_naive"
+
+
+def _restore_naive(value: Any, naive: Any) -> Any:
+    """Drop the UTC zone again from a value that was written naive."""
+    return value.replace(tzinfo=None) if naive and value is not None else value
+
+
+class _Layout:
+    """
+    Flat column layout for one model: schema plus row <-> model converters.
+
+    `paths` maps dotted model fields to the column holding them (identity if not listed), and
+    `groups` names the column whose null marks an optional nested model as absent. Each of the
+    `timestamps` columns gets a boolean `<column>_naive` companion, so naive datetimes read back
+    naive (aware ones come back in UTC); files without it read every value as UTC-aware.
+    """
+
+    def __init__(
+        self,
+        fields: Callable[[], List[Any]],
+        to_row: Callable[[Any], Dict[str, Any]],
+        from_row: Callable[[Dict[str, Any]], Any],
+        paths: Optional[Dict[str, str]] = None,
+        groups: Optional[Dict[str, str]] = None,
+        timestamps: Sequence[str] = (),
+    ):
+        self._fields = fields
+        self._to_row = to_row
+        self._from_row = from_row
+        self.paths = paths or {}
+        self.groups = groups or {}
+        self.timestamps = tuple(timestamps)
+
+    @property
+    def schema(self) -> Any:
+        _require()
+        return pa.schema(self._fields() + [(_naive_column(column), pa.bool_()) for column in self.timestamps])
+
+    def to_row(self, record: Any) -> Dict[str, Any]:
+        row = self._to_row(record)
+        for column in self.timestamps:
+            value = row[column]
+            row[_naive_column(column)] = None if value is None else value.tzinfo is None
+        return row
+
+    def from_row(self, row: Dict[str, Any]) -> Any:
+        for column in self.timestamps:
+            row[column] = _restore_naive(row.get(column), row.get(_naive_column(column)))
+        return self._from_row(row)
+
+
+def _event_row(event: EventSpec) -> Dict[str, Any]:
+    source = event.source
+    return {
+        "id": event.id,
+        "question": event.question,
+        "domain": event.domain,
+        "resolution_date": event.resolution_date,
+        "source_type": source.type if source else None,
+        "source_market_id": source.market_id if source else None,
+        "source_url": source.url if source else None,
+        "source_resolution_date": source.resolution_date if source else None,
+        "ground_truth_source": event.ground_truth_source,
+        "forecast_horizon_days": event.forecast_horizon_days,
+        "tags": event.tags,
+        "baseline_probability": event.baseline_probability,
+    }
+
+
+def _event_from_row(row: Dict[str, Any]) -> EventSpec:
+    source = None
+    if row.get("source_type") is not None:
+        source = {
+            "type": row["source_type"],
+            "market_id": row.get("source_market_id"),
+            "url": row.get("source_url"),
+            "resolution_date": row.get("source_resolution_date"),
+        }
+    return EventSpec.model_validate(
+        {
+            "id": row["id"],
+            "question": row["question"],
+            "domain": row.get("domain"),
+            "resolution_date": row.get("resolution_date"),
+            "source": source,
+            "ground_truth_source": row.get("ground_truth_source"),
+            "forecast_horizon_days": row.get("forecast_horizon_days"),
+            "tags": row.get("tags") or [],
+            "baseline_probability": row.get("baseline_probability"),
+        }
+    )
+
+
+def _prediction_row(record: PredictionRecord) -> Dict[str, Any]:
+    metadata = record.metadata
+    rationale = record.prediction.rationale
+    return {
+        "id": record.id,
+        "probability": record.prediction.probability,
+        # Evidence lists are nested and rarely read; kept as JSON text.
+        "rationale": None if rationale is None else json.dumps([item.model_dump(mode="json") for item in rationale]),
+        "analysis": record.prediction.analysis,
+        "model": metadata.model if metadata else None,
+        "timestamp": metadata.timestamp if metadata else None,
+        "version": metadata.version if metadata else None,
+        "predictor_id": metadata.predictor_id if metadata else None,
+    }
+
+
+def _prediction_from_row(row: Dict[str, Any]) -> PredictionRecord:
+    rationale = row.get("rationale")
+    metadata = None
+    if row.get("model") is not None:
+        metadata = {
+            "model": row["model"],
+            "timestamp": row.get("timestamp"),
+            "version": row.get("version"),
+            "predictor_id": row.get("predictor_id"),
+        }
+    return PredictionRecord.model_validate(
+        {
+            "id": row["id"],
+            "prediction": {
+                "probability": row["probability"],
+                "rationale": None if rationale is None else [EvidenceItem.model_validate(item) for item in json.loads(rationale)],
+                "analysis": row.get("analysis"),
+            },
+            "metadata": metadata,
+        }
+    )
+
+
+def _resolution_row(record: ResolutionRecord) -> Dict[str, Any]:
+    return {
+        "id": record.id,
+        "outcome": record.outcome,
+        "verified_value": record.verified_value,
+        "verified_source": record.verified_source,
+        "resolved_at": record.resolved_at,
+    }
+
+
+LAYOUTS: Dict[type, _Layout] = {
+    EventSpec: _Layout(
+        lambda: [
+            ("id", pa.string()),
+            ("question", pa.string()),
+            ("domain", pa.string()),
+            ("resolution_date", _timestamp()),
+            ("source_type", pa.string()),
+            ("source_market_id", pa.string()),
+            ("source_url", pa.string()),
+            ("source_resolution_date", _timestamp()),
+            ("ground_truth_source", pa.string()),
+            ("forecast_horizon_days", pa.int64()),
+            ("tags", pa.list_(pa.string())),
+            ("baseline_probability", pa.float64()),
+        ],
+        _event_row,
+        _event_from_row,
+        paths={f"source.{name}": f"source_{name}" for name in ("type", "market_id", "url", "resolution_date")},
+        groups={"source": "source_type"},
+        timestamps=("resolution_date", "source_resolution_date"),
+    ),
+    PredictionRecord: _Layout(
+        lambda: [
+            ("id", pa.string()),
+            ("probability", pa.float64()),
+            ("rationale", pa.string()),
+            ("analysis", pa.string()),
+            ("model", pa.string()),
+            ("timestamp", _timestamp()),
+            ("version", pa.string()),
+            ("predictor_id", pa.string()),
+        ],
+        _prediction_row,
+        _prediction_from_row,
+        paths={
+            "prediction.probability": "probability",
+            "prediction.analysis": "analysis",
+            "metadata.model": "model",
+            "metadata.timestamp": "timestamp",
+            "metadata.version": "version",
+            "metadata.predictor_id": "predictor_id",
+        },
+        groups={"metadata": "model"},
+        timestamps=("timestamp",),
+    ),
+    ResolutionRecord: _Layout(
+        lambda: [
+            ("id", pa.string()),
+            ("outcome", pa.int8()),
+            ("verified_value", pa.float64()),
+            ("verified_source", pa.string()),
+            ("resolved_at", _timestamp()),
+        ],
+        _resolution_row,
+        ResolutionRecord.model_validate,
+        timestamps=("resolved_at",),
+    ),
+}
+
+
+def run_record_schema() -> Any:
+    """Schema of the evaluator's per-event run records."""
+    _require()
+    return pa.schema(
+        [
+            ("event_id", pa.string()),
+            ("probability", pa.float64()),
+            ("outcome", pa.int8()),
+            ("market_probability", pa.float64()),
+            ("model", pa.string()),
+            ("timestamp", pa.string()),
+        ]
+    )
+
+
+def _layout(model: Type[BaseModel]) -> _Layout:
+    layout = LAYOUTS.get(model)
+    if layout is None:
+        raise ValueError(f"No columnar layout for {model.__name__}")
+    return layout
+
+
+def write_rows(path: Path, rows: Iterable[Dict[str, Any]], schema: Any) -> Path:
+    """Stream dict rows into a Parquet (zstd) or Arrow IPC file, chosen by `path`'s suffix."""
+    _require()
+    fmt = columnar_format(path)
+    if fmt is None:
+        raise ValueError(f"Not a columnar path: {path}")
+    path.parent.mkdir(parents=True, exist_ok=True)
+    if fmt == "parquet":
+        writer = pq.ParquetWriter(path, schema, compression="zstd")
+    else:
+        writer = pa_ipc.new_file(path, schema)
+    write = writer.write_batch
+    try:
+        batch: List[Dict[str, Any]] = []
+        for row in rows:
+            batch.append(row)
+            if len(batch) >= WRITE_BATCH_ROWS:
+                write(pa.RecordBatch.from_pylist(batch, schema=schema))
+                batch = []
+        if batch:
+            write(pa.RecordBatch.from_pylist(batch, schema=schema))
+    finally:
+        writer.close()
+    return path
+
+
+def write_models(path: Path, records: Iterable[BaseModel], model: Type[BaseModel]) -> Path:
+    layout = _layout(model)
+    return write_rows(path, (layout.to_row(record) for record in records), layout.schema)
+
+
+def _file_columns(path: Path) -> List[str]:
+    _require()
+    if columnar_format(path) == "parquet":
+        return list(pq.ParquetFile(path).schema_arrow.names)
+    with pa.OSFile(str(path), "rb") as source:
+        return list(pa_ipc.open_file(source).schema.names)
+
+
+def _batches(path: Path, columns: Optional[Sequence[str]] = None) -> Iterator[Any]:
+    _require()
+    if columnar_format(path) == "parquet":
+        yield from pq.ParquetFile(path).iter_batches(batch_size=WRITE_BATCH_ROWS, columns=columns)
+        return
+    with pa.OSFile(str(path), "rb") as source:
+        reader = pa_ipc.open_file(source)
+        for index in range(reader.num_record_batches):
+            batch = reader.get_batch(index)
+            yield batch.select(list(columns)) if columns is not None else batch
+
+
+def _isoformat(values: Any, naive: Any = None) -> Any:
+    """Timestamps as `datetime.isoformat()` strings (`+00:00` unless flagged naive), computed in Arrow."""
+    # Casting the UTC wall time to string is far cheaper than a zone-aware strftime.
+    text = pc.replace_substring(values.cast(pa.timestamp("us")).cast(pa.string()), " ", "T", max_replacements=1)
+    # isoformat() leaves out a zero fraction.
+    whole = pc.ends_with(text, ".000000")
+    text = pc.if_else(whole, pc.utf8_slice_codeunits(text, 0, -7), text)
+    aware = pc.binary_join_element_wise(text, "+00:00", "")
+    if naive is None:
+        return aware
+    return pc.if_else(pc.fill_null(naive, False), text, aware)
+
+
+def _stored_columns(model: Type[BaseModel], fields: Sequence[str]) -> List[str]:
+    layout = _layout(model)
+    names = set(layout.schema.names)
+    columns = [layout.paths.get(field, field) for field in fields]
+    missing = [field for field, column in zip(fields, columns) if column not in names]
+    if missing:
+        raise ValueError(f"{model.__name__} fields not stored as columns: {', '.join(missing)}")
+    return columns
+
+
+def _field_arrays(data: Any, model: Type[BaseModel], fields: Sequence[str]) -> Dict[str, Any]:
+    layout = _layout(model)
+    names = set(data.schema.names)
+    arrays: Dict[str, Any] = {}
+    for field, column in zip(fields, _stored_columns(model, fields)):
+        values = data.column(column)
+        if column in layout.timestamps:
+            flag = _naive_column(column)
+            values = _isoformat(values, data.column(flag) if flag in names else None)
+        arrays[field] = values
+    return arrays
+
+
+def _with_flags(path: Path, model: Type[BaseModel], columns: List[str]) -> List[str]:
+    """`columns` plus the naive flags of any timestamp columns among them that `path` stores."""
+    stored = set(_file_columns(path))
+    flags = [_naive_column(column) for column in columns if column in _layout(model).timestamps]
+    return list(dict.fromkeys(columns + [flag for flag in flags if flag in stored]))
+
+
+def read_columns(path: Path, model: Type[BaseModel], fields: Sequence[str]) -> Dict[str, Any]:
+    """
+    `fields` (dotted model fields, all stored as columns) as whole Arrow arrays keyed by field.
+
+    Only those columns are read (Parquet skips the others on disk), and timestamps come back as
+    ISO-8601 strings, so callers can hand numbers to NumPy without building Python rows.
+    """
+    _require()
+    columns = _with_flags(path, model, _stored_columns(model, fields))
+    if columnar_format(path) == "parquet":
+        table = pq.read_table(path, columns=columns)
+    else:
+        with pa.OSFile(str(path), "rb") as source:
+            table = pa_ipc.open_file(source).read_all().select(columns)
+    return _field_arrays(table, model, fields)
+
+
+def iter_column_rows(path: Path, model: Type[BaseModel], fields: Sequence[str]) -> Iterator[tuple]:
+    """`fields` as one tuple per row (timestamps as ISO-8601 strings), read batch by batch."""
+    columns = _with_flags(path, model, _stored_columns(model, fields))
+    for batch in _batches(path, columns):
+        arrays = _field_arrays(batch, model, fields)
+        yield from zip(*(arrays[field].to_pylist() for field in fields))
+
+
+def last_index(keys: Any, ids: Any) -> Any:
+    """
+    For each of `keys`, the position of its last occurrence in `ids` (-1 if absent), as a NumPy
+    array: the vectorized `dict(zip(ids, ...))` lookup, where the last value per id wins.
+    """
+    _require()
+    ids = pa.array(ids, pa.string()) if isinstance(ids, list) else ids
+    if isinstance(ids, pa.ChunkedArray):
+        ids = ids.combine_chunks()
+    # index_in finds first occurrences, so look the keys up in the reversed ids.
+    found = pc.fill_null(pc.index_in(keys, value_set=ids[::-1]), -1).to_numpy()
+    return np.where(found >= 0, len(ids) - 1 - found, -1)
+
+
+def take(values: Any, indices: Any) -> List[Any]:
+    """`values[index]` for each of `indices` as a list, None where the index is -1."""
+    _require()
+    values = pa.array(values) if isinstance(values, list) else values
+    return values.take(pa.array(indices, mask=indices < 0)).to_pylist()
+
+
+def iter_models(path: Path, model: Type[BaseModel]) -> Iterator[BaseModel]:
+    from_row = _layout(model).from_row
+    for batch in _batches(path):
+        for row in batch.to_pylist():
+            yield from_row(row)
+
+
+def count_rows(path: Path) -> int:
+    _require()
+    if columnar_format(path) == "parquet":
+        return pq.ParquetFile(path).metadata.num_rows
+    with pa.OSFile(str(path), "rb") as source:
+        reader = pa_ipc.open_file(source)
+        return sum(reader.get_batch(index).num_rows for index in range(reader.num_record_batches))
+
+
+def iter_projected(path: Path, model: Type[BaseModel], fields: Sequence[str]) -> Iterator[Dict[str, Any]]:
+    """
+    Rows of `fields` only, as dicts shaped like `model` (same output as the JSONL projection).
+
+    Fields stored as columns are read column-projected; selections that are not (whole nested
+    models, prediction rationale) fall back to full rows projected through `ProjectionCodec`.
+    """
+    layout = _layout(model)
+    names = set(layout.schema.names)
+    columns = [layout.paths.get(field, field) for field in fields]
+    if not all(column in names for column in columns):
+        encode, project = get_codec(model).encode, get_projection(model, fields).decode
+        for record in iter_models(path, model):
+            yield project(encode(record))
+        return
+    groups = sorted({field.split(".")[0] for field in fields if field.split(".")[0] in layout.groups})
+    selected = _with_flags(path, model, list(dict.fromkeys(columns + [layout.groups[group] for group in groups])))
+    leaves = [
+        (
+            field.split("."),
+            selected.index(column),
+            selected.index(_naive_column(column)) if _naive_column(column) in selected else None,
+        )
+        for field, column in zip(fields, columns)
+    ]
+    presence = [(group, selected.index(layout.groups[group])) for group in groups]
+    # Batch by batch, so memory stays flat however large the file is.
+    for batch in _batches(path, selected):
+        for values in zip(*(batch.column(name).to_pylist() for name in selected)):
+            row: Dict[str, Any] = {}
+            for parts, index, naive in leaves:
+                node = row
+                for part in parts[:-1]:
+                    node = node.setdefault(part, {})
+                node[parts[-1]] = values[index] if naive is None else _restore_naive(values[index], values[naive])
+            for group, index in presence:
+                if values[index] is None:
+                    row[group] = None
+            yield row
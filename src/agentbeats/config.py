@@ -2,7 +2,7 @@
 
 import os
 from pathlib import Path
-from typing import List, Optional
+from typing import Dict, List, Literal, Optional
 
 from pydantic import BaseModel, Field
 
@@ -19,6 +19,19 @@ class EvaluatorConfig(BaseModel):
     data_paths: DataPaths = Field(default_factory=DataPaths)
     metrics: List[str] = Field(default_factory=lambda: ["accuracy", "brier"])
     run_log_dir: Path = Field(default=Path("data/generated/runs"))
+    # Per-event run records: "jsonl" (optionally "jsonl.gz" / "jsonl.zst"), or "parquet" / "arrow" (needs pyarrow).
+    records_format: Literal["jsonl", "jsonl.gz", "jsonl.zst", "parquet", "arrow"] = Field(default="jsonl")
+    # Streaming mode joins and scores predictions as they are read instead of loading them all.
+    streaming: bool = Field(default=False)
+    # Resolution/event maps above this spill to an on-disk sort-merge join (streaming mode).
+    memory_budget_mb: int = Field(default=512, ge=1)
+    spill_dir: Optional[Path] = Field(default=None)
+    # Per-event explanations kept in streaming mode (in-memory mode keeps one per event).
+    stream_explanations: int = Field(default=1000, ge=0)
+    # Score only resolutions new since a previous run and merge them into its persisted state.
+    incremental: bool = Field(default=False)
+    # Run directory to build on; by default the latest run over the same predictions/events.
+    base_run: Optional[Path] = Field(default=None)
 
 
 class IngestionConfig(BaseModel):
@@ -26,6 +39,8 @@ class IngestionConfig(BaseModel):
     default_output: Path = Field(default=Path("data/generated/events/latest.jsonl"))
     source: str = Field(default="polymarket")
     polymarket_limit: int = Field(default=10)
+    polymarket_page_size: int = Field(default=100, ge=1)
+    polymarket_concurrency: int = Field(default=1, ge=1)
     include_active: bool = Field(default=True)
     finance_keywords: List[str] = Field(default_factory=lambda: list(FINANCE_KEYWORDS.keys()))
 
@@ -39,3 +54,10 @@ class PredictorConfig(BaseModel):
     tool_log_dir: Path = Field(default=Path("data/generated/tool_logs"))
     alpha_vantage_api_key: Optional[str] = Field(default_factory=lambda: os.getenv("ALPHAVANTAGE_API_KEY"))
     alpha_vantage_cache_dir: Path = Field(default=Path("data/generated/tool_cache/alpha_vantage"))
+    # 1 keeps the serial path; >1 fans evidence module calls out over a thread pool.
+    max_concurrency: int = Field(default=1, ge=1)
+    # Warm tool caches for the whole batch before the per-event loop (see predictor/planner.py).
+    prefetch: bool = Field(default=False)
+    # Add Polymarket odds as evidence; markets for a batch are looked up in multi-id requests.
+    market_evidence: bool = Field(default=False)
+    prefetch_budgets: Dict[str, int] = Field(default_factory=dict)
@@ -2,20 +2,134 @@
 
 from __future__ import annotations
 
+import itertools
 import json
+
+import numpy as np
 from datetime import datetime, timezone
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict, Iterable, List, Optional, Type, TypeVar
-
-from pydantic import BaseModel
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set, Tuple
 
+from .. import columnar
+from ..artifacts import iter_records
 from ..config import EvaluatorConfig
+from ..jsonl import open_jsonl_writer
 from ..models import EventSpec, PredictionRecord, ResolutionRecord
-from .metrics import accuracy as metric_accuracy
-from .metrics import brier_score
+from .metrics import MetricArrays, MetricState
+from .streaming import Joined, join_predictions
+
+
+# (event_id, probability, model, ISO timestamp) and (baseline_probability, question): the only
+# prediction / event fields evaluation reads, loaded as field projections.
+PredictionRow = Tuple[str, float, Optional[str], Optional[str]]
+EventRow = Tuple[Optional[float], str]
+
+
+def _isoformat(value: Optional[datetime]) -> Optional[str]:
+    return value.isoformat() if value else None
+
+
+PREDICTION_FIELDS = ("id", "prediction.probability", "metadata.model", "metadata.timestamp")
+OUTCOME_FIELDS = ("id", "outcome")
+EVENT_FIELDS = ("id", "baseline_probability", "question")
+# Joined predictions folded into the metric state (and written out) at a time in streaming mode.
+STREAM_CHUNK_ROWS = 65_536
+# Written next to metrics.json: the run's mergeable MetricState, the event ids this run scored,
+# and the (projected) predictions still waiting for a resolution.
+STATE_FILE = "state.json"
+LEDGER_FILE = "ledger.jsonl"
+PENDING_FILE = "pending.jsonl"
+
+
+def iter_prediction_rows(path: Path) -> Iterator[PredictionRow]:
+    """Prediction fields used for scoring; nothing else (rationale, analysis) is decoded."""
+    if columnar.columnar_format(path):
+        yield from columnar.iter_column_rows(path, PredictionRecord, PREDICTION_FIELDS)
+        return
+    for row in iter_records(path, PredictionRecord, fields=PREDICTION_FIELDS):
+        metadata = row["metadata"]
+        yield (
+            row["id"],
+            row["prediction"]["probability"],
+            metadata["model"] if metadata else None,
+            _isoformat(metadata["timestamp"]) if metadata else None,
+        )
+
+
+def iter_outcomes(path: Path) -> Iterator[Tuple[str, int]]:
+    if columnar.columnar_format(path):
+        yield from columnar.iter_column_rows(path, ResolutionRecord, OUTCOME_FIELDS)
+        return
+    for row in iter_records(path, ResolutionRecord, fields=OUTCOME_FIELDS):
+        yield row["id"], row["outcome"]
+
+
+def iter_event_rows(path: Path) -> Iterator[Tuple[str, EventRow]]:
+    if columnar.columnar_format(path):
+        for event_id, baseline, question in columnar.iter_column_rows(path, EventSpec, EVENT_FIELDS):
+            yield event_id, (baseline, question)
+        return
+    for row in iter_records(path, EventSpec, fields=EVENT_FIELDS):
+        yield row["id"], (row["baseline_probability"], row["question"])
+
+
+def load_prediction_rows(path: Path) -> List[PredictionRow]:
+    return list(iter_prediction_rows(path))
+
+
+def load_outcomes(path: Path) -> Dict[str, int]:
+    return dict(iter_outcomes(path))
+
+
+def load_event_rows(path: Path) -> Dict[str, EventRow]:
+    return dict(iter_event_rows(path))
+
+
+def read_ledger(run_dir: Path) -> Set[str]:
+    """
+    Resolution ids scored by `run_dir` and the incremental runs it builds on.
+
+    Each run's ledger only lists the ids it scored itself (one JSON string per line); earlier ids
+    are in the ledgers along its `base_run` chain.
+    """
+    scored: Set[str] = set()
+    current: Optional[Path] = run_dir
+    while current is not None:
+        with (current / LEDGER_FILE).open(encoding="utf-8") as handle:
+            scored.update(json.loads(line) for line in handle if line.strip())
+        with (current / "inputs.json").open(encoding="utf-8") as handle:
+            base_run = json.load(handle).get("base_run")
+        current = Path(base_run) if base_run else None
+    return scored
+
+
+def iter_pending(path: Path) -> Iterator[Tuple[PredictionRow, Optional[EventRow]]]:
+    """A run's unresolved prediction rows with their event rows, as `_write_state` wrote them."""
+    with path.open(encoding="utf-8") as handle:
+        for line in handle:
+            if line.strip():
+                *row, event = json.loads(line)
+                yield tuple(row), tuple(event) if event is not None else None
+
+
+def _write_line(handle: Any, item: Any) -> None:
+    handle.write(json.dumps(item))
+    handle.write("\n")
+
+
+def _write_lines(path: Path, items: Iterable[Any]) -> None:
+    with path.open("w", encoding="utf-8", newline="\n") as handle:
+        for item in items:
+            _write_line(handle, item)
+
 
-T_Model = TypeVar("T_Model", bound=BaseModel)
+def _fingerprint(path: Optional[Path]) -> Optional[Dict[str, int]]:
+    """Size and mtime of an input file, so a later incremental run can tell whether it changed."""
+    if path is None or not path.exists():
+        return None
+    stat = path.stat()
+    return {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
 
 
 @dataclass
@@ -26,6 +140,20 @@ class Prediction:
     market_probability: Optional[float]
     model: Optional[str]
     prediction_timestamp: Optional[str]
+    question: Optional[str] = None
+
+
+def _prediction(row: PredictionRow, outcome: int, event: Optional[EventRow]) -> Prediction:
+    event_id, probability, model_name, timestamp = row
+    return Prediction(
+        event_id=event_id,
+        probability=float(probability),
+        outcome=int(outcome),
+        market_probability=event[0] if event else None,
+        model=model_name,
+        prediction_timestamp=timestamp,
+        question=event[1] if event else None,
+    )
 
 
 class BaselineEvaluator:
@@ -36,45 +164,15 @@ class BaselineEvaluator:
         self.run_log_dir = config.run_log_dir
         self.run_log_dir.mkdir(parents=True, exist_ok=True)
 
-    def _load_jsonl(self, path: Path, model: Type[T_Model]) -> Iterable[T_Model]:
-        with path.open("r", encoding="utf-8") as handle:
-            for line in handle:
-                line = line.strip()
-                if not line:
-                    continue
-                yield model.model_validate_json(line)
-
     def _merge(
         self,
-        predictions: Iterable[PredictionRecord],
+        predictions: Iterable[PredictionRow],
         resolutions: Dict[str, int],
-        events: Dict[str, EventSpec],
+        events: Dict[str, EventRow],
     ) -> List[Prediction]:
-        merged: List[Prediction] = []
-        for entry in predictions:
-            event_id = entry.id
-            if event_id not in resolutions:
-                continue
-            event = events.get(event_id)
-            market_probability = event.baseline_probability if event else None
-            metadata = entry.metadata
-            timestamp = None
-            model_name = None
-            if metadata:
-                model_name = metadata.model
-                if metadata.timestamp:
-                    timestamp = metadata.timestamp.isoformat()
-            merged.append(
-                Prediction(
-                    event_id=event_id,
-                    probability=float(entry.prediction.probability),
-                    outcome=int(resolutions[event_id]),
-                    market_probability=market_probability,
-                    model=model_name,
-                    prediction_timestamp=timestamp,
-                )
-            )
-        return merged
+        return [
+            _prediction(row, resolutions[row[0]], events.get(row[0])) for row in predictions if row[0] in resolutions
+        ]
 
     def _serialize_rows(self, rows: List[Prediction]) -> List[Dict[str, Any]]:
         return [
@@ -89,44 +187,126 @@ class BaselineEvaluator:
             for row in rows
         ]
 
-    def _persist_run(
+    def _new_run_dir(self) -> Path:
+        timestamp = datetime.now(timezone.utc).strftime("%Y%m%d-%H%M%S")
+        run_dir = self.run_log_dir / timestamp
+        # Runs within the same second get their own directory, so a base run's state is never overwritten.
+        suffix = 1
+        while run_dir.exists():
+            run_dir = self.run_log_dir / f"{timestamp}-{suffix}"
+            suffix += 1
+        run_dir.mkdir(parents=True)
+        return run_dir
+
+    def _new_state(self) -> MetricState:
+        # Accuracy and Brier are always reported; EvaluatorConfig.metrics adds the others.
+        return MetricState(["accuracy", "brier", *self.config.metrics])
+
+    def _report(self, state: MetricState) -> Dict[str, Any]:
+        metrics = state.result()
+        hits = metrics.pop("hits")
+        metrics["summary"] = self._summary(metrics["events"], hits, metrics["brier"])
+        return metrics
+
+    def _write_state(
         self,
+        run_dir: Path,
+        state: MetricState,
+        scored: Iterable[Prediction],
+        pending: Iterable[Tuple[PredictionRow, Optional[EventRow]]],
+    ) -> None:
+        """Persist what a later `incremental` run needs: metric state, scored ids and pending predictions."""
+        with (run_dir / STATE_FILE).open("w", encoding="utf-8") as handle:
+            json.dump(state.to_dict(), handle)
+        _write_lines(run_dir / LEDGER_FILE, (row.event_id for row in scored))
+        _write_lines(run_dir / PENDING_FILE, ([*row, event] for row, event in pending))
+
+    def _base_run(self, predictions_path: Path, events_path: Optional[Path]) -> Optional[Path]:
+        """
+        `EvaluatorConfig.base_run`, else the latest run with state over the same predictions/events.
+
+        The inputs must be unchanged since the base run (same paths, sizes and mtimes), since its
+        pending predictions stand in for the predictions file.
+        """
+        expected = {
+            "predictions_path": str(predictions_path),
+            "events_path": str(events_path) if events_path else None,
+            "fingerprints": {"predictions": _fingerprint(predictions_path), "events": _fingerprint(events_path)},
+        }
+
+        def same_inputs(run_dir: Path) -> bool:
+            with (run_dir / "inputs.json").open(encoding="utf-8") as handle:
+                inputs = json.load(handle)
+            return all(inputs.get(key) == value for key, value in expected.items())
+
+        if self.config.base_run is not None:
+            for name in (STATE_FILE, LEDGER_FILE, PENDING_FILE):
+                if not (self.config.base_run / name).exists():
+                    raise FileNotFoundError(self.config.base_run / name)
+            if not same_inputs(self.config.base_run):
+                raise ValueError(
+                    f"{self.config.base_run} was scored over other predictions/events (or they changed since); "
+                    "run without --incremental to rescore"
+                )
+            return self.config.base_run
+        candidates = [path for path in self.run_log_dir.iterdir() if (path / STATE_FILE).exists()]
+        for run_dir in sorted(candidates, key=lambda path: (path / STATE_FILE).stat().st_mtime, reverse=True):
+            if not ((run_dir / LEDGER_FILE).exists() and (run_dir / PENDING_FILE).exists()):
+                continue
+            try:
+                if same_inputs(run_dir):
+                    return run_dir
+            except (OSError, ValueError):
+                continue
+        return None
+
+    def _write_records(self, run_dir: Path, records: Iterable[Dict[str, Any]]) -> Path:
+        """Stream per-event records into `run_dir` in the configured format."""
+        records_path = run_dir / f"records.{self.config.records_format}"
+        if columnar.columnar_format(records_path):
+            columnar.write_rows(records_path, records, columnar.run_record_schema())
+        else:
+            with open_jsonl_writer(records_path) as handle:
+                for record in records:
+                    handle.write(json.dumps(record))
+                    handle.write("\n")
+        return records_path
+
+    def _write_run_files(
+        self,
+        run_dir: Path,
         predictions_path: Path,
         resolutions_path: Path,
         events_path: Optional[Path],
         metrics: Dict[str, Any],
-        rows: List[Prediction],
-    ) -> Path:
-        """Write metrics + per-event records for reproducibility/debugging."""
-        timestamp = datetime.now(timezone.utc).strftime("%Y%m%d-%H%M%S")
-        run_dir = self.run_log_dir / timestamp
-        run_dir.mkdir(parents=True, exist_ok=True)
+        records_path: Path,
+        **extra: Any,
+    ) -> None:
         with (run_dir / "metrics.json").open("w", encoding="utf-8") as handle:
             json.dump(metrics, handle, indent=2)
-        records_path = run_dir / "records.jsonl"
-        with records_path.open("w", encoding="utf-8") as handle:
-            for row in rows:
-                handle.write(
-                    json.dumps(
-                        {
-                            "event_id": row.event_id,
-                            "probability": row.probability,
-                            "outcome": row.outcome,
-                            "market_probability": row.market_probability,
-                            "model": row.model,
-                            "timestamp": row.prediction_timestamp,
-                        }
-                    )
-                )
-                handle.write("\n")
         metadata = {
             "predictions_path": str(predictions_path),
             "resolutions_path": str(resolutions_path),
             "events_path": str(events_path) if events_path else None,
             "records_path": str(records_path),
+            "fingerprints": {"predictions": _fingerprint(predictions_path), "events": _fingerprint(events_path)},
+            **extra,
         }
         with (run_dir / "inputs.json").open("w", encoding="utf-8") as handle:
             json.dump(metadata, handle, indent=2)
+
+    def _persist_run(
+        self,
+        predictions_path: Path,
+        resolutions_path: Path,
+        events_path: Optional[Path],
+        metrics: Dict[str, Any],
+        records: List[Dict[str, Any]],
+    ) -> Path:
+        """Write metrics + per-event records for reproducibility/debugging."""
+        run_dir = self._new_run_dir()
+        records_path = self._write_records(run_dir, records)
+        self._write_run_files(run_dir, predictions_path, resolutions_path, events_path, metrics, records_path)
         return run_dir
 
     def evaluate(
@@ -135,58 +315,243 @@ class BaselineEvaluator:
         resolutions_path: Path,
         events_path: Optional[Path] = None,
     ) -> Dict[str, Any]:
-        predictions = list(self._load_jsonl(predictions_path, PredictionRecord))
+        if self.config.incremental:
+            base_run = self._base_run(predictions_path, events_path)
+            if base_run is not None:
+                with (base_run / STATE_FILE).open(encoding="utf-8") as handle:
+                    state = MetricState.from_dict(json.load(handle))
+                fresh = self._new_state()
+                if state.metrics == fresh.metrics and state.bins == fresh.bins:
+                    return self._evaluate_incremental(predictions_path, resolutions_path, events_path, base_run, state)
+                # A base run scored with other metrics cannot be merged into. One picked automatically
+                # just means rescoring everything; one asked for explicitly is an error.
+                if self.config.base_run is not None:
+                    raise ValueError(
+                        f"{base_run} was scored with other metrics or calibration bins; "
+                        "run without --incremental to rescore"
+                    )
+        if self.config.streaming:
+            return self._evaluate_streaming(predictions_path, resolutions_path, events_path)
+        if columnar.columnar_format(predictions_path):
+            merged, arrays, pending = self._join_columns(predictions_path, resolutions_path, events_path)
+        else:
+            predictions = load_prediction_rows(predictions_path)
 
-        resolution_rows = {
-            row.id: row.outcome
-            for row in self._load_jsonl(resolutions_path, ResolutionRecord)
-        }
-        # ResolutionRecord = ground-truth outcome fetched from Polymarket/EDGAR after the event settles.
-        events_map: Dict[str, EventSpec] = {}
-        if events_path and events_path.exists():
-            events = list(self._load_jsonl(events_path, EventSpec))
-            events_map = {event.id: event for event in events}
+            resolution_rows = load_outcomes(resolutions_path)
+            # ResolutionRecord = ground-truth outcome fetched from Polymarket/EDGAR after the event settles.
+            events_map: Dict[str, EventRow] = {}
+            if events_path and events_path.exists():
+                events_map = load_event_rows(events_path)
 
-        merged = self._merge(predictions, resolution_rows, events_map)
+            merged = self._merge(predictions, resolution_rows, events_map)
+            arrays = MetricArrays.from_columns(
+                (row.probability for row in merged),
+                (row.outcome for row in merged),
+                (row.market_probability for row in merged),
+            )
+            pending = ((row, events_map.get(row[0])) for row in predictions if row[0] not in resolution_rows)
         serialized = self._serialize_rows(merged)
-        metrics: Dict[str, Any] = {
-            "events": len(serialized),
-            "accuracy": metric_accuracy(serialized),
-            "brier": brier_score(serialized),
-        }
-        metrics["summary"] = self._summary(serialized)
-        explanations = self._build_explanations(merged, events_map, resolution_rows)
+        state = self._new_state().update(arrays)
+        metrics = self._report(state)
+        explanations = self._build_explanations(merged, arrays)
         metrics["explanations"] = explanations
-        run_dir = self._persist_run(predictions_path, resolutions_path, events_path, metrics, merged)
+        run_dir = self._persist_run(predictions_path, resolutions_path, events_path, metrics, serialized)
+        self._write_state(run_dir, state, merged, pending)
         metrics["run_log_dir"] = str(run_dir)
         return metrics
 
-    def _build_explanations(
+    def _join_columns(
         self,
-        rows: List[Prediction],
-        events_map: Dict[str, EventSpec],
-        resolutions: Dict[str, int],
-    ) -> List[Dict[str, Any]]:
+        predictions_path: Path,
+        resolutions_path: Path,
+        events_path: Optional[Path],
+    ) -> Tuple[List[Prediction], MetricArrays, Iterable[Tuple[PredictionRow, Optional[EventRow]]]]:
+        """
+        `_merge` for Parquet/Arrow predictions, vectorized: the scoring columns are read as Arrow
+        arrays and joined by id lookups, and the metric arrays are built from them as NumPy arrays.
+
+        Resolutions and events may be in any format; as with `_merge`, the last row per id wins and
+        predictions keep their file order. Also returns the unresolved predictions (see `_write_state`).
+        """
+        predictions = columnar.read_columns(predictions_path, PredictionRecord, PREDICTION_FIELDS)
+        if columnar.columnar_format(resolutions_path):
+            resolutions = columnar.read_columns(resolutions_path, ResolutionRecord, OUTCOME_FIELDS)
+            resolution_ids, outcomes = resolutions["id"], resolutions["outcome"]
+        else:
+            outcome_map = load_outcomes(resolutions_path)
+            resolution_ids, outcomes = list(outcome_map), list(outcome_map.values())
+        event_ids: Any = []
+        baselines: Any = []
+        questions: Any = []
+        if events_path and events_path.exists():
+            if columnar.columnar_format(events_path):
+                events = columnar.read_columns(events_path, EventSpec, EVENT_FIELDS)
+                event_ids, baselines, questions = events["id"], events["baseline_probability"], events["question"]
+            else:
+                event_map = load_event_rows(events_path)
+                event_ids = list(event_map)
+                baselines = [baseline for baseline, _ in event_map.values()]
+                questions = [question for _, question in event_map.values()]
+        outcome_at = columnar.last_index(predictions["id"], resolution_ids)
+        event_at = columnar.last_index(predictions["id"], event_ids)
+
+        def joined(selected: np.ndarray) -> Tuple[List[PredictionRow], List[Optional[EventRow]]]:
+            rows = list(zip(*(columnar.take(predictions[field], selected) for field in PREDICTION_FIELDS)))
+            at = event_at[selected]
+            event_rows = zip(columnar.take(baselines, at), columnar.take(questions, at))
+            return rows, [None if index < 0 else event for index, event in zip(at.tolist(), event_rows)]
+
+        matched = np.flatnonzero(outcome_at >= 0)
+        rows, event_rows = joined(matched)
+        matched_outcomes = columnar.take(outcomes, outcome_at[matched])
+        merged = [_prediction(*item) for item in zip(rows, matched_outcomes, event_rows)]
+        arrays = MetricArrays.from_columns(
+            predictions["prediction.probability"].to_numpy()[matched],
+            np.asarray(matched_outcomes, dtype=np.float64),
+            np.array([event[0] if event else None for event in event_rows], dtype=np.float64),
+        )
+        unmatched_rows, unmatched_events = joined(np.flatnonzero(outcome_at < 0))
+        return merged, arrays, zip(unmatched_rows, unmatched_events)
+
+    def _evaluate_incremental(
+        self,
+        predictions_path: Path,
+        resolutions_path: Path,
+        events_path: Optional[Path],
+        base_run: Path,
+        state: MetricState,
+    ) -> Dict[str, Any]:
+        """
+        Fold the resolutions of `base_run`'s pending predictions into its persisted metric state.
+
+        The predictions and events files are not read: `base_run` kept the projected rows of the
+        predictions that had no resolution yet, and only those are joined against the resolutions.
+        The cost is one id/outcome scan of the resolutions file plus the pending rows, independent
+        of how many predictions were already scored. The run's records, explanations and ledger cover just the newly scored events, while its
+        metrics cover everything scored so far. A changed outcome for an already-scored event is
+        not picked up and needs a full (non-incremental) run.
+        """
+        pending = list(iter_pending(base_run / PENDING_FILE))
+        pending_ids = {row[0] for row, _ in pending}
+        new_outcomes = {
+            event_id: outcome for event_id, outcome in iter_outcomes(resolutions_path) if event_id in pending_ids
+        }
+        merged = [_prediction(row, new_outcomes[row[0]], event) for row, event in pending if row[0] in new_outcomes]
+        arrays = MetricArrays.from_columns(
+            (row.probability for row in merged),
+            (row.outcome for row in merged),
+            (row.market_probability for row in merged),
+        )
+        state.merge(MetricState(state.metrics, bins=state.bins).update(arrays))
+        metrics = self._report(state)
+        metrics["explanations"] = self._build_explanations(merged, arrays)
+        run_dir = self._new_run_dir()
+        records_path = self._write_records(run_dir, self._serialize_rows(merged))
+        self._write_run_files(
+            run_dir,
+            predictions_path,
+            resolutions_path,
+            events_path,
+            metrics,
+            records_path,
+            base_run=str(base_run),
+            new_resolutions=len(new_outcomes),
+        )
+        self._write_state(
+            run_dir, state, merged, ((row, event) for row, event in pending if row[0] not in new_outcomes)
+        )
+        metrics["run_log_dir"] = str(run_dir)
+        return metrics
+
+    def _evaluate_streaming(
+        self,
+        predictions_path: Path,
+        resolutions_path: Path,
+        events_path: Optional[Path],
+    ) -> Dict[str, Any]:
+        """
+        Same metrics as `evaluate` in bounded memory: predictions are joined as they are read,
+        folded into a `MetricState` chunk by chunk and written out as they go.
+
+        Resolutions and event baselines are hash-joined while they fit
+        `EvaluatorConfig.memory_budget_mb`; beyond that all inputs are sorted on disk and
+        merge-joined, and records come out in event-id order rather than prediction-file order.
+        Only the first `EvaluatorConfig.stream_explanations` explanations are kept.
+        """
+        has_events = bool(events_path and events_path.exists())
+        join = {"strategy": "hash"}
+
+        run_dir = self._new_run_dir()
+        # The ledger and pending predictions are written as the join goes, like the records.
+        ledger = (run_dir / LEDGER_FILE).open("w", encoding="utf-8", newline="\n")
+        pending = (run_dir / PENDING_FILE).open("w", encoding="utf-8", newline="\n")
+
+        def on_spill() -> None:
+            join["strategy"] = "sort-merge"
+
+        def on_unmatched(row: tuple, event: Optional[EventRow]) -> None:
+            _write_line(pending, [*row, event])
+
+        joined: Iterator[Joined] = join_predictions(
+            lambda: iter_prediction_rows(predictions_path),
+            lambda: iter_outcomes(resolutions_path),
+            lambda: iter_event_rows(events_path) if has_events else iter(()),
+            budget_bytes=self.config.memory_budget_mb * 2**20,
+            spill_dir=self.config.spill_dir,
+            on_spill=on_spill,
+            unmatched=on_unmatched,
+        )
+        state = self._new_state()
+        explanations: List[Dict[str, Any]] = []
+
+        def records() -> Iterator[Dict[str, Any]]:
+            while True:
+                rows = [_prediction(*item) for item in itertools.islice(joined, STREAM_CHUNK_ROWS)]
+                if not rows:
+                    return
+                arrays = MetricArrays.from_columns(
+                    (row.probability for row in rows),
+                    (row.outcome for row in rows),
+                    (row.market_probability for row in rows),
+                )
+                state.update(arrays)
+                room = self.config.stream_explanations - len(explanations)
+                if room > 0:
+                    explanations.extend(self._build_explanations(rows[:room], arrays))
+                for row in rows:
+                    _write_line(ledger, row.event_id)
+                yield from self._serialize_rows(rows)
+
+        with ledger, pending:
+            records_path = self._write_records(run_dir, records())
+        metrics = self._report(state)
+        metrics["explanations"] = explanations
+        self._write_run_files(
+            run_dir, predictions_path, resolutions_path, events_path, metrics, records_path, join=join["strategy"]
+        )
+        with (run_dir / STATE_FILE).open("w", encoding="utf-8") as handle:
+            json.dump(state.to_dict(), handle)
+        metrics["run_log_dir"] = str(run_dir)
+        return metrics
+
+    def _build_explanations(self, rows: List[Prediction], arrays: MetricArrays) -> List[Dict[str, Any]]:
         details: List[Dict[str, Any]] = []
-        for row in rows:
-            event = events_map.get(row.event_id)
+        hits = arrays.hits.astype(int).tolist()
+        components = arrays.squared_errors.tolist()
+        for row, hit, component in zip(rows, hits, components):
             details.append(
                 {
                     "event_id": row.event_id,
-                    "question": event.question if event else None,
+                    "question": row.question,
                     "predicted_prob": row.probability,
                     "outcome": row.outcome,
-                    "accuracy_hit": int(round(row.probability) == row.outcome),
-                    "brier_component": (row.probability - row.outcome) ** 2,
+                    "accuracy_hit": hit,
+                    "brier_component": component,
                 }
             )
         return details
 
-    def _summary(self, rows: List[Dict[str, Any]]) -> str:
-        total = len(rows)
-        hits = sum(1 for row in rows if round(row["probability"]) == row["outcome"])
-        brier_terms = [(row["probability"] - row["outcome"]) ** 2 for row in rows]
-        avg_brier = sum(brier_terms) / total if total else 0.0
+    def _summary(self, total: int, hits: int, avg_brier: float) -> str:
         acc_pct = (hits / total * 100) if total else 0.0
         return (
             f"Evaluated {total} events: accuracy = {hits}/{total} ({acc_pct:.1f}%). "
@@ -2,27 +2,300 @@
 
 from __future__ import annotations
 
-import json
 import math
-from statistics import mean, pstdev
-from typing import Any, Dict, List, Optional
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Optional, Sequence
 
-from ..models import EventSpec
+import numpy as np
+
+# Probabilities are clipped to [EPS, 1 - EPS] before taking logs.
+EPS = 1e-6
+METRICS = ("accuracy", "brier", "els", "kelly", "calibration")
+DEFAULT_BINS = 10
+
+
+@dataclass
+class MetricArrays:
+    """
+    Column arrays every metric is computed from: probability, outcome, and market probability
+    (NaN where an event has no baseline).
+
+    Examples
+    --------
+    >>> arrays = MetricArrays.from_rows([{"probability": 0.7, "outcome": 1, "market_probability": 0.5}])
+    >>> compute_metrics(arrays, ["accuracy", "brier", "els"])
+    {'events': 1, 'hits': 1, 'accuracy': 1.0, 'brier': 0.09..., 'els': 0.33..., 'information_ratio': 0.0}
+    """
+
+    probability: np.ndarray
+    outcome: np.ndarray
+    market_probability: np.ndarray
+
+    @classmethod
+    def from_columns(
+        cls,
+        probability: Iterable[float],
+        outcome: Iterable[int],
+        market_probability: Optional[Iterable[Optional[float]]] = None,
+    ) -> "MetricArrays":
+        probabilities = _float_array(probability)
+        outcomes = _float_array(outcome)
+        if market_probability is None:
+            markets = np.full(len(probabilities), np.nan)
+        elif isinstance(market_probability, np.ndarray):
+            markets = _float_array(market_probability)
+        else:
+            markets = np.fromiter(
+                (np.nan if value is None else value for value in market_probability), dtype=np.float64
+            )
+        return cls(probabilities, outcomes, markets)
+
+    @classmethod
+    def from_rows(cls, rows: Sequence[Dict[str, Any]]) -> "MetricArrays":
+        """From the evaluator's serialized rows (`probability`, `outcome`, `market_probability`)."""
+        return cls.from_columns(
+            [row["probability"] for row in rows],
+            [row["outcome"] for row in rows],
+            [row.get("market_probability") for row in rows],
+        )
+
+    def __len__(self) -> int:
+        return len(self.probability)
+
+    @property
+    def hits(self) -> np.ndarray:
+        """True where the rounded probability matches the outcome (round-half-even, like `round`)."""
+        return np.rint(self.probability) == self.outcome
+
+    @property
+    def squared_errors(self) -> np.ndarray:
+        return (self.probability - self.outcome) ** 2
+
+
+def _float_array(values: Iterable[float]) -> np.ndarray:
+    if isinstance(values, np.ndarray):
+        return values.astype(np.float64, copy=False)
+    return np.fromiter(values, dtype=np.float64)
+
+
+class Moments:
+    """Count, mean and sum of squared deviations of a series, mergeable chunk by chunk (Chan et al.)."""
+
+    __slots__ = ("count", "mean", "m2", "minimum", "maximum")
+
+    def __init__(
+        self,
+        count: int = 0,
+        mean: float = 0.0,
+        m2: float = 0.0,
+        minimum: float = math.inf,
+        maximum: float = -math.inf,
+    ):
+        self.count = count
+        self.mean = mean
+        self.m2 = m2
+        self.minimum = minimum
+        self.maximum = maximum
+
+    @classmethod
+    def of(cls, values: np.ndarray) -> "Moments":
+        if not len(values):
+            return cls()
+        mean = float(values.mean())
+        return cls(len(values), mean, float(((values - mean) ** 2).sum()), float(values.min()), float(values.max()))
+
+    def merge(self, other: "Moments") -> "Moments":
+        if not other.count:
+            return self
+        if not self.count:
+            self.count, self.mean, self.m2 = other.count, other.mean, other.m2
+            self.minimum, self.maximum = other.minimum, other.maximum
+            return self
+        count = self.count + other.count
+        delta = other.mean - self.mean
+        self.mean += delta * other.count / count
+        self.m2 += other.m2 + delta * delta * self.count * other.count / count
+        self.count = count
+        self.minimum = min(self.minimum, other.minimum)
+        self.maximum = max(self.maximum, other.maximum)
+        return self
+
+    def to_dict(self) -> Dict[str, Any]:
+        # No values means no bounds; stored as null since JSON has no infinity.
+        empty = not self.count
+        return {
+            "count": self.count,
+            "mean": self.mean,
+            "m2": self.m2,
+            "minimum": None if empty else self.minimum,
+            "maximum": None if empty else self.maximum,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "Moments":
+        return cls(
+            int(data["count"]),
+            float(data["mean"]),
+            float(data["m2"]),
+            math.inf if data["minimum"] is None else float(data["minimum"]),
+            -math.inf if data["maximum"] is None else float(data["maximum"]),
+        )
+
+    def mean_ratio(self) -> tuple[float, float]:
+        """(mean, mean / population std), with the ratio 0 when the spread is 0."""
+        if not self.count:
+            return 0.0, 0.0
+        # Identical values have exactly zero spread; the running m2 can leave rounding noise there.
+        std = math.sqrt(self.m2 / self.count) if self.count > 1 and self.maximum > self.minimum else 0.0
+        return self.mean, (self.mean / std if std else 0.0)
+
+
+def _selected(metrics: Iterable[str]) -> List[str]:
+    selected = list(dict.fromkeys(metrics))
+    unknown = [name for name in selected if name not in METRICS]
+    if unknown:
+        raise ValueError(f"Unknown metric(s): {', '.join(unknown)} (expected {', '.join(METRICS)})")
+    return selected
+
+
+class MetricState:
+    """
+    Sufficient statistics for the metrics: counts, sums, running moments and calibration bins.
+
+    `update` folds in a chunk of `MetricArrays`, `merge` combines states built over disjoint rows
+    (chunks, shards, earlier runs), and `result` turns them into metric values; a state updated
+    with all rows at once gives exactly `compute_metrics`. Only the statistics of the selected
+    `metrics` are kept (accuracy and Brier are always cheap to carry). `to_dict` / `from_dict`
+    round-trip the state through JSON so later runs can merge into it.
+
+    Examples
+    --------
+    >>> state = MetricState(["accuracy", "brier", "kelly"])
+    >>> for chunk in chunks:
+    ...     state.update(chunk)
+    >>> state.result()["kelly_sharpe"]
+    """
+
+    def __init__(self, metrics: Iterable[str] = ("accuracy", "brier"), bins: int = DEFAULT_BINS):
+        self.metrics = _selected(metrics)
+        self.bins = bins
+        self.events = 0
+        self.hits = 0
+        self.squared_error = 0.0
+        self.els = Moments()
+        self.kelly = Moments()
+        self.calibration_counts = np.zeros(bins, dtype=np.int64)
+        self.calibration_hits = np.zeros(bins, dtype=np.float64)
+
+    def update(self, arrays: MetricArrays) -> "MetricState":
+        p, y, m = arrays.probability, arrays.outcome, arrays.market_probability
+        self.events += len(arrays)
+        self.hits += int(arrays.hits.sum())
+        self.squared_error += float(arrays.squared_errors.sum())
+        has_market = ~np.isnan(m)
+        if "els" in self.metrics:
+            usable = has_market & (m > 0) & (m < 1)
+            prob = np.clip(p, EPS, 1 - EPS)
+            market = np.clip(m, EPS, 1 - EPS)
+            won = y == 1
+            # log of the probability given to what happened: p or 1 - p (likewise for the market).
+            scores = np.log(np.where(won, prob, 1 - prob)) - np.log(np.where(won, market, 1 - market))
+            self.els.merge(Moments.of(scores[usable]))
+        if "kelly" in self.metrics:
+            self.kelly.merge(Moments.of((np.clip(p - m, -1.0, 1.0) * (y - m))[has_market]))
+        if "calibration" in self.metrics:
+            index = np.minimum((p * self.bins).astype(np.int64), self.bins - 1)
+            self.calibration_counts += np.bincount(index, minlength=self.bins)
+            self.calibration_hits += np.bincount(index, weights=y, minlength=self.bins)
+        return self
+
+    def merge(self, other: "MetricState") -> "MetricState":
+        if other.metrics != self.metrics or other.bins != self.bins:
+            raise ValueError("Cannot merge metric states with different metrics or bins")
+        self.events += other.events
+        self.hits += other.hits
+        self.squared_error += other.squared_error
+        self.els.merge(other.els)
+        self.kelly.merge(other.kelly)
+        self.calibration_counts += other.calibration_counts
+        self.calibration_hits += other.calibration_hits
+        return self
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "metrics": self.metrics,
+            "bins": self.bins,
+            "events": self.events,
+            "hits": self.hits,
+            "squared_error": self.squared_error,
+            "els": self.els.to_dict(),
+            "kelly": self.kelly.to_dict(),
+            "calibration_counts": self.calibration_counts.tolist(),
+            "calibration_hits": self.calibration_hits.tolist(),
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "MetricState":
+        state = cls(data["metrics"], bins=int(data["bins"]))
+        state.events = int(data["events"])
+        state.hits = int(data["hits"])
+        state.squared_error = float(data["squared_error"])
+        state.els = Moments.from_dict(data["els"])
+        state.kelly = Moments.from_dict(data["kelly"])
+        state.calibration_counts = np.asarray(data["calibration_counts"], dtype=np.int64)
+        state.calibration_hits = np.asarray(data["calibration_hits"], dtype=np.float64)
+        if len(state.calibration_counts) != state.bins or len(state.calibration_hits) != state.bins:
+            raise ValueError("Metric state calibration bins do not match its bin count")
+        return state
+
+    def result(self) -> Dict[str, Any]:
+        """
+        Metric values: always `events` and `hits`; "els" adds `els` / `information_ratio`,
+        "kelly" adds `kelly_pnl` / `kelly_sharpe`, and "calibration" a `calibration` bin list.
+        """
+        total = self.events
+        results: Dict[str, Any] = {"events": total, "hits": self.hits}
+        if "accuracy" in self.metrics:
+            results["accuracy"] = self.hits / total if total else 0.0
+        if "brier" in self.metrics:
+            results["brier"] = self.squared_error / total if total else 0.0
+        if "els" in self.metrics:
+            results["els"], results["information_ratio"] = self.els.mean_ratio()
+        if "kelly" in self.metrics:
+            results["kelly_pnl"], results["kelly_sharpe"] = self.kelly.mean_ratio()
+        if "calibration" in self.metrics:
+            bins = self.bins
+            results["calibration"] = [
+                {
+                    "bin_start": i / bins,
+                    "bin_end": (i + 1) / bins,
+                    "count": int(self.calibration_counts[i]),
+                    "hit_rate": float(self.calibration_hits[i] / self.calibration_counts[i])
+                    if self.calibration_counts[i]
+                    else 0.0,
+                }
+                for i in range(bins)
+            ]
+        return results
+
+
+def compute_metrics(
+    arrays: MetricArrays,
+    metrics: Iterable[str] = ("accuracy", "brier"),
+    bins: int = DEFAULT_BINS,
+) -> Dict[str, Any]:
+    """Every requested metric from one set of arrays in a single pass (see `MetricState.result`)."""
+    return MetricState(metrics, bins=bins).update(arrays).result()
 
 
 def accuracy(rows: List[Dict[str, Any]]) -> float:
     """Fraction of predictions whose rounded probability matches the outcome: mean(1 if round(p)==y else 0)."""
-    if not rows:
-        return 0.0
-    correct = sum(1 for row in rows if round(row["probability"]) == row["outcome"])
-    return correct / len(rows)
+    return compute_metrics(MetricArrays.from_rows(rows), ["accuracy"])["accuracy"]
 
 
 def brier_score(rows: List[Dict[str, Any]]) -> float:
     """Mean squared error between probabilities and outcomes: mean((p - y)^2)."""
-    if not rows:
-        return 0.0
-    return sum((row["probability"] - row["outcome"]) ** 2 for row in rows) / len(rows)
+    return compute_metrics(MetricArrays.from_rows(rows), ["brier"])["brier"]
 
 
 def els_information_ratio(rows: List[Dict[str, Any]]) -> Dict[str, float]:
@@ -32,27 +305,10 @@ def els_information_ratio(rows: List[Dict[str, Any]]) -> Dict[str, float]:
       y=1 → log(p) - log(m)
       y=0 → log(1-p) - log(1-m)
     Report mean(els_i) and information_ratio = mean(els_i)/std(els_i).
+    Events without a market probability strictly inside (0, 1) are skipped.
     """
-    values: List[float] = []
-    for row in rows:
-        market_prob = row.get("market_probability")
-        if market_prob is None:
-            continue
-        if market_prob <= 0 or market_prob >= 1:
-            continue
-        prob = min(max(row["probability"], 1e-6), 1 - 1e-6)
-        market_prob = min(max(market_prob, 1e-6), 1 - 1e-6)
-        if row["outcome"] == 1:
-            score = math.log(prob) - math.log(market_prob)
-        else:
-            score = math.log(1 - prob) - math.log(1 - market_prob)
-        values.append(score)
-    if not values:
-        return {"els": 0.0, "information_ratio": 0.0}
-    mean_val = mean(values)
-    std_val = pstdev(values) if len(values) > 1 else 0.0
-    info_ratio = mean_val / std_val if std_val else 0.0
-    return {"els": mean_val, "information_ratio": info_ratio}
+    results = compute_metrics(MetricArrays.from_rows(rows), ["els"])
+    return {"els": results["els"], "information_ratio": results["information_ratio"]}
 
 
 def kelly_metrics(rows: List[Dict[str, Any]]) -> Dict[str, float]:
@@ -61,38 +317,10 @@ def kelly_metrics(rows: List[Dict[str, Any]]) -> Dict[str, float]:
     stake = clamp(p - m, [-1, 1]); pnl_i = stake * (y - m)
     Report Kelly PnL = mean(pnl_i) and Kelly Sharpe = mean/ std(pnl_i).
     """
-    pnl_values: List[float] = []
-    for row in rows:
-        market_prob = row.get("market_probability")
-        if market_prob is None:
-            continue
-        stake = max(min(row["probability"] - market_prob, 1.0), -1.0)
-        pnl = stake * (row["outcome"] - market_prob)
-        pnl_values.append(pnl)
-    if not pnl_values:
-        return {"kelly_pnl": 0.0, "kelly_sharpe": 0.0}
-    avg = mean(pnl_values)
-    std_val = pstdev(pnl_values) if len(pnl_values) > 1 else 0.0
-    sharpe = avg / std_val if std_val else 0.0
-    return {"kelly_pnl": avg, "kelly_sharpe": sharpe}
-
-
-def calibration_bins(rows: List[Dict[str, Any]], bins: int = 10) -> List[Dict[str, float]]:
+    results = compute_metrics(MetricArrays.from_rows(rows), ["kelly"])
+    return {"kelly_pnl": results["kelly_pnl"], "kelly_sharpe": results["kelly_sharpe"]}
+
+
+def calibration_bins(rows: List[Dict[str, Any]], bins: int = DEFAULT_BINS) -> List[Dict[str, float]]:
     """Reliability diagram bins mapping probability to empirical accuracy."""
-    bucket_totals = [0] * bins
-    bucket_hits = [0] * bins
-    for row in rows:
-        idx = min(int(row["probability"] * bins), bins - 1)
-        bucket_totals[idx] += 1
-        bucket_hits[idx] += row["outcome"]
-    calibration = []
-    for i in range(bins):
-        total = bucket_totals[i]
-        hit_rate = bucket_hits[i] / total if total else 0.0
-        calibration.append({
-            "bin_start": i / bins,
-            "bin_end": (i + 1) / bins,
-            "count": total,
-            "hit_rate": hit_rate,
-        })
-    return calibration
+    return compute_metrics(MetricArrays.from_rows(rows), ["calibration"], bins=bins)["calibration"]
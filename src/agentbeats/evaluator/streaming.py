@@ -0,0 +1,192 @@
+"""Bounded-memory joins of predictions with resolutions/events for streaming evaluation."""
+
+from __future__ import annotations
+
+import heapq
+import itertools
+import pickle
+import sys
+import tempfile
+from operator import itemgetter
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+# Rough per-entry cost of a dict slot plus the key/value objects' headers.
+ENTRY_OVERHEAD = 120
+# Spill runs are written and read back in pickled blocks of this many rows.
+SPILL_BLOCK_ROWS = 4096
+# Most runs merged at once (one open file and one block in memory each).
+MERGE_FAN_IN = 64
+
+Keyed = Tuple[str, Any]
+# (prediction row, outcome, event value or None) for each prediction with a resolution.
+Joined = Tuple[tuple, Any, Any]
+RowSource = Callable[[], Iterable[Keyed]]
+# Called with (prediction row, event value or None) for each prediction without a resolution.
+Unmatched = Callable[[tuple, Any], None]
+
+
+def entry_size(key: str, value: Any) -> int:
+    """Approximate bytes a `key -> value` map entry holds (strings inside tuples included)."""
+    size = ENTRY_OVERHEAD + sys.getsizeof(key)
+    if isinstance(value, tuple):
+        return size + sum(sys.getsizeof(item) for item in value)
+    return size + sys.getsizeof(value)
+
+
+def bounded_map(rows: Iterable[Keyed], budget_bytes: int) -> Tuple[Optional[Dict[str, Any]], int]:
+    """
+    (`dict(rows)`, approximate bytes used), last value per key winning; the map is None as soon
+    as it would exceed `budget_bytes`.
+    """
+    mapping: Dict[str, Any] = {}
+    used = 0
+    for key, value in rows:
+        used += entry_size(key, value)
+        if used > budget_bytes:
+            return None, used
+        mapping[key] = value
+    return mapping, used
+
+
+def _spill(directory: Path, rows: Iterable[tuple]) -> Path:
+    """Write already sorted `rows` to a run file."""
+    with tempfile.NamedTemporaryFile(dir=directory, prefix="run-", suffix=".pkl", delete=False) as handle:
+        iterator = iter(rows)
+        while True:
+            block = list(itertools.islice(iterator, SPILL_BLOCK_ROWS))
+            if not block:
+                break
+            pickle.dump(block, handle, protocol=pickle.HIGHEST_PROTOCOL)
+        return Path(handle.name)
+
+
+def _read_run(path: Path) -> Iterator[tuple]:
+    with path.open("rb") as handle:
+        while True:
+            try:
+                block = pickle.load(handle)
+            except EOFError:
+                return
+            yield from block
+
+
+def external_sort(rows: Iterable[tuple], directory: Path, run_rows: int) -> Iterator[tuple]:
+    """
+    Yield `rows` sorted by their first item, holding at most `run_rows` rows in memory.
+
+    Rows are cut into sorted runs spilled under `directory`, then k-way merged. The sort is
+    stable: rows with equal keys keep their input order.
+    """
+    runs: List[Path] = []
+    iterator = iter(rows)
+    while True:
+        batch = list(itertools.islice(iterator, run_rows))
+        if not batch:
+            break
+        batch.sort(key=itemgetter(0))
+        runs.append(_spill(directory, batch))
+        del batch
+    # heapq.merge breaks key ties by run index, so merging consecutive runs keeps input order.
+    while len(runs) > MERGE_FAN_IN:
+        merged: List[Path] = []
+        for start in range(0, len(runs), MERGE_FAN_IN):
+            group = runs[start : start + MERGE_FAN_IN]
+            merged.append(_spill(directory, heapq.merge(*(_read_run(path) for path in group), key=itemgetter(0))))
+            for path in group:
+                path.unlink()
+        runs = merged
+    yield from heapq.merge(*(_read_run(path) for path in runs), key=itemgetter(0))
+
+
+def last_per_key(rows: Iterable[Keyed]) -> Iterator[Keyed]:
+    """Collapse runs of equal keys in sorted `rows` to the last one (same as building a dict)."""
+    previous: Optional[Keyed] = None
+    for row in rows:
+        if previous is not None and row[0] != previous[0]:
+            yield previous
+        previous = row
+    if previous is not None:
+        yield previous
+
+
+def hash_join(
+    predictions: Iterable[tuple],
+    outcomes: Dict[str, Any],
+    events: Dict[str, Any],
+    unmatched: Optional[Unmatched] = None,
+) -> Iterator[Joined]:
+    """Single pass over `predictions` (in file order) against in-memory outcome/event maps."""
+    for row in predictions:
+        outcome = outcomes.get(row[0])
+        if outcome is not None:
+            yield row, outcome, events.get(row[0])
+        elif unmatched is not None:
+            unmatched(row, events.get(row[0]))
+
+
+def merge_join(
+    predictions: Iterable[tuple],
+    outcomes: Iterable[Keyed],
+    events: Iterable[Keyed],
+    unmatched: Optional[Unmatched] = None,
+) -> Iterator[Joined]:
+    """Join three streams sorted by key; outcomes/events may repeat keys (the last one wins)."""
+    outcome_rows = last_per_key(outcomes)
+    event_rows = last_per_key(events)
+    outcome = next(outcome_rows, None)
+    event = next(event_rows, None)
+    for row in predictions:
+        key = row[0]
+        while outcome is not None and outcome[0] < key:
+            outcome = next(outcome_rows, None)
+        matched = outcome is not None and outcome[0] == key
+        if not matched and unmatched is None:
+            continue
+        while event is not None and event[0] < key:
+            event = next(event_rows, None)
+        value = event[1] if event is not None and event[0] == key else None
+        if matched:
+            yield row, outcome[1], value
+        else:
+            unmatched(row, value)
+
+
+def join_predictions(
+    predictions: RowSource,
+    outcomes: RowSource,
+    events: RowSource,
+    budget_bytes: int,
+    spill_dir: Optional[Path] = None,
+    on_spill: Optional[Callable[[], None]] = None,
+    unmatched: Optional[Unmatched] = None,
+) -> Iterator[Joined]:
+    """
+    Join predictions with outcomes and events within about `budget_bytes` of memory.
+
+    Each source is a callable returning a fresh iterator of `(key, ...)` rows, since a source may
+    need a second read. While the outcome and event maps fit the budget this is a hash join
+    yielding predictions in file order; otherwise all three inputs are externally sorted under
+    `spill_dir` and merge-joined, yielding in key order. Predictions without a resolution are
+    passed to `unmatched`, if given, in the same order.
+    """
+    outcome_map, used = bounded_map(outcomes(), budget_bytes)
+    if outcome_map is not None:
+        event_map, _ = bounded_map(events(), budget_bytes - used)
+        if event_map is not None:
+            yield from hash_join(predictions(), outcome_map, event_map, unmatched)
+            return
+        del event_map
+    del outcome_map
+    if on_spill is not None:
+        on_spill()
+    # Sorting sees whole rows (keys included), so budget conservatively per spilled row.
+    run_rows = max(SPILL_BLOCK_ROWS, budget_bytes // (4 * ENTRY_OVERHEAD))
+    with tempfile.TemporaryDirectory(prefix="agentbeats-join-", dir=spill_dir) as tmp:
+        directory = Path(tmp)
+        yield from merge_join(
+            external_sort(predictions(), directory, run_rows),
+            external_sort(outcomes(), directory, run_rows),
+            external_sort(events(), directory, run_rows),
+            unmatched,
+        )
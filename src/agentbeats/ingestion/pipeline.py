@@ -3,17 +3,14 @@
 from __future__ import annotations
 
 from pathlib import Path
-from typing import Iterable, List, Optional, TypeVar
-
-from pydantic import BaseModel
+from typing import Iterable, Iterator, List, Optional
 
+from ..artifacts import iter_records, write_records
 from ..config import IngestionConfig
 from ..models import EventSpec
 from .sources.base import IngestionSource
 from .sources.polymarket import PolymarketSource
 
-T_Model = TypeVar("T_Model", bound=BaseModel)
-
 
 class EventIngestion:
     """Loads curated event specs and writes them to a snapshot file."""
@@ -26,37 +23,31 @@ class EventIngestion:
                 limit=config.polymarket_limit,
                 include_active=config.include_active,
                 keywords=keywords,
+                page_size=config.polymarket_page_size,
+                concurrency=config.polymarket_concurrency,
             )
         }
 
-    def _load_jsonl(self, path: Path, model: type[T_Model]) -> Iterable[T_Model]:
-        with path.open("r", encoding="utf-8") as handle:
-            for line in handle:
-                line = line.strip()
-                if not line:
-                    continue
-                yield model.model_validate_json(line)
-
-    def load_events(self, path: Optional[Path] = None) -> List[EventSpec]:
+    def iter_events(self, path: Optional[Path] = None) -> Iterator[EventSpec]:
         source_name = self.config.source
         if source_name in self.sources:
-            return self.sources[source_name].fetch_events()
+            yield from self.sources[source_name].iter_events()
+            return
         source = path or self.config.fixture_events
-        return list(self._load_jsonl(source, EventSpec))
+        yield from iter_records(source, EventSpec)
+
+    def load_events(self, path: Optional[Path] = None) -> List[EventSpec]:
+        return list(self.iter_events(path))
 
     def write_snapshot(
         self,
-        events: List[EventSpec],
+        events: Iterable[EventSpec],
         output_path: Path,
     ) -> Path:
-        output_path.parent.mkdir(parents=True, exist_ok=True)
-        with output_path.open("w", encoding="utf-8") as handle:
-            for event in events:
-                handle.write(event.model_dump_json())
-                handle.write("\n")
-        return output_path
+        """Write events as they arrive; the file is swapped in atomically once the stream ends."""
+        # The input may be a stream over `output_path` itself (e.g. re-snapshotting fixtures).
+        return write_records(output_path, events, EventSpec)
 
     def run(self, output_path: Optional[Path] = None) -> Path:
-        events = self.load_events()
         target = output_path or self.config.default_output
-        return self.write_snapshot(events, target)
+        return self.write_snapshot(self.iter_events(), target)
@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from typing import List
+from typing import Iterator, List
 
 from ...models import EventSpec
 
@@ -16,3 +16,7 @@ class IngestionSource(ABC):
     @abstractmethod
     def fetch_events(self) -> List[EventSpec]:
         """Return the latest events as EventSpec objects."""
+
+    def iter_events(self) -> Iterator[EventSpec]:
+        """Yield events as they become available; sources that can stream should override this."""
+        yield from self.fetch_events()
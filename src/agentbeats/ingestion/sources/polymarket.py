@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 import json
-from typing import List, Optional
+from typing import Iterator, List, Optional
 
 from ...models import EventSource, EventSpec
 from ...domain.finance import match_keywords
@@ -20,9 +20,13 @@ class PolymarketSource(IngestionSource):
         include_active: bool = True,
         keywords: Optional[List[str]] = None,
         client: Optional[PolymarketClient] = None,
+        page_size: int = 100,
+        concurrency: int = 1,
     ):
         self.name = "polymarket"
         self.limit = limit
+        self.page_size = page_size
+        self.concurrency = concurrency
         self.include_active = include_active
         self.keywords = [kw.lower() for kw in (keywords or [])]
         self.client = client or PolymarketClient()
@@ -67,12 +71,19 @@ class PolymarketSource(IngestionSource):
             baseline_probability=self._baseline_probability(market),
         )
 
-    def fetch_events(self) -> List[EventSpec]:
-        markets = self.client.fetch_markets(limit=self.limit, active_only=self.include_active)
-        events: List[EventSpec] = []
+    def iter_events(self) -> Iterator[EventSpec]:
+        """Stream matching events while paging through up to `limit` markets (<= 0 for all)."""
+        markets = self.client.iter_markets(
+            limit=self.limit,
+            active_only=self.include_active,
+            page_size=self.page_size,
+            concurrency=self.concurrency,
+        )
         for market in markets:
             event = self._to_event(market)
             if self.keywords and not event.tags:
                 continue
-            events.append(event)
-        return events
+            yield event
+
+    def fetch_events(self) -> List[EventSpec]:
+        return list(self.iter_events())
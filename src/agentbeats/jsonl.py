@@ -0,0 +1,262 @@
+"""Chunked, optionally multi-process JSONL reader shared by all stages (plain, .gz or .zst)."""
+
+from __future__ import annotations
+
+import gzip
+import json
+import mmap
+import os
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from pathlib import Path
+from typing import IO, Any, Callable, Deque, Iterator, List, Optional, Sequence, Set, Tuple, Type
+
+from pydantic import BaseModel, ValidationError
+
+from .codec import codec_settings, get_codec, get_projection
+
+try:  # Optional: .jsonl.zst artifacts.
+    import zstandard
+except ImportError:  # pragma: no cover - depends on environment
+    zstandard = None
+
+DEFAULT_CHUNK_BYTES = 16 * 2**20
+# Below this size a process pool costs more to start than it saves.
+PARALLEL_MIN_BYTES = 64 * 2**20
+
+COMPRESSION_SUFFIXES = {".gz": "gzip", ".zst": "zstd", ".zstd": "zstd"}
+# zstd 3 / gzip 6 are each library's default speed/ratio trade-off.
+DEFAULT_COMPRESSION_LEVELS = {"zstd": 3, "gzip": 6}
+
+# Applied inside the worker to each chunk's records; must be a picklable module-level callable.
+ChunkParser = Callable[[List[Any]], List[Any]]
+
+
+def compression_for(path: Path) -> Optional[str]:
+    """"gzip" / "zstd" when `path` ends in .gz / .zst, None for plain files."""
+    return COMPRESSION_SUFFIXES.get(path.suffix.lower())
+
+
+def compression_level(compression: str, level: Optional[int] = None) -> int:
+    """`level`, else AGENTBEATS_COMPRESSION_LEVEL, else the codec's default."""
+    if level is None:
+        raw = os.getenv("AGENTBEATS_COMPRESSION_LEVEL", "").strip()
+        level = int(raw) if raw else DEFAULT_COMPRESSION_LEVELS[compression]
+    return level
+
+
+def _require_zstd() -> None:
+    if zstandard is None:
+        raise RuntimeError(".zst artifacts need zstandard (pip install -e .[zstd])")
+
+
+def open_binary_reader(path: Path) -> IO[bytes]:
+    """Binary handle yielding `path`'s decompressed bytes, streamed."""
+    compression = compression_for(path)
+    if compression == "gzip":
+        return gzip.open(path, "rb")
+    if compression == "zstd":
+        _require_zstd()
+        return zstandard.ZstdDecompressor().stream_reader(path.open("rb"), read_across_frames=True, closefd=True)
+    return path.open("rb")
+
+
+def open_jsonl_writer(path: Path, level: Optional[int] = None) -> IO[str]:
+    """UTF-8 text handle writing `path`, stream-compressed per its suffix (.gz / .zst)."""
+    compression = compression_for(path)
+    if compression == "gzip":
+        return gzip.open(path, "wt", compresslevel=compression_level("gzip", level), encoding="utf-8", newline="\n")
+    if compression == "zstd":
+        _require_zstd()
+        compressor = zstandard.ZstdCompressor(level=compression_level("zstd", level))
+        return zstandard.open(path, "wt", cctx=compressor, encoding="utf-8", newline="\n")
+    return path.open("w", encoding="utf-8", newline="\n")
+
+
+def iter_line_chunks(path: Path, chunk_bytes: int = DEFAULT_CHUNK_BYTES) -> Iterator[List[bytes]]:
+    """Lists of about `chunk_bytes` of complete lines, streamed through any decompression."""
+    with open_binary_reader(path) as handle:
+        tail = b""
+        while True:
+            block = handle.read(chunk_bytes)
+            if not block:
+                break
+            block = tail + block
+            cut = block.rfind(b"\n") + 1
+            if cut == 0:
+                tail = block
+                continue
+            tail = block[cut:]
+            yield block[:cut].splitlines()
+        if tail:
+            yield [tail]
+
+
+def line_ranges(path: Path, chunk_bytes: int = DEFAULT_CHUNK_BYTES) -> List[Tuple[int, int]]:
+    """Split `path` into `[start, end)` byte ranges of about `chunk_bytes`, each ending on a newline."""
+    size = path.stat().st_size
+    if size == 0:
+        return []
+    ranges: List[Tuple[int, int]] = []
+    with path.open("rb") as handle, mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as view:
+        start = 0
+        while start < size:
+            newline = view.find(b"\n", min(start + chunk_bytes, size) - 1)
+            end = size if newline < 0 else newline + 1
+            ranges.append((start, end))
+            start = end
+    return ranges
+
+
+def _read_range(path: Path, start: int, end: int) -> List[bytes]:
+    with path.open("rb") as handle, mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as view:
+        return view[start:end].splitlines()
+
+
+def _parse_range(
+    path: Path,
+    start: int,
+    end: int,
+    model: Optional[Type[BaseModel]],
+    fields: Optional[Tuple[str, ...]],
+    codec: Tuple[str, bool],
+    parse: Optional[ChunkParser],
+    skip_invalid: bool,
+) -> List[Any]:
+    """Decode one byte range. Runs in worker processes, so everything it needs is passed in."""
+    return _parse_lines(_read_range(path, start, end), model, fields, codec, parse, skip_invalid)
+
+
+def _parse_lines(
+    lines: List[bytes],
+    model: Optional[Type[BaseModel]],
+    fields: Optional[Tuple[str, ...]],
+    codec: Tuple[str, bool],
+    parse: Optional[ChunkParser],
+    skip_invalid: bool,
+) -> List[Any]:
+    if model is None:
+        return _reduce([json.loads(line) for line in lines if line.strip()], parse)
+    backend, strict = codec
+    if fields is not None:
+        decoder: Any = get_projection(model, fields, strict=strict, backend=backend)
+    else:
+        decoder = get_codec(model, strict=strict, backend=backend)
+    if skip_invalid:
+        records: List[Any] = []
+        for line in lines:
+            if not line.strip():
+                continue
+            try:
+                records.append(decoder.decode(line))
+            except (ValidationError, ValueError):
+                continue
+    else:
+        records = list(decoder.decode_lines(lines))
+    return _reduce(records, parse)
+
+
+def _reduce(records: List[Any], parse: Optional[ChunkParser]) -> List[Any]:
+    return parse(records) if parse is not None else records
+
+
+def _resolve_workers(workers: Optional[int], size: int, parse: Optional[ChunkParser]) -> int:
+    if workers is None:
+        raw = os.getenv("AGENTBEATS_READ_WORKERS", "").strip()
+        if raw:
+            workers = int(raw)
+        elif parse is not None and size >= PARALLEL_MIN_BYTES:
+            workers = os.cpu_count() or 1
+        else:
+            workers = 1
+    return max(1, workers)
+
+
+def iter_jsonl(
+    path: Path,
+    model: Optional[Type[BaseModel]] = None,
+    workers: Optional[int] = None,
+    ordered: bool = True,
+    chunk_bytes: int = DEFAULT_CHUNK_BYTES,
+    parse: Optional[ChunkParser] = None,
+    skip_invalid: bool = False,
+    fields: Optional[Sequence[str]] = None,
+) -> Iterator[Any]:
+    """
+    Yield records from a JSONL file: `model` instances via the shared codec, or dicts if no model.
+
+    `fields` (dotted paths, e.g. `["id", "prediction.probability"]`) decodes and validates only
+    those fields of each row, yielding plain dicts shaped like `model` (see `ProjectionCodec`).
+
+    Plain files are memory-mapped and cut into line-aligned byte ranges; `.gz` / `.zst` files
+    are decompressed as a stream and cut into line chunks of the same size instead. With `workers > 1` the ranges
+    are decoded in a process pool (a bounded window of chunks in flight, so memory stays flat);
+    `ordered=False` yields each chunk as soon as it is ready instead of in file order. `parse`
+    runs in the worker on every decoded chunk: shipping full pydantic models back to the parent
+    costs about as much as parsing them, so the pool pays off when `parse` reduces rows to the
+    few values a stage needs. Hence `workers=None` (or AGENTBEATS_READ_WORKERS) uses all cores only
+    for large files read with a `parse` step, and reads in-process otherwise.
+
+    Examples
+    --------
+    >>> for record in iter_jsonl(Path("data/generated/predictions/latest.jsonl"), PredictionRecord):
+    ...     ...
+    >>> pairs = iter_jsonl(path, PredictionRecord, workers=8, ordered=False, parse=to_id_probability)
+    >>> ids = [row["id"] for row in iter_jsonl(path, PredictionRecord, fields=["id"])]
+    """
+    if not path.exists():
+        raise FileNotFoundError(path)
+    if fields is not None and model is None:
+        raise ValueError("fields= needs a model to project")
+    codec = codec_settings() if model is not None else ("auto", False)
+    arguments = (model, tuple(fields) if fields is not None else None, codec, parse, skip_invalid)
+    tasks: Iterator[Tuple[Callable[..., List[Any]], tuple]]
+    if compression_for(path):
+        # Sized by the compressed file, so the default pool threshold is reached later than for plain JSONL.
+        workers = _resolve_workers(workers, path.stat().st_size, parse)
+        tasks = ((_parse_lines, (lines,)) for lines in iter_line_chunks(path, chunk_bytes))
+    else:
+        ranges = line_ranges(path, chunk_bytes)
+        size = ranges[-1][1] if ranges else 0
+        workers = min(_resolve_workers(workers, size, parse), len(ranges) or 1)
+        tasks = ((_parse_range, (path, start, end)) for start, end in ranges)
+    if workers <= 1:
+        for function, task in tasks:
+            yield from function(*task, *arguments)
+        return
+
+    pool = ProcessPoolExecutor(max_workers=workers)
+    try:
+        window = workers * 2
+
+        def submit() -> Optional[Future]:
+            task = next(tasks, None)
+            if task is None:
+                return None
+            function, head = task
+            return pool.submit(function, *head, *arguments)
+
+        if ordered:
+            queue: Deque[Future] = deque(future for future in (submit() for _ in range(window)) if future)
+            while queue:
+                future = queue.popleft()
+                following = submit()
+                if following is not None:
+                    queue.append(following)
+                yield from future.result()
+        else:
+            running: Set[Future] = {future for future in (submit() for _ in range(window)) if future}
+            while running:
+                done, running = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    following = submit()
+                    if following is not None:
+                        running.add(following)
+                    yield from future.result()
+    finally:
+        pool.shutdown(wait=True, cancel_futures=True)
+
+
+def read_jsonl(path: Path, model: Optional[Type[BaseModel]] = None, **options: Any) -> List[Any]:
+    """`list(iter_jsonl(...))`."""
+    return list(iter_jsonl(path, model, **options))
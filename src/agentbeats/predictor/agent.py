@@ -2,13 +2,14 @@
 
 from __future__ import annotations
 
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Callable, Iterable, List, Optional, Type, TypeVar
+from typing import Callable, Deque, Iterable, Iterator, List, Optional
 import random
 
-from pydantic import BaseModel
-
+from ..artifacts import read_records, write_records
 from ..config import PredictorConfig
 from ..domain.finance import FINANCE_KEYWORDS
 from ..models import (
@@ -18,16 +19,16 @@ from ..models import (
     PredictionPayload,
     PredictionRecord,
 )
-from ..tools import AlphaVantageClient, EdgarEvidenceFetcher, NewsEvidenceFetcher
+from ..tools import AlphaVantageClient, EdgarEvidenceFetcher, NewsEvidenceFetcher, PolymarketClient
 from .evidence.alpha import AlphaVantageEvidenceModule
-from .evidence.base import EvidencePayload
+from .evidence.base import EvidencePayload, PrefetchingEvidenceModule
 from .evidence.edgar import EdgarEvidenceModule
+from .evidence.market import MarketEvidenceModule
 from .evidence.news import NewsEvidenceModule
-
-T_Model = TypeVar("T_Model", bound=BaseModel)
-
+from .planner import PrefetchPlanner
 
 LogFn = Callable[[str, str], None]
+GatheredEvidence = tuple[List[EvidenceItem], float, Optional[float], List[str]]
 
 
 class PurpleAgent:
@@ -38,37 +39,54 @@ class PurpleAgent:
         config: PredictorConfig,
         seed: int = 42,
         news_fetcher: NewsEvidenceFetcher | None = None,
+        alpha_client: AlphaVantageClient | None = None,
+        edgar_fetcher: EdgarEvidenceFetcher | None = None,
+        polymarket_client: PolymarketClient | None = None,
     ):
         self.config = config
         self._rng = random.Random(seed)
         self.news_fetcher = news_fetcher or NewsEvidenceFetcher(self.config.news_fixtures)
-        self.alpha_client = (
+        self.alpha_client = alpha_client or (
             AlphaVantageClient(api_key=self.config.alpha_vantage_api_key)
             if self.config.alpha_vantage_api_key
             else None
         )
-        self.edgar_fetcher = EdgarEvidenceFetcher()
+        self.edgar_fetcher = edgar_fetcher or EdgarEvidenceFetcher()
+        self.polymarket_client = polymarket_client or (PolymarketClient() if self.config.market_evidence else None)
         self.evidence_modules = self._build_evidence_modules()
 
+    @staticmethod
+    def _symbol_map() -> dict[str, tuple[str, str]]:
+        return {k: (v["symbol"], v["type"]) for k, v in FINANCE_KEYWORDS.items()}
+
     def _build_evidence_modules(self):
         modules = [NewsEvidenceModule(self.news_fetcher)]
+        if self.config.market_evidence and self.polymarket_client:
+            modules.append(MarketEvidenceModule(self.polymarket_client))
         if self.alpha_client and self.alpha_client.is_configured():
-            modules.append(
-                AlphaVantageEvidenceModule(
-                    self.alpha_client,
-                    {k: (v["symbol"], v["type"]) for k, v in FINANCE_KEYWORDS.items()},
-                )
-            )
+            modules.append(AlphaVantageEvidenceModule(self.alpha_client, self._symbol_map()))
         modules.append(EdgarEvidenceModule(self.edgar_fetcher))
         return modules
 
-    def _load_jsonl(self, path: Path, model: Type[T_Model]) -> Iterable[T_Model]:
-        with path.open("r", encoding="utf-8") as handle:
-            for line in handle:
-                line = line.strip()
-                if not line:
-                    continue
-                yield model.model_validate_json(line)
+    def build_planner(self, polymarket_client: Optional[PolymarketClient] = None) -> PrefetchPlanner:
+        """Planner over this agent's tool clients (plus Polymarket ids when a client is given)."""
+        return PrefetchPlanner(
+            news_fetcher=self.news_fetcher,
+            alpha_client=self.alpha_client,
+            edgar_fetcher=self.edgar_fetcher,
+            polymarket_client=polymarket_client,
+            symbol_map=self._symbol_map(),
+            budgets=self.config.prefetch_budgets,
+        )
+
+    def prefetch(self, events: List[EventSpec], log: Optional[LogFn] = None) -> dict[str, dict[str, int]]:
+        """Resolve the batch's deduplicated tool requests and warm the caches concurrently."""
+        planner = self.build_planner(self.polymarket_client)
+        plan = planner.plan(events)
+        if log:
+            counts = ", ".join(f"{tool}={count}" for tool, count in plan.counts().items() if count)
+            log(f"Prefetching tool requests ({counts or 'none'})", "cyan")
+        return planner.warm(plan, log=log)
 
     def ingest_events(self, events_path: Optional[Path] = None) -> List[EventSpec]:
         candidates = [
@@ -78,16 +96,19 @@ class PurpleAgent:
         ]
         for candidate in candidates:
             if candidate and Path(candidate).exists():
-                return list(self._load_jsonl(candidate, EventSpec))
+                return read_records(Path(candidate), EventSpec)
         raise FileNotFoundError("No event snapshot available. Run `agentbeats ingest-events` first.")
 
-    def gather_evidence(self, event: EventSpec) -> tuple[List[EvidenceItem], float, Optional[float], List[str]]:
+    def gather_evidence(self, event: EventSpec) -> GatheredEvidence:
+        payloads = [module.gather(event) for module in self.evidence_modules]
+        return self._combine_payloads(event, payloads)
+
+    def _combine_payloads(self, event: EventSpec, payloads: List[EvidencePayload]) -> GatheredEvidence:
         evidence: List[EvidenceItem] = []
         sentiment = 0.0
         market_probability: Optional[float] = event.baseline_probability
         logs: List[str] = []
-        for module in self.evidence_modules:
-            payload: EvidencePayload = module.gather(event)
+        for module, payload in zip(self.evidence_modules, payloads):
             evidence.extend(payload.evidence)
             sentiment += payload.signal
             if payload.market_probability is not None:
@@ -99,6 +120,48 @@ class PurpleAgent:
                 logs.extend([f"   {msg}" for msg in payload.messages])
         return evidence, sentiment, market_probability, logs
 
+    def _iter_evidence(
+        self,
+        events: List[EventSpec],
+        log: Optional[LogFn] = None,
+    ) -> Iterator[tuple[EventSpec, GatheredEvidence]]:
+        """Yield gathered evidence per event in input order, logging exactly as the serial path does."""
+        for module in self.evidence_modules:
+            if isinstance(module, PrefetchingEvidenceModule):
+                module.prefetch(events)
+
+        def emit(event: EventSpec, gathered: GatheredEvidence) -> tuple[EventSpec, GatheredEvidence]:
+            if log:
+                for entry in gathered[3]:
+                    log(f"   - {entry}", "cyan")
+            return event, gathered
+
+        workers = self.config.max_concurrency
+        if workers <= 1:
+            for event in events:
+                if log:
+                    log(f"• [{event.id}] {event.question}", "yellow")
+                yield emit(event, self.gather_evidence(event))
+            return
+
+        def collect(event: EventSpec, futures: List[Future]) -> tuple[EventSpec, GatheredEvidence]:
+            payloads = [future.result() for future in futures]
+            if log:
+                log(f"• [{event.id}] {event.question}", "yellow")
+            return emit(event, self._combine_payloads(event, payloads))
+
+        # Every (event, module) call is its own task so the pool limit bounds total in-flight
+        # requests; the window keeps only a few events' worth of futures queued at once.
+        window = workers * 2
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="evidence") as pool:
+            pending: Deque[tuple[EventSpec, List[Future]]] = deque()
+            for event in events:
+                pending.append((event, [pool.submit(module.gather, event) for module in self.evidence_modules]))
+                if len(pending) >= window:
+                    yield collect(*pending.popleft())
+            while pending:
+                yield collect(*pending.popleft())
+
     def analyze_event(self, event: EventSpec, sentiment: float, evidence: List[EvidenceItem]) -> str:
         if not evidence:
             return f"No fresh evidence for {event.question}; defaulting to prior."
@@ -116,13 +179,9 @@ class PurpleAgent:
     ) -> List[PredictionRecord]:
         timestamp = as_of or datetime.now(timezone.utc)
         predictions: List[PredictionRecord] = []
-        for idx, event in enumerate(events):
-            if log:
-                log(f"• [{event.id}] {event.question}", "yellow")
-            evidence, sentiment, market_prob, evidence_logs = self.gather_evidence(event)
-            if log:
-                for entry in evidence_logs:
-                    log(f"   - {entry}", "cyan")
+        if self.config.prefetch:
+            self.prefetch(events, log)
+        for event, (evidence, sentiment, market_prob, _logs) in self._iter_evidence(events, log):
             base_prob = self._rng.uniform(0.2, 0.8)
             probability = round(min(max(base_prob + sentiment * 0.1, 0.05), 0.95), 2)
             if market_prob is not None:
@@ -149,12 +208,7 @@ class PurpleAgent:
     def write_predictions(
         self, predictions: List[PredictionRecord], output_path: Path
     ) -> Path:
-        output_path.parent.mkdir(parents=True, exist_ok=True)
-        with output_path.open("w", encoding="utf-8") as handle:
-            for record in predictions:
-                handle.write(record.model_dump_json())
-                handle.write("\n")
-        return output_path
+        return write_records(output_path, predictions, PredictionRecord)
 
     def run(
         self,
@@ -6,10 +6,20 @@ from datetime import datetime, timezone
 from typing import List
 
 from ...models import EventSpec, EvidenceItem
-from ...tools import AlphaVantageClient
+from ...tools import AlphaVantageClient, CassetteMiss
 from .base import EvidencePayload
 
 
+def match_symbol(event: EventSpec, symbol_map: dict[str, tuple[str, str]]) -> str | None:
+    """First symbol whose keyword appears in the event's tags or question."""
+    tags = [tag.lower() for tag in (event.tags or [])]
+    question = event.question.lower()
+    for keyword, (symbol, _data_type) in symbol_map.items():
+        if keyword in tags or keyword in question:
+            return symbol
+    return None
+
+
 class AlphaVantageEvidenceModule:
     """Fetches simple price momentum signals via Alpha Vantage."""
 
@@ -18,12 +28,7 @@ class AlphaVantageEvidenceModule:
         self.symbol_map = symbol_map
 
     def _symbol_for_event(self, event: EventSpec) -> str | None:
-        tags = [tag.lower() for tag in (event.tags or [])]
-        question = event.question.lower()
-        for keyword, (symbol, _data_type) in self.symbol_map.items():
-            if keyword in tags or keyword in question:
-                return symbol
-        return None
+        return match_symbol(event, self.symbol_map)
 
     def gather(self, event: EventSpec) -> EvidencePayload:
         if not self.client or not self.client.is_configured():
@@ -32,15 +37,11 @@ class AlphaVantageEvidenceModule:
         if not symbol:
             return EvidencePayload(evidence=[], signal=0.0, messages=["Alpha Vantage skipped: no symbol match"])
         try:
-            series = self.client.fetch_time_series(symbol)
-            key = "Time Series (Daily)"
-            points = series.get(key, {})
-            ordered_dates = sorted(points.keys(), reverse=True)
-            closes = [float(points[date]["4. close"]) for date in ordered_dates[:5]]
-            if len(closes) < 2:
+            series = self.client.price_series(symbol)
+            if len(series) < 2:
                 return EvidencePayload(evidence=[], signal=0.0, messages=["Alpha Vantage skipped: insufficient data"])
-            latest = closes[0]
-            avg = sum(closes[1:]) / (len(closes) - 1)
+            latest = float(series.close[-1])
+            avg = series.window_mean(4, end=len(series) - 1)
             delta = (latest - avg) / avg if avg else 0.0
             evidence = EvidenceItem(
                 type="alpha_vantage",
@@ -52,5 +53,7 @@ class AlphaVantageEvidenceModule:
             if getattr(self.client, "last_from_cache", False):
                 msg += " (cache)"
             return EvidencePayload(evidence=[evidence], signal=delta, messages=[msg])
+        except CassetteMiss:
+            raise
         except Exception as exc:
             return EvidencePayload(evidence=[], signal=0.0, messages=[f"Alpha Vantage error: {exc}"])
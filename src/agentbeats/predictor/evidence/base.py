@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import List, Optional, Protocol
+from typing import Iterable, List, Optional, Protocol, runtime_checkable
 
 from ...models import EventSpec, EvidenceItem
 
@@ -21,3 +21,11 @@ class EvidenceModule(Protocol):
 
     def gather(self, event: EventSpec) -> EvidencePayload:
         """Return evidence, signal, and optional metadata (e.g., market probability)."""
+
+
+@runtime_checkable
+class PrefetchingEvidenceModule(EvidenceModule, Protocol):
+    """Modules that can load what a whole batch of events needs before `gather` is called."""
+
+    def prefetch(self, events: Iterable[EventSpec]) -> None:
+        """Warm per-batch state so `gather` avoids one request per event."""
@@ -6,7 +6,7 @@ from datetime import datetime
 from typing import List, Sequence
 
 from ...models import EventSpec, EvidenceItem
-from ...tools import EdgarEvidenceFetcher
+from ...tools import CassetteMiss, EdgarEvidenceFetcher
 from .base import EvidencePayload
 
 
@@ -24,12 +24,16 @@ class EdgarEvidenceModule:
         try:
             filings = self.fetcher.fetch_latest(event, forms=("8-K", "10-Q", "10-K"), limit=1)
             evidence.extend(filings)
+        except CassetteMiss:
+            raise
         except Exception as exc:  # noqa: BLE001
             messages.append(f"EDGAR filings error: {exc}")
 
         facts_payload = []
         try:
             facts_payload = self.fetcher.fetch_facts(event, tags=self.fact_tags, forms=("10-Q", "10-K", "8-K"), limit=2)
+        except CassetteMiss:
+            raise
         except Exception as exc:  # noqa: BLE001
             messages.append(f"EDGAR facts error: {exc}")
 
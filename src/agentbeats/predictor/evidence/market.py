@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 import json
-from typing import List, Optional
+from typing import Any, Dict, Iterable, List, Optional
 
 from ...models import EventSpec, EvidenceItem
 from ...tools import PolymarketClient
@@ -13,15 +13,35 @@ from .base import EvidencePayload
 class MarketEvidenceModule:
     """Provides baseline odds evidence from Polymarket markets."""
 
-    def __init__(self, client: PolymarketClient):
+    def __init__(self, client: PolymarketClient, batch_size: int = 50):
         self.client = client
+        self.batch_size = batch_size
+        self._markets: Dict[str, Dict[str, Any]] = {}
+
+    @staticmethod
+    def _market_id(event: EventSpec) -> Optional[str]:
+        if event.baseline_probability is not None:
+            return None
+        if not event.source or not event.source.market_id:
+            return None
+        return str(event.source.market_id)
+
+    def prefetch(self, events: Iterable[EventSpec]) -> None:
+        """Load every market the batch needs in a few multi-id requests."""
+        market_ids = [market_id for market_id in map(self._market_id, events) if market_id]
+        self._markets = self.client.fetch_markets_by_ids(market_ids, batch_size=self.batch_size) if market_ids else {}
 
     def _fetch_probability(self, event: EventSpec) -> Optional[float]:
         if event.baseline_probability is not None:
             return event.baseline_probability
-        if not event.source or not event.source.market_id:
+        market_id = self._market_id(event)
+        if market_id is None:
+            return None
+        market = self._markets.get(market_id)
+        if market is None:
+            market = self.client.fetch_markets_by_ids([market_id]).get(market_id)
+        if market is None:
             return None
-        market = self.client.fetch_market(str(event.source.market_id))
         prices = market.get("outcomePrices")
         if isinstance(prices, str):
             try:
@@ -0,0 +1,140 @@
+"""Batch prefetch planning for predictor runs."""
+
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Iterable, List, Mapping, Optional
+
+from ..models import EventSpec
+from ..tools import AlphaVantageClient, CassetteMiss, EdgarEvidenceFetcher, NewsEvidenceFetcher, PolymarketClient
+from .evidence.alpha import match_symbol
+
+LogFn = Callable[[str, str], None]
+
+# Concurrent requests per tool while warming; the shared transport still enforces host quotas.
+DEFAULT_BUDGETS: Dict[str, int] = {
+    "news": 4,
+    "alpha_vantage": 1,
+    "edgar": 4,
+    "polymarket": 2,
+}
+
+
+@dataclass
+class PrefetchPlan:
+    """Deduplicated tool requests needed by a batch of events."""
+
+    news_queries: List[str] = field(default_factory=list)
+    alpha_symbols: List[str] = field(default_factory=list)
+    edgar_tickers: List[str] = field(default_factory=list)
+    market_ids: List[str] = field(default_factory=list)
+
+    def counts(self) -> Dict[str, int]:
+        return {
+            "news": len(self.news_queries),
+            "alpha_vantage": len(self.alpha_symbols),
+            "edgar": len(self.edgar_tickers),
+            "polymarket": len(self.market_ids),
+        }
+
+
+class PrefetchPlanner:
+    """
+    Scan an event batch for the tool calls its evidence modules will make and warm the caches.
+
+    Keys are derived exactly as the modules derive them (normalized news query, matched Alpha
+    Vantage symbol, EDGAR ticker hint, Polymarket id), so the per-event loop that follows runs on
+    cache hits. Tools without a client are left out of the plan. Each tool is warmed on its own
+    pool sized by `budgets`, and all tools warm at the same time.
+    """
+
+    def __init__(
+        self,
+        news_fetcher: Optional[NewsEvidenceFetcher] = None,
+        alpha_client: Optional[AlphaVantageClient] = None,
+        edgar_fetcher: Optional[EdgarEvidenceFetcher] = None,
+        polymarket_client: Optional[PolymarketClient] = None,
+        symbol_map: Optional[Mapping[str, tuple[str, str]]] = None,
+        budgets: Optional[Mapping[str, int]] = None,
+        market_batch_size: int = 50,
+    ):
+        self.news_fetcher = news_fetcher
+        self.alpha_client = alpha_client if alpha_client and alpha_client.is_configured() else None
+        self.edgar_fetcher = edgar_fetcher
+        self.polymarket_client = polymarket_client
+        self.symbol_map = dict(symbol_map or {})
+        self.budgets = dict(DEFAULT_BUDGETS)
+        self.budgets.update(budgets or {})
+        self.market_batch_size = market_batch_size
+
+    def plan(self, events: Iterable[EventSpec]) -> PrefetchPlan:
+        news: Dict[str, None] = {}
+        symbols: Dict[str, None] = {}
+        tickers: Dict[str, None] = {}
+        markets: Dict[str, None] = {}
+        for event in events:
+            if self.news_fetcher:
+                news.setdefault(self.news_fetcher.query_for_event(event))
+            if self.alpha_client:
+                symbol = match_symbol(event, self.symbol_map)
+                if symbol:
+                    symbols.setdefault(symbol)
+            if self.edgar_fetcher:
+                ticker = self.edgar_fetcher.ticker_for_event(event)
+                if ticker:
+                    tickers.setdefault(ticker.upper())
+            if self.polymarket_client and event.baseline_probability is None:
+                if event.source and event.source.market_id:
+                    markets.setdefault(str(event.source.market_id))
+        return PrefetchPlan(
+            news_queries=list(news),
+            alpha_symbols=list(symbols),
+            edgar_tickers=list(tickers),
+            market_ids=list(markets),
+        )
+
+    def _tasks(self, plan: PrefetchPlan) -> Dict[str, tuple[Callable[[object], object], List[object]]]:
+        tasks: Dict[str, tuple[Callable[[object], object], List[object]]] = {}
+        if self.news_fetcher and plan.news_queries:
+            tasks["news"] = (self.news_fetcher.search, list(plan.news_queries))
+        if self.alpha_client and plan.alpha_symbols:
+            tasks["alpha_vantage"] = (self.alpha_client.price_series, list(plan.alpha_symbols))
+        if self.edgar_fetcher and plan.edgar_tickers:
+            tasks["edgar"] = (self.edgar_fetcher.warm, list(plan.edgar_tickers))
+        if self.polymarket_client and plan.market_ids:
+            size = self.market_batch_size
+            batches = [plan.market_ids[i:i + size] for i in range(0, len(plan.market_ids), size)]
+            client = self.polymarket_client
+            tasks["polymarket"] = (lambda ids: client.fetch_markets_by_ids(ids, batch_size=size), batches)
+        return tasks
+
+    def _warm_tool(self, tool: str, fetch: Callable[[object], object], keys: List[object]) -> Dict[str, int]:
+        def attempt(key: object) -> bool:
+            try:
+                return bool(fetch(key))
+            except CassetteMiss:
+                raise
+            except Exception:  # noqa: BLE001 - warming is best effort; the per-event path retries
+                return False
+
+        with ThreadPoolExecutor(max_workers=max(self.budgets.get(tool, 1), 1), thread_name_prefix=f"warm-{tool}") as pool:
+            outcomes = list(pool.map(attempt, keys))
+        return {"requested": len(keys), "ok": sum(outcomes), "missed": len(outcomes) - sum(outcomes)}
+
+    def warm(self, plan: PrefetchPlan, log: Optional[LogFn] = None) -> Dict[str, Dict[str, int]]:
+        """
+        Prefetch every planned request; returns per-tool {requested, ok, missed} counts.
+
+        A request is "missed" when it failed or came back empty; warming never raises.
+        """
+        tasks = self._tasks(plan)
+        if not tasks:
+            return {}
+        with ThreadPoolExecutor(max_workers=len(tasks), thread_name_prefix="warm") as pool:
+            futures = {tool: pool.submit(self._warm_tool, tool, fetch, keys) for tool, (fetch, keys) in tasks.items()}
+            summary = {tool: future.result() for tool, future in futures.items()}
+        if log:
+            for tool, counts in summary.items():
+                log(f"   prefetch {tool}: {counts['ok']}/{counts['requested']} ok", "cyan")
+        return summary
@@ -3,12 +3,12 @@
 from __future__ import annotations
 
 import re
-from datetime import datetime, timedelta, timezone
+from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
 from ..models import EventSpec
-from ..tools import AlphaVantageClient
+from ..tools import AlphaVantageClient, CassetteMiss
 
 _PRICE_PATTERN = re.compile(r"close above \$([0-9]+(?:\.[0-9]+)?) on (\d{4}-\d{2}-\d{2})", re.IGNORECASE)
 
@@ -29,22 +29,9 @@ class PriceCloseResolver:
 
     def _get_close(self, symbol: str, date_str: str) -> Optional[float]:
         """Fetch close price for symbol on or before date_str (YYYY-MM-DD)."""
-        series = self.client.fetch_time_series(symbol)
-        key = "Time Series (Daily)"
-        points: Dict[str, Any] = series.get(key, {})
-        if not points:
-            return None
-        target_date = datetime.fromisoformat(date_str)
-        # Try target date, then walk back up to 5 days (skip weekends/holidays)
-        for delta in range(0, 6):
-            check_date = target_date - timedelta(days=delta)
-            key_str = check_date.strftime("%Y-%m-%d")
-            if key_str in points:
-                try:
-                    return float(points[key_str]["4. close"])
-                except (KeyError, TypeError, ValueError):
-                    return None
-        return None
+        series = self.client.price_series(symbol)
+        # Last bar on or up to 5 days before the target date (skip weekends/holidays).
+        return series.close_asof(date_str, max_lag_days=5)
 
     def resolve(self, events: List[EventSpec]) -> List[Dict[str, Any]]:
         resolutions: List[Dict[str, Any]] = []
@@ -58,6 +45,8 @@ class PriceCloseResolver:
                 continue
             try:
                 close_price = self._get_close(symbol, date_str)
+            except CassetteMiss:
+                raise
             except Exception:
                 close_price = None
             outcome = None
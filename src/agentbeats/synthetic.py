@@ -0,0 +1,276 @@
+"""Seeded, vectorized generator for large synthetic events/predictions/resolutions corpora."""
+
+from __future__ import annotations
+
+import itertools
+import json
+from dataclasses import dataclass, field
+from datetime import date, timedelta
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Union
+
+import numpy as np
+
+from .jsonl import open_jsonl_writer
+from .models import EventSpec, PredictionRecord, ResolutionRecord
+
+DEFAULT_TICKERS = ("TSLA", "AAPL", "MSFT", "AMZN", "NVDA")
+DEFAULT_ANCHOR = date(2025, 1, 1)
+
+# Question shapes; index 0 is the price-close form PriceCloseResolver understands.
+_PRICE, _EPS, _SPLIT = 0, 1, 2
+
+# Independent per-row random streams (see `_uniform`).
+_STREAM_TICKER, _STREAM_KIND, _STREAM_DAY, _STREAM_TARGET = 1, 2, 3, 4
+_STREAM_BASELINE, _STREAM_PREDICTION, _STREAM_OUTCOME = 5, 6, 7
+
+_M1 = np.uint64(0xBF58476D1CE4E5B9)
+_M2 = np.uint64(0x94D049BB133111EB)
+_GOLDEN = np.uint64(0x9E3779B97F4A7C15)
+
+
+def _mix(values: np.ndarray) -> np.ndarray:
+    """SplitMix64 finalizer: a fast, well-distributed 64-bit hash (wraps modulo 2**64)."""
+    with np.errstate(over="ignore"):
+        values = values + _GOLDEN
+        values = (values ^ (values >> np.uint64(30))) * _M1
+        values = (values ^ (values >> np.uint64(27))) * _M2
+        return values ^ (values >> np.uint64(31))
+
+
+def _uniform(index: np.ndarray, seed: int, stream: int) -> np.ndarray:
+    """Uniform [0, 1) draw per row index, a pure function of (seed, stream, index)."""
+    key = _mix(np.array([(seed << 8) | stream], dtype=np.uint64))
+    return (_mix(index ^ key) >> np.uint64(11)).astype(np.float64) * (1.0 / (1 << 53))
+
+
+def _prob_table() -> List[str]:
+    # Same text pydantic emits for these floats, so generated rows round-trip byte-for-byte.
+    return [repr(round(k / 100, 2)) for k in range(101)]
+
+
+def _join(*columns: Union[str, List[str], np.ndarray]) -> List[str]:
+    """Row-wise concatenation of string columns; plain strings repeat on every row."""
+    parts = [
+        itertools.repeat(column) if isinstance(column, str) else (column.tolist() if isinstance(column, np.ndarray) else column)
+        for column in columns
+    ]
+    return list(map("".join, zip(*parts)))
+
+
+@dataclass
+class SyntheticPaths:
+    events: Path
+    predictions: Path
+    resolutions: Path
+    prices: Path
+    size: int
+    files: Dict[str, Path] = field(default_factory=dict)
+
+
+class SyntheticGenerator:
+    """
+    Deterministic corpus of events with matching predictions, resolutions and daily price series.
+
+    Every row is a pure function of `(seed, row index)` via counter-based hashing, so output does
+    not depend on `chunk_size` and any slice can be regenerated on its own. Rows are produced with
+    NumPy a chunk at a time and formatted from lookup tables into exactly the JSON the
+    `agentbeats.models` would dump; price-close outcomes agree with the generated price series,
+    which are written in Alpha Vantage `TIME_SERIES_DAILY` layout.
+
+    Examples
+    --------
+    >>> paths = SyntheticGenerator(seed=7).write(Path("data/generated/synthetic"), size=10_000_000)
+    >>> paths.events
+    PosixPath('data/generated/synthetic/events.jsonl')
+    """
+
+    def __init__(
+        self,
+        seed: int = 0,
+        tickers: Sequence[str] = DEFAULT_TICKERS,
+        anchor: date = DEFAULT_ANCHOR,
+        horizon_days: int = 365,
+        chunk_size: int = 250_000,
+    ):
+        self.seed = seed
+        self.tickers = [ticker.upper() for ticker in tickers]
+        self.anchor = anchor
+        self.horizon_days = horizon_days
+        self.chunk_size = chunk_size
+        self.days = [anchor + timedelta(days=offset) for offset in range(horizon_days + 1)]
+        self._closes = self._price_paths()
+        self._lookup = self._tables()
+        self._prediction_tail = (
+            ',"rationale":null,"analysis":"synthetic"},"metadata":{"model":"synthetic",'
+            f'"timestamp":"{anchor.isoformat()}T00:00:00Z","version":"0.1.0","predictor_id":"synthetic_v0"}}}}\n'
+        )
+
+    def _price_paths(self) -> np.ndarray:
+        """Close per (ticker, calendar day), carried forward over weekends."""
+        closes = np.empty((len(self.tickers), len(self.days)), dtype=np.float64)
+        business = self._business_mask()
+        # Index of the latest business day on or before each calendar day.
+        latest = np.maximum(np.cumsum(business) - 1, 0)
+        for position in range(len(self.tickers)):
+            rng = np.random.default_rng([self.seed, position])
+            steps = rng.normal(0.0005, 0.02, size=int(business.sum()))
+            path = np.round(rng.uniform(50, 500) * np.exp(np.cumsum(steps)), 2)
+            closes[position] = path[latest]
+        return closes
+
+    def _business_mask(self) -> np.ndarray:
+        calendar = np.array([day.isoformat() for day in self.days], dtype="datetime64[D]")
+        return np.is_busday(calendar)
+
+    def write_prices(self, directory: Path) -> Dict[str, Path]:
+        """Write one Alpha Vantage style daily series per ticker (business days only)."""
+        directory.mkdir(parents=True, exist_ok=True)
+        business = self._business_mask()
+        files: Dict[str, Path] = {}
+        for position, ticker in enumerate(self.tickers):
+            points = {}
+            for offset in np.flatnonzero(business)[::-1]:
+                close = self._closes[position, offset]
+                points[self.days[offset].isoformat()] = {
+                    "1. open": f"{close * 0.995:.4f}",
+                    "2. high": f"{close * 1.01:.4f}",
+                    "3. low": f"{close * 0.99:.4f}",
+                    "4. close": f"{close:.4f}",
+                    "5. volume": str(1_000_000 + offset * 1_000),
+                }
+            payload = {"Meta Data": {"2. Symbol": ticker}, "Time Series (Daily)": points}
+            path = directory / f"{ticker}_TIME_SERIES_DAILY.json"
+            with path.open("w", encoding="utf-8") as handle:
+                json.dump(payload, handle)
+            files[ticker] = path
+        return files
+
+    def _tables(self) -> Dict[str, np.ndarray]:
+        """JSON fragments for every (kind, ticker, day) so rows are assembled by array lookups."""
+        tickers, days = self.tickers, [day.isoformat() for day in self.days]
+        questions, events, resolutions = [], [], []
+        for kind in (_PRICE, _EPS, _SPLIT):
+            for symbol in tickers:
+                for offset, day in enumerate(days):
+                    if kind == _EPS:
+                        questions.append(f"Will {symbol} beat EPS guidance for Q{(offset // 91) % 4 + 1} {day[:4]}?")
+                    elif kind == _SPLIT:
+                        questions.append(f"Will {symbol} announce a stock split by {day}?")
+                    else:
+                        questions.append("")  # filled per row with the target price
+        for symbol in tickers:
+            tags = json.dumps([symbol.lower()])
+            for offset, day in enumerate(days):
+                events.append(
+                    f'","domain":"finance","resolution_date":"{day}T16:00:00Z",'
+                    f'"source":{{"type":"synthetic","market_id":"{symbol}","url":null,"resolution_date":null}},'
+                    f'"ground_truth_source":"synthetic","forecast_horizon_days":{offset},"tags":{tags},'
+                    '"baseline_probability":'
+                )
+        for priced in (False, True):
+            for position in range(len(tickers)):
+                for offset, day in enumerate(days):
+                    verified = repr(float(self._closes[position, offset])) if priced else "null"
+                    source = "synthetic_price" if priced else "synthetic"
+                    resolutions.append(
+                        f',"verified_value":{verified},"verified_source":"{source}","resolved_at":"{day}T16:00:00Z"}}\n'
+                    )
+        ceiling = int(self._closes.max() * 1.2) + 2
+        return {
+            "questions": np.array(questions, dtype=object),
+            "events": np.array(events, dtype=object),
+            "resolutions": np.array(resolutions, dtype=object),
+            "price_prefix": np.array([f"Will {symbol} close above $" for symbol in tickers], dtype=object),
+            "price_suffix": np.array([f" on {day}?" for day in days], dtype=object),
+            "integers": np.array([str(value) for value in range(ceiling)], dtype=object),
+            "probabilities": np.array(_prob_table(), dtype=object),
+            "outcomes": np.array(["0", "1"], dtype=object),
+        }
+
+    def chunk(self, start: int, stop: int) -> tuple[List[str], List[str], List[str]]:
+        """Serialized (events, predictions, resolutions) lines for rows `start..stop-1`."""
+        index = np.arange(start, stop, dtype=np.uint64)
+        seed, width = self.seed, len(self.days)
+        ticker = (_uniform(index, seed, _STREAM_TICKER) * len(self.tickers)).astype(np.int64)
+        kind = (_uniform(index, seed, _STREAM_KIND) * 3).astype(np.int64)
+        offset = 1 + (_uniform(index, seed, _STREAM_DAY) * self.horizon_days).astype(np.int64)
+        close = self._closes[ticker, offset]
+        target = np.rint(close * (0.85 + 0.3 * _uniform(index, seed, _STREAM_TARGET))).astype(np.int64)
+        baseline = np.rint(5 + 90 * _uniform(index, seed, _STREAM_BASELINE)).astype(np.int64)
+        prediction = np.clip(
+            baseline + np.rint((_uniform(index, seed, _STREAM_PREDICTION) - 0.5) * 30).astype(np.int64), 1, 99
+        )
+        priced = kind == _PRICE
+        outcome = np.where(priced, close > target, _uniform(index, seed, _STREAM_OUTCOME) * 100 < baseline)
+
+        # Columns come from lookup tables by fancy indexing; each line is then one C-level join.
+        tables = self._lookup
+        cell = ticker * width + offset
+        ids = [f'{{"id":"syn_{row}' for row in range(start, stop)]
+        question = tables["questions"][kind * len(self.tickers) * width + cell]
+        question[priced] = (
+            tables["price_prefix"][ticker[priced]]
+            + tables["integers"][target[priced]]
+            + tables["price_suffix"][offset[priced]]
+        )
+        events = _join(ids, '","question":"', question, tables["events"][cell], tables["probabilities"][baseline], "}\n")
+        predictions = _join(
+            ids, '","prediction":{"probability":', tables["probabilities"][prediction], self._prediction_tail
+        )
+        resolutions = _join(
+            ids,
+            '","outcome":',
+            tables["outcomes"][outcome.astype(np.int64)],
+            tables["resolutions"][priced.astype(np.int64) * len(self.tickers) * width + cell],
+        )
+        return events, predictions, resolutions
+
+    @staticmethod
+    def check(events: List[str], predictions: List[str], resolutions: List[str]) -> None:
+        """Assert sample lines round-trip through the real models unchanged."""
+        for model, lines in ((EventSpec, events), (PredictionRecord, predictions), (ResolutionRecord, resolutions)):
+            if lines:
+                line = lines[0].rstrip("\n")
+                if model.model_validate_json(line).model_dump_json() != line:
+                    raise ValueError(f"Synthetic {model.__name__} row does not match the model schema: {line}")
+
+    def write(self, directory: Path, size: int, prices: bool = True, suffix: str = ".jsonl") -> SyntheticPaths:
+        """
+        Stream `size` rows into events/predictions/resolutions JSONL under `directory`.
+
+        `suffix` may be ".jsonl.gz" / ".jsonl.zst" for compressed files.
+        """
+        directory.mkdir(parents=True, exist_ok=True)
+        paths = SyntheticPaths(
+            events=directory / f"events{suffix}",
+            predictions=directory / f"predictions{suffix}",
+            resolutions=directory / f"resolutions{suffix}",
+            prices=directory / "prices",
+            size=size,
+        )
+        with open_jsonl_writer(paths.events) as events, open_jsonl_writer(
+            paths.predictions
+        ) as predictions, open_jsonl_writer(paths.resolutions) as resolutions:
+            for start in range(0, size, self.chunk_size):
+                rows = self.chunk(start, min(start + self.chunk_size, size))
+                if start == 0:
+                    self.check(*rows)
+                events.writelines(rows[0])
+                predictions.writelines(rows[1])
+                resolutions.writelines(rows[2])
+        if prices:
+            paths.files = self.write_prices(paths.prices)
+        return paths
+
+
+def generate(
+    directory: Path,
+    size: int,
+    seed: int = 0,
+    tickers: Optional[Sequence[str]] = None,
+    chunk_size: int = 250_000,
+) -> SyntheticPaths:
+    """Convenience wrapper around `SyntheticGenerator(...).write(...)`."""
+    generator = SyntheticGenerator(seed=seed, tickers=tickers or DEFAULT_TICKERS, chunk_size=chunk_size)
+    return generator.write(directory, size)
@@ -1,15 +1,32 @@
 """Shared tool adapters used by both predictor and evaluator agents."""
 
 from .alpha_vantage import AlphaVantageClient
-from .base import ToolLogger
+from .base import SingleFlight, ToolLogger
+from .cache import MemoryCache, get_memory_cache
+from .cassette import Cassette, CassetteMiss
 from .edgar import EdgarEvidenceFetcher
+from .http import HttpTransport, RateLimiter, get_transport, set_cassette
 from .news import NewsEvidenceFetcher
 from .polymarket import PolymarketClient
+from .price_series import PriceSeries
+from .store import ToolCache, get_tool_cache
 
 __all__ = [
     "AlphaVantageClient",
+    "Cassette",
+    "CassetteMiss",
     "EdgarEvidenceFetcher",
+    "HttpTransport",
+    "MemoryCache",
     "NewsEvidenceFetcher",
     "PolymarketClient",
+    "PriceSeries",
+    "RateLimiter",
+    "SingleFlight",
+    "ToolCache",
     "ToolLogger",
+    "get_memory_cache",
+    "get_tool_cache",
+    "get_transport",
+    "set_cassette",
 ]
@@ -1,28 +1,53 @@
-"""Alpha Vantage client for financial time-series with simple caching."""
+"""Alpha Vantage client for financial time-series backed by the shared tool cache."""
 
 from __future__ import annotations
 
 import os
 import json
-from datetime import datetime, timezone
+import threading
+from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Tuple
 
-import requests
+import numpy as np
 
 from .base import ToolLogger
+from .http import HttpTransport, get_transport
+from .price_series import PriceSeries
+from .cassette import CassetteMiss
+from .store import CacheEntry, ToolCache, cache_dir_for, tool_cache_for
 
 
 class AlphaVantageClient:
     BASE_URL = "https://www.alphavantage.co/query"
 
-    def __init__(self, api_key: Optional[str] = None, logger: Optional[ToolLogger] = None, cache_dir: Optional[Path] = None):
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        logger: Optional[ToolLogger] = None,
+        cache_dir: Optional[Path] = None,
+        transport: Optional[HttpTransport] = None,
+        tool_cache: Optional[ToolCache] = None,
+        incremental: bool = True,
+    ):
         self.api_key = api_key or os.getenv("ALPHAVANTAGE_API_KEY")
+        self.transport = transport or get_transport()
         self.logger = logger or ToolLogger("alpha_vantage", Path("data/generated/tool_logs"))
-        self.cache_dir = cache_dir or Path("data/generated/tool_cache/alpha_vantage")
-        self.cache_dir.mkdir(parents=True, exist_ok=True)
-        self._memory_cache: Dict[tuple[str, str], Dict[str, Any]] = {}
-        self.last_from_cache: bool = False
+        # Legacy per-symbol JSON cache location, read once to seed the shared tool cache.
+        self.cache_dir = cache_dir or cache_dir_for(self.transport, Path("data/generated/tool_cache/alpha_vantage"))
+        self.tool_cache = tool_cache or tool_cache_for(self.transport)
+        # Refresh stale histories from the compact window instead of refetching everything.
+        self.incremental = incremental
+        self._local = threading.local()
+
+    @property
+    def last_from_cache(self) -> bool:
+        """Whether the calling thread's most recent fetch was served from cache."""
+        return getattr(self._local, "last_from_cache", False)
+
+    @last_from_cache.setter
+    def last_from_cache(self, value: bool) -> None:
+        self._local.last_from_cache = value
 
     def is_configured(self) -> bool:
         return bool(self.api_key)
@@ -31,55 +56,174 @@ class AlphaVantageClient:
         safe_symbol = symbol.replace("/", "-")
         return self.cache_dir / f"{safe_symbol}_{function}.json"
 
-    def _load_cache(self, symbol: str, function: str) -> Optional[Dict[str, Any]]:
-        key = (function, symbol)
-        if key in self._memory_cache:
-            self.last_from_cache = True
-            return self._memory_cache[key]
+    def _load_cache(self, symbol: str, function: str) -> Optional[CacheEntry]:
+        params = {"function": function, "symbol": symbol}
+        entry = self.tool_cache.lookup("alpha_vantage", "query", params)
+        if entry is not None:
+            return entry
+        # Seed the shared store from a legacy per-symbol JSON file, keeping its fetched_at.
         path = self._cache_path(symbol, function)
         if path.exists():
             try:
                 with path.open("r", encoding="utf-8") as handle:
-                    data = json.load(handle)
-                    self._memory_cache[key] = data
-                    self.last_from_cache = True
-                    return data
+                    legacy = json.load(handle)
+                fetched_at = datetime.fromisoformat(legacy["fetched_at"]) if legacy.get("fetched_at") else None
+                return self.tool_cache.store("alpha_vantage", "query", params, legacy.get("data", legacy), fetched_at)
             except Exception:
                 return None
         return None
 
-    def _save_cache(self, symbol: str, function: str, data: Dict[str, Any]) -> None:
-        key = (function, symbol)
-        self._memory_cache[key] = data
-        path = self._cache_path(symbol, function)
-        try:
-            with path.open("w", encoding="utf-8") as handle:
-                json.dump({"fetched_at": datetime.now(timezone.utc).isoformat(), "data": data}, handle)
-        except Exception:
-            pass
-
-    def fetch_time_series(self, symbol: str, function: str = "TIME_SERIES_DAILY") -> Dict[str, Any]:
-        if not self.api_key:
-            raise RuntimeError("Alpha Vantage API key not configured (set ALPHAVANTAGE_API_KEY).")
-
-        cached = self._load_cache(symbol, function)
-        if cached:
-            return cached.get("data", cached)
-
+    def _request(self, symbol: str, function: str, outputsize: str) -> Dict[str, Any]:
         params = {
             "function": function,
             "symbol": symbol,
+            "outputsize": outputsize,
             "apikey": self.api_key,
         }
-        response = requests.get(self.BASE_URL, params=params, timeout=30)
+        response = self.transport.get(self.BASE_URL, params=params, timeout=30)
         response.raise_for_status()
         data = response.json()
-        self.last_from_cache = False
         self.logger.log({
             "tool": "alpha_vantage",
             "function": function,
             "symbol": symbol,
+            "outputsize": outputsize,
             "status": response.status_code,
         })
-        self._save_cache(symbol, function, data)
         return data
+
+    @staticmethod
+    def _api_message(data: Dict[str, Any]) -> Optional[str]:
+        """Alpha Vantage reports throttling and bad requests as 200s with one of these keys."""
+        for key in ("Error Message", "Note", "Information"):
+            if key in data:
+                return str(data[key])
+        return None
+
+    @staticmethod
+    def _series_key(data: Dict[str, Any]) -> Optional[str]:
+        return next((key for key in data if "Time Series" in key), None)
+
+    def _fetch_full(self, symbol: str, function: str) -> Dict[str, Any]:
+        data = self._request(symbol, function, "full")
+        if self._api_message(data) and not self._series_key(data):
+            # Full history is a premium feature for some endpoints; fall back to the recent window.
+            data = self._request(symbol, function, "compact")
+        return data
+
+    @staticmethod
+    def _has_gap(function: str, last_known: str, recent: Dict[str, Any]) -> bool:
+        """
+        Whether bars are missing between the cached history's last bar and the compact window.
+
+        Daily series compare business days (a window starting on the next weekday is adjacent; a
+        market holiday only costs a full refetch). Coarser or intraday series allow at most the
+        window's largest spacing between consecutive bars.
+        """
+        first = min(recent)
+        if first <= last_known:
+            return False
+        if "DAILY" in function:
+            start = np.datetime64(last_known, "D") + np.timedelta64(1, "D")
+            return int(np.busday_count(start, np.datetime64(first, "D"))) > 0
+        stamps = np.array(sorted(recent), dtype="datetime64[s]")
+        spacing = np.diff(stamps).max() if len(stamps) > 1 else np.timedelta64(0, "s")
+        return np.datetime64(first, "s") - np.datetime64(last_known, "s") > spacing
+
+    @staticmethod
+    def _merged_meta(history: Dict[str, Any], update: Dict[str, Any]) -> Dict[str, Any]:
+        """The update's metadata (last refreshed, ...), keeping the stored history's output size."""
+        previous = history.get("Meta Data") or {}
+        meta = {**previous, **(update.get("Meta Data") or {})}
+        for name, value in previous.items():
+            if name.endswith("Output Size"):
+                meta[name] = value
+        return meta
+
+    def _fetch_update(self, symbol: str, function: str, history: Dict[str, Any]) -> Dict[str, Any]:
+        update = self._request(symbol, function, "compact")
+        key = self._series_key(history)
+        if self._api_message(update) or not key or key not in update:
+            return update
+        known, recent = history.get(key) or {}, update.get(key) or {}
+        if known and recent and self._has_gap(function, max(known), recent):
+            # The cache is older than the compact window; backfill the gap with a full fetch.
+            full = self._fetch_full(symbol, function)
+            if not self._api_message(full) and key in full:
+                return full
+        merged = dict(update)
+        if "Meta Data" in history or "Meta Data" in update:
+            merged["Meta Data"] = self._merged_meta(history, update)
+        merged[key] = dict(sorted({**known, **recent}.items(), reverse=True))
+        return merged
+
+    def fetch_time_series(self, symbol: str, function: str = "TIME_SERIES_DAILY") -> Dict[str, Any]:
+        """
+        Return the series for (symbol, function), keeping one full history in the tool cache.
+
+        A fresh cache entry is served as-is. A missing entry triggers a full-history fetch; a stale
+        one (with `incremental`) fetches only the compact recent window and merges the new bars
+        into the stored history. Throttling/error payloads are never cached, and the stale history
+        is served when a refresh fails.
+        """
+        return self._fetch(symbol, function)[0]
+
+    def _fetch(self, symbol: str, function: str) -> Tuple[Dict[str, Any], Optional[datetime]]:
+        """(payload, fetched_at of the cache entry it is), with None for payloads that were not cached."""
+        if not self.api_key:
+            raise RuntimeError("Alpha Vantage API key not configured (set ALPHAVANTAGE_API_KEY).")
+
+        cached = self._load_cache(symbol, function)
+        if cached and cached.fresh:
+            self.last_from_cache = True
+            return cached.data, cached.fetched_at
+
+        try:
+            if cached is None or not self.incremental:
+                data = self._fetch_full(symbol, function)
+            else:
+                data = self._fetch_update(symbol, function, cached.data)
+        except CassetteMiss:
+            raise
+        except Exception:
+            if cached:
+                # Serve the stale series rather than failing the caller.
+                self.last_from_cache = True
+                return cached.data, cached.fetched_at
+            raise
+        message = self._api_message(data)
+        if message:
+            self.logger.log({
+                "tool": "alpha_vantage",
+                "mode": "api_message",
+                "function": function,
+                "symbol": symbol,
+                "message": message,
+            })
+            if cached:
+                self.last_from_cache = True
+                return cached.data, cached.fetched_at
+            self.last_from_cache = False
+            return data, None
+        self.last_from_cache = False
+        entry = self.tool_cache.store("alpha_vantage", "query", {"function": function, "symbol": symbol}, data)
+        return data, entry.fetched_at
+
+    def price_series(self, symbol: str, function: str = "TIME_SERIES_DAILY") -> PriceSeries:
+        """
+        `fetch_time_series` as a columnar `PriceSeries`, rebuilt only when the payload changes.
+
+        Built series live in the tool cache's byte-bounded `MemoryCache`, keyed by the payload's
+        `fetched_at`, so a refreshed payload gets a new series and old ones are evicted like any
+        other entry.
+        """
+        data, fetched_at = self._fetch(symbol, function)
+        if fetched_at is None:
+            return PriceSeries.from_alpha_vantage(data)
+        memory = self.tool_cache.memory_cache
+        key = ("price_series", str(self.tool_cache.path), symbol, function, fetched_at.timestamp())
+        series = memory.get(key)
+        if series is None:
+            series = PriceSeries.from_alpha_vantage(data)
+            memory.put(key, series, series.nbytes)
+        return series
@@ -2,24 +2,217 @@
 
 from __future__ import annotations
 
+import atexit
 import json
+import queue
+import threading
+import time
+from concurrent.futures import Future
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Callable, Dict, Hashable, Iterable, List, Optional
+
+
+class _LogWriter:
+    """
+    Background writer that owns one JSONL log file.
+
+    Callers enqueue finished lines; a single daemon thread appends them in batches, flushing once
+    `flush_bytes` are buffered or `flush_interval` seconds pass, and rotates the file to `.1`, `.2`,
+    ... once it would exceed `max_bytes`. One writer per path keeps lines from interleaving. Once
+    closed (at exit), lines still submitted are appended directly instead of being dropped.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        flush_bytes: int = 64 * 1024,
+        flush_interval: float = 1.0,
+        max_bytes: int = 50 * 1024 * 1024,
+        backups: int = 5,
+    ):
+        self.path = path
+        self.flush_bytes = flush_bytes
+        self.flush_interval = flush_interval
+        self.max_bytes = max_bytes
+        self.backups = backups
+        self._queue: "queue.SimpleQueue[Any]" = queue.SimpleQueue()
+        self._closed = False
+        self._lock = threading.Lock()
+        self._thread = threading.Thread(target=self._run, name=f"toollog-{path.stem}", daemon=True)
+        self._thread.start()
+
+    def submit(self, line: str) -> None:
+        with self._lock:
+            if not self._closed:
+                self._queue.put(line)
+                return
+            # Let the thread write what it already had first, so lines stay in order.
+            self._thread.join()
+            self._write([line])
+
+    def flush(self) -> None:
+        """Block until everything submitted so far is on disk."""
+        done = threading.Event()
+        # Under the lock, so the marker is queued ahead of close()'s None and the thread still sets it.
+        with self._lock:
+            if self._closed:
+                return
+            self._queue.put(done)
+        done.wait()
+
+    def close(self) -> None:
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            self._queue.put(None)
+        self._thread.join()
+
+    def _rotate(self) -> None:
+        for index in range(self.backups - 1, 0, -1):
+            source = self.path.with_name(f"{self.path.name}.{index}")
+            if source.exists():
+                source.replace(self.path.with_name(f"{self.path.name}.{index + 1}"))
+        if self.backups > 0:
+            self.path.replace(self.path.with_name(f"{self.path.name}.1"))
+        else:
+            self.path.unlink()
+
+    def _write(self, lines: List[str]) -> None:
+        if not lines:
+            return
+        chunk = "".join(lines).encode("utf-8")
+        try:
+            if self.path.exists() and self.path.stat().st_size + len(chunk) > self.max_bytes:
+                self._rotate()
+            with self.path.open("ab") as handle:
+                handle.write(chunk)
+        except OSError:
+            # Logging must never take down a predictor run.
+            pass
+
+    def _run(self) -> None:
+        buffer: List[str] = []
+        buffered = 0
+        deadline = time.monotonic() + self.flush_interval
+        while True:
+            timeout = max(deadline - time.monotonic(), 0.0)
+            try:
+                item = self._queue.get(timeout=timeout)
+            except queue.Empty:
+                item = ""
+            if isinstance(item, str) and item:
+                buffer.append(item)
+                buffered += len(item)
+                if buffered < self.flush_bytes and time.monotonic() < deadline:
+                    continue
+            self._write(buffer)
+            buffer, buffered = [], 0
+            deadline = time.monotonic() + self.flush_interval
+            if isinstance(item, threading.Event):
+                item.set()
+            elif item is None:
+                return
+
+
+_writers: Dict[Path, _LogWriter] = {}
+_writers_lock = threading.Lock()
+
+
+def _writer_for(path: Path, **options: Any) -> _LogWriter:
+    key = path.resolve()
+    with _writers_lock:
+        writer = _writers.get(key)
+        if writer is None:
+            writer = _writers[key] = _LogWriter(path, **options)
+        return writer
+
+
+@atexit.register
+def _close_writers() -> None:
+    with _writers_lock:
+        writers = list(_writers.values())
+        _writers.clear()
+    for writer in writers:
+        writer.close()
+
+
+class SingleFlight:
+    """
+    Coalesce concurrent requests for the same keys into one upstream call.
+
+    The first caller to ask for a key owns it and runs the fetch; callers that arrive while it is in
+    flight wait for that result (or exception) instead of issuing their own request. Nothing is kept
+    once the call finishes, so this complements rather than replaces a cache.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._inflight: Dict[Hashable, Future] = {}
+
+    def do(self, key: Hashable, fetch: Callable[[], Any]) -> Any:
+        return self.do_many([key], lambda _keys: {key: fetch()})[key]
+
+    def do_many(
+        self,
+        keys: Iterable[Hashable],
+        fetch: Callable[[List[Hashable]], Dict[Hashable, Any]],
+    ) -> Dict[Hashable, Any]:
+        """Resolve `keys`, calling `fetch` only for those not already in flight (missing -> None)."""
+        owned: List[Hashable] = []
+        waiting: Dict[Hashable, Future] = {}
+        with self._lock:
+            for key in dict.fromkeys(keys):
+                future = self._inflight.get(key)
+                if future is None:
+                    future = self._inflight[key] = Future()
+                    owned.append(key)
+                waiting[key] = future
+        if owned:
+            try:
+                results = fetch(owned)
+            except BaseException as exc:
+                self._finish(owned, waiting, error=exc)
+            else:
+                self._finish(owned, waiting, results=results)
+        return {key: future.result() for key, future in waiting.items()}
+
+    def _finish(
+        self,
+        owned: List[Hashable],
+        futures: Dict[Hashable, Future],
+        results: Optional[Dict[Hashable, Any]] = None,
+        error: Optional[BaseException] = None,
+    ) -> None:
+        with self._lock:
+            for key in owned:
+                self._inflight.pop(key, None)
+        for key in owned:
+            if error is not None:
+                futures[key].set_exception(error)
+            else:
+                futures[key].set_result((results or {}).get(key))
 
 
 class ToolLogger:
-    """Simple JSONL logger for tool requests/responses."""
+    """Buffered JSONL logger for tool requests/responses (see `_LogWriter` for flush/rotation)."""
 
-    def __init__(self, tool_name: str, log_dir: Path | None = None):
+    def __init__(self, tool_name: str, log_dir: Path | None = None, **writer_options: Any):
         self.tool_name = tool_name
         self.log_dir = log_dir or Path("data/generated/tool_logs")
         self.log_dir.mkdir(parents=True, exist_ok=True)
         self.log_path = self.log_dir / f"{tool_name}.jsonl"
+        self._writer: Optional[_LogWriter] = None
+        self._writer_options = writer_options
 
     def log(self, payload: Dict[str, Any]) -> None:
         timestamp = datetime.now(timezone.utc).isoformat()
         entry = {"timestamp": timestamp, **payload}
-        with self.log_path.open("a", encoding="utf-8") as handle:
-            handle.write(json.dumps(entry))
-            handle.write("\n")
+        if self._writer is None:
+            self._writer = _writer_for(self.log_path, **self._writer_options)
+        self._writer.submit(json.dumps(entry) + "\n")
+
+    def flush(self) -> None:
+        if self._writer is not None:
+            self._writer.flush()
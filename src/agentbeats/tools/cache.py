@@ -0,0 +1,89 @@
+"""In-process, byte-bounded LRU cache shared by tool clients."""
+
+from __future__ import annotations
+
+import os
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Optional
+
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+
+
+class MemoryCache:
+    """
+    Thread-safe LRU cache for decoded tool documents, evicting by size.
+
+    Sizes are the serialized (JSON) byte length supplied by the caller, which is a stable proxy for
+    the decoded object's footprint; least recently used entries are dropped once the total exceeds
+    `max_bytes`. Documents larger than the ceiling are not cached at all.
+    """
+
+    def __init__(self, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.max_bytes = max_bytes
+        self._entries: "OrderedDict[Hashable, tuple[Any, int]]" = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def put(self, key: Hashable, value: Any, size: int) -> None:
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._bytes -= previous[1]
+            if size > self.max_bytes:
+                return
+            self._entries[key] = (value, size)
+            self._bytes += size
+            while self._bytes > self.max_bytes and self._entries:
+                _, (_, evicted_size) = self._entries.popitem(last=False)
+                self._bytes -= evicted_size
+                self.evictions += 1
+
+    def discard(self, key: Hashable) -> None:
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._bytes -= previous[1]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+            }
+
+
+_default_cache: Optional[MemoryCache] = None
+_default_lock = threading.Lock()
+
+
+def get_memory_cache() -> MemoryCache:
+    """Return the process-wide cache (ceiling from AGENTBEATS_TOOL_CACHE_MB, default 256)."""
+    global _default_cache
+    with _default_lock:
+        if _default_cache is None:
+            megabytes = float(os.getenv("AGENTBEATS_TOOL_CACHE_MB", DEFAULT_MAX_BYTES / (1024 * 1024)))
+            _default_cache = MemoryCache(max_bytes=int(megabytes * 1024 * 1024))
+        return _default_cache
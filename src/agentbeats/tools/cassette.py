@@ -0,0 +1,218 @@
+"""Record/replay store for tool HTTP traffic (deterministic offline runs)."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import sqlite3
+import tempfile
+import threading
+import time
+import zlib
+from pathlib import Path
+from typing import Any, Dict, Mapping, Optional, Union
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+try:  # Optional: smaller cassettes when zstandard is installed.
+    import zstandard
+except ImportError:  # pragma: no cover - depends on environment
+    zstandard = None
+
+DEFAULT_CASSETTE_PATH = Path("data/generated/cassettes/tools.sqlite3")
+CASSETTE_MODES = ("off", "record", "replay")
+
+# Query parameters that carry credentials; they never reach the key or the stored request.
+_SECRET_PARAMS = {"apikey", "api_key", "token", "access_token", "key"}
+# Response headers worth keeping (everything else is transport noise).
+_KEPT_HEADERS = {"content-type", "content-encoding", "date", "etag", "last-modified"}
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS interactions (
+    key TEXT PRIMARY KEY,
+    method TEXT NOT NULL,
+    url TEXT NOT NULL,
+    params TEXT NOT NULL,
+    status INTEGER NOT NULL,
+    reason TEXT,
+    headers TEXT NOT NULL,
+    codec TEXT NOT NULL,
+    body BLOB NOT NULL,
+    elapsed REAL NOT NULL,
+    recorded_at REAL NOT NULL
+)
+"""
+
+
+class CassetteMiss(RuntimeError):
+    """
+    Raised in replay mode when no recorded interaction matches a request.
+
+    Deliberately not a `requests` error: tool clients let it propagate instead of falling back to
+    stale cache entries or fixtures, so a replay cannot silently diverge from its recording.
+    """
+
+
+def _public_params(params: Optional[Mapping[str, Any]]) -> Dict[str, Any]:
+    return {key: value for key, value in (params or {}).items() if key.lower() not in _SECRET_PARAMS}
+
+
+def interaction_key(method: str, url: str, params: Optional[Mapping[str, Any]] = None) -> str:
+    """Stable key for a request: method, URL and canonical (secret-free) query parameters."""
+    canonical = json.dumps(
+        [method.upper(), url, _public_params(params)], sort_keys=True, separators=(",", ":"), default=str
+    )
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+class Cassette:
+    """
+    SQLite cassette of full request/response pairs, one row per distinct request.
+
+    Bodies are zstd-compressed when available (zlib otherwise) and indexed by `interaction_key`, so
+    replay is a primary-key lookup. Re-recording a request replaces the previous row. In replay,
+    `latency` adds a fixed delay in seconds per response, or "recorded" sleeps for the time the
+    original request took.
+
+    While a cassette is attached, tool clients use caches private to it (`scratch_dir`, and a
+    scratch `ToolCache`), so every response a run uses passes through the cassette: record runs
+    capture all of them and replays never depend on what the local caches hold.
+
+    Examples
+    --------
+    >>> cassette = Cassette(Path("/tmp/tools.sqlite3"), mode="record")
+    >>> transport = HttpTransport(cassette=cassette)   # live requests are captured
+    >>> replay = Cassette(Path("/tmp/tools.sqlite3"), mode="replay", latency="recorded")
+    """
+
+    def __init__(
+        self,
+        path: Optional[Path] = None,
+        mode: str = "replay",
+        latency: Union[float, str, None] = None,
+    ):
+        if mode not in CASSETTE_MODES:
+            raise ValueError(f"Unknown cassette mode '{mode}' (expected one of {', '.join(CASSETTE_MODES)})")
+        self.path = Path(path or DEFAULT_CASSETTE_PATH)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.mode = mode
+        self.latency = latency
+        self._local = threading.local()
+        self._scratch: Optional[tempfile.TemporaryDirectory] = None
+        self._scratch_lock = threading.Lock()
+
+    @property
+    def active(self) -> bool:
+        return self.mode != "off"
+
+    def scratch_dir(self, name: str) -> Path:
+        """Temporary directory `name` private to this cassette (removed with it)."""
+        with self._scratch_lock:
+            if self._scratch is None:
+                self._scratch = tempfile.TemporaryDirectory(prefix="agentbeats-cassette-", ignore_cleanup_errors=True)
+        path = Path(self._scratch.name) / name
+        path.mkdir(parents=True, exist_ok=True)
+        return path
+
+    def _connection(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=30)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(_SCHEMA)
+            conn.commit()
+            self._local.conn = conn
+        return conn
+
+    @staticmethod
+    def _compress(body: bytes) -> tuple[str, bytes]:
+        if zstandard is not None:
+            return "zstd", zstandard.ZstdCompressor(level=3).compress(body)
+        return "zlib", zlib.compress(body, 6)
+
+    @staticmethod
+    def _decompress(codec: str, payload: bytes) -> bytes:
+        if codec == "zstd":
+            if zstandard is None:
+                raise CassetteMiss("Cassette entry is zstd-compressed but zstandard is not installed")
+            return zstandard.ZstdDecompressor().decompress(payload)
+        if codec == "zlib":
+            return zlib.decompress(payload)
+        return payload
+
+    def record(
+        self,
+        method: str,
+        url: str,
+        params: Optional[Mapping[str, Any]],
+        response: requests.Response,
+        elapsed: float,
+    ) -> None:
+        """Store `response` (its body is read in full) as the answer to this request."""
+        codec, body = self._compress(response.content)
+        headers = {key: value for key, value in response.headers.items() if key.lower() in _KEPT_HEADERS}
+        headers.pop("Content-Encoding", None)  # `content` is already decoded
+        conn = self._connection()
+        with conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO interactions "
+                "(key, method, url, params, status, reason, headers, codec, body, elapsed, recorded_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    interaction_key(method, url, params),
+                    method.upper(),
+                    url,
+                    json.dumps(_public_params(params), sort_keys=True, default=str),
+                    response.status_code,
+                    response.reason,
+                    json.dumps(headers),
+                    codec,
+                    body,
+                    elapsed,
+                    time.time(),
+                ),
+            )
+
+    def replay(self, method: str, url: str, params: Optional[Mapping[str, Any]] = None) -> requests.Response:
+        """Rebuild the recorded response for this request, or raise `CassetteMiss`."""
+        row = self._connection().execute(
+            "SELECT status, reason, headers, codec, body, elapsed FROM interactions WHERE key = ?",
+            (interaction_key(method, url, params),),
+        ).fetchone()
+        if row is None:
+            raise CassetteMiss(f"No recorded response for {method.upper()} {url} {_public_params(params)}")
+        status, reason, headers, codec, body, elapsed = row
+        delay = elapsed if self.latency == "recorded" else float(self.latency or 0.0)
+        if delay > 0:
+            time.sleep(delay)
+        response = requests.Response()
+        response.status_code = status
+        response.reason = reason
+        response.headers = CaseInsensitiveDict(json.loads(headers))
+        response.url = requests.Request(method.upper(), url, params=_public_params(params)).prepare().url
+        response._content = self._decompress(codec, body)
+        # Mark the body as read so iter_content() replays it in chunks like a streamed response.
+        response._content_consumed = True
+        return response
+
+    def stats(self) -> Dict[str, int]:
+        count, size = self._connection().execute(
+            "SELECT COUNT(*), COALESCE(SUM(LENGTH(body)), 0) FROM interactions"
+        ).fetchone()
+        return {"interactions": count, "bytes": size}
+
+
+def cassette_from_env() -> Optional[Cassette]:
+    """Cassette configured by AGENTBEATS_CASSETTE_MODE/_PATH/_LATENCY, or None when off."""
+    mode = os.getenv("AGENTBEATS_CASSETTE_MODE", "off").strip().lower() or "off"
+    if mode == "off":
+        return None
+    raw_latency = os.getenv("AGENTBEATS_CASSETTE_LATENCY", "").strip()
+    latency: Union[float, str, None] = None
+    if raw_latency == "recorded":
+        latency = raw_latency
+    elif raw_latency:
+        latency = float(raw_latency)
+    return Cassette(Path(os.getenv("AGENTBEATS_CASSETTE_PATH") or DEFAULT_CASSETTE_PATH), mode=mode, latency=latency)
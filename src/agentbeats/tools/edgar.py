@@ -4,14 +4,73 @@ from __future__ import annotations
 
 import json
 import os
-from datetime import datetime
+import threading
+import time
+from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Sequence
+from typing import Any, Callable, Dict, List, Optional, Sequence
 
 import requests
 
+from ..domain.finance import FINANCE_KEYWORDS
 from ..models import EventSpec, EvidenceItem
 from .base import ToolLogger
+from .http import HttpTransport, get_transport
+from .cassette import CassetteMiss
+from .store import CacheEntry, ToolCache, cache_dir_for, tool_cache_for
+from .xbrl_index import FactIndex
+
+
+class TickerIndex:
+    """
+    Process-wide ticker → CIK index, loaded lazily and refreshed after `ttl`.
+
+    CIKs are held as ints keyed by upper-cased ticker; FINANCE_KEYWORDS names and aliases
+    (e.g. "tesla") are folded in as extra keys for their symbol, so lookups are one dict hit.
+    """
+
+    # Retry interval after a load that produced nothing (e.g. SEC unreachable).
+    RETRY_AFTER = 60.0
+
+    _shared: Dict[str, "TickerIndex"] = {}
+    _shared_lock = threading.Lock()
+
+    def __init__(self, ttl: timedelta = timedelta(days=1)):
+        self.ttl = ttl
+        self._ciks: Dict[str, int] = {}
+        self._expires_at = 0.0
+        self._lock = threading.Lock()
+
+    @classmethod
+    def shared(cls, key: str, ttl: timedelta = timedelta(days=1)) -> "TickerIndex":
+        """Return the index shared by every fetcher using the same cache location."""
+        with cls._shared_lock:
+            index = cls._shared.get(key)
+            if index is None:
+                index = cls._shared[key] = cls(ttl=ttl)
+            return index
+
+    @staticmethod
+    def _compact(tickers: Dict[str, str]) -> Dict[str, int]:
+        ciks = {ticker.upper(): int(cik) for ticker, cik in tickers.items()}
+        for keyword, entry in FINANCE_KEYWORDS.items():
+            cik = ciks.get(entry["symbol"].upper())
+            if cik is None:
+                continue
+            # Real tickers win over keyword/alias names that happen to collide with them.
+            for name in [keyword, *entry.get("aliases", [])]:
+                ciks.setdefault(name.upper(), cik)
+        return ciks
+
+    def lookup(self, key: str, loader: Callable[[], Dict[str, str]]) -> Optional[str]:
+        if time.monotonic() >= self._expires_at:
+            with self._lock:
+                if time.monotonic() >= self._expires_at:
+                    self._ciks = self._compact(loader())
+                    delay = self.ttl.total_seconds() if self._ciks else self.RETRY_AFTER
+                    self._expires_at = time.monotonic() + delay
+        cik = self._ciks.get(key.strip().upper())
+        return str(cik).zfill(10) if cik is not None else None
 
 
 class EdgarEvidenceFetcher:
@@ -40,57 +99,87 @@ class EdgarEvidenceFetcher:
         ticker_map: Optional[Dict[str, str]] = None,
         cache_dir: Optional[Path] = None,
         logger: Optional[ToolLogger] = None,
+        transport: Optional[HttpTransport] = None,
+        tickers_ttl: timedelta = timedelta(days=1),
+        tool_cache: Optional[ToolCache] = None,
     ) -> None:
         # SEC requires a descriptive User-Agent with contact info.
         self.user_agent = user_agent or os.getenv("SEC_USER_AGENT") or "agentbeats/0.1 (contact: your-email@example.com)"
         self.ticker_map = {k.upper(): v for k, v in (ticker_map or {}).items()}
-        self.cache_dir = cache_dir or Path("data/generated/tool_cache/edgar")
+        self.transport = transport or get_transport()
+        self.cache_dir = cache_dir or cache_dir_for(self.transport, Path("data/generated/tool_cache/edgar"))
         self.cache_dir.mkdir(parents=True, exist_ok=True)
         self.logger = logger or ToolLogger("edgar", Path("data/generated/tool_logs"))
-        self._session = requests.Session()
-        self._session.headers.update({"User-Agent": self.user_agent})
+        self._headers = {"User-Agent": self.user_agent}
+        self.tool_cache = tool_cache or tool_cache_for(self.transport)
+        self._fact_indexes: Dict[str, FactIndex] = {}
+        self.tickers_ttl = tickers_ttl
+        self._ticker_index = TickerIndex.shared(str(self.tool_cache.path.resolve()), ttl=tickers_ttl)
+
+    def _get(self, url: str) -> requests.Response:
+        return self.transport.get(url, headers=self._headers, timeout=30)
 
     def _cache_path(self, name: str) -> Path:
         return self.cache_dir / name
 
-    def _load_cached_json(self, name: str) -> Optional[Dict[str, Any]]:
+    def _load_legacy(self, endpoint: str, params: Dict[str, str], name: str) -> Optional[CacheEntry]:
+        """Seed the shared tool cache from a legacy JSON file in `cache_dir`, keeping its fetched_at."""
         path = self._cache_path(name)
         if not path.exists():
             return None
         try:
             with path.open("r", encoding="utf-8") as handle:
-                return json.load(handle)
+                legacy = json.load(handle)
+            fetched_at = datetime.fromisoformat(legacy["fetched_at"]) if legacy.get("fetched_at") else None
+            return self.tool_cache.store("edgar", endpoint, params, legacy["data"], fetched_at)
         except Exception:
             return None
 
-    def _save_cached_json(self, name: str, data: Dict[str, Any]) -> None:
-        path = self._cache_path(name)
-        try:
-            with path.open("w", encoding="utf-8") as handle:
-                json.dump(data, handle)
-        except Exception:
-            return None
-
-    def _load_company_tickers(self) -> Dict[str, str]:
-        cached = self._load_cached_json("company_tickers.json")
-        if cached and "data" in cached:
-            return cached["data"]
+    def _cached_fetch(
+        self,
+        endpoint: str,
+        params: Dict[str, str],
+        url: str,
+        error_mode: str,
+        transform: Optional[Callable[[Any], Any]] = None,
+    ) -> Optional[CacheEntry]:
+        """Serve a fresh cached document, otherwise fetch it; stale data is returned if SEC fails."""
+        cached = self.tool_cache.lookup("edgar", endpoint, params) or self._load_legacy(
+            endpoint, params, f"{endpoint}_{params['cik']}.json" if "cik" in params else f"{endpoint}.json"
+        )
+        if cached and cached.fresh:
+            return cached
         try:
-            response = self._session.get(self.COMPANY_TICKERS_URL, timeout=30)
+            response = self._get(url)
             response.raise_for_status()
-            payload = response.json()
-            ticker_map: Dict[str, str] = {}
-            # The SEC file uses an object keyed by index with fields ticker and cik_str.
-            for item in payload.values():
-                ticker_map[item["ticker"].upper()] = str(item["cik_str"]).zfill(10)
-            self._save_cached_json(
-                "company_tickers.json",
-                {"fetched_at": datetime.utcnow().isoformat(), "data": ticker_map},
-            )
-            return ticker_map
+            data = response.json()
+            if transform:
+                data = transform(data)
+        except CassetteMiss:
+            raise
         except Exception as exc:  # noqa: BLE001
-            self.logger.log({"tool": "edgar", "mode": "ticker_lookup_failed", "error": str(exc)})
-            return {}
+            self.logger.log({"tool": "edgar", "mode": error_mode, **params, "error": str(exc)})
+            return cached
+        self.logger.log({"tool": "edgar", "mode": endpoint, **params, "status": response.status_code})
+        return self.tool_cache.store("edgar", endpoint, params, data)
+
+    @staticmethod
+    def _ticker_map(payload: Dict[str, Any]) -> Dict[str, str]:
+        ticker_map: Dict[str, str] = {}
+        # The SEC file uses an object keyed by index with fields ticker and cik_str.
+        for item in payload.values():
+            ticker_map[item["ticker"].upper()] = str(item["cik_str"]).zfill(10)
+        return ticker_map
+
+    def _load_company_tickers(self) -> Dict[str, str]:
+        entry = self._cached_fetch(
+            "company_tickers",
+            {},
+            self.COMPANY_TICKERS_URL,
+            error_mode="ticker_lookup_failed",
+            transform=self._ticker_map,
+        )
+        return entry.data if entry else {}
 
     def _lookup_cik(self, ticker: str) -> Optional[str]:
         if not ticker:
@@ -98,28 +187,30 @@ class EdgarEvidenceFetcher:
         ticker = ticker.upper()
         if ticker in self.ticker_map:
             return self.ticker_map[ticker]
-        tickers = self._load_company_tickers()
-        return tickers.get(ticker)
+        return self._ticker_index.lookup(ticker, self._load_company_tickers)
+
+    @staticmethod
+    def ticker_for_event(event: EventSpec) -> Optional[str]:
+        """Ticker hint used for CIK lookup: the first tag, else the source market id."""
+        return (event.tags[0] if event.tags else None) or (event.source.market_id if event.source else None)
+
+    def warm(self, ticker: str) -> bool:
+        """Load submissions and the compiled fact index for `ticker` into the caches."""
+        cik = self._lookup_cik(ticker)
+        if not cik:
+            return False
+        submissions = self._fetch_submissions(cik)
+        index = self._fact_index(cik)
+        return submissions is not None and index is not None
 
     def _fetch_submissions(self, cik: str) -> Optional[Dict[str, Any]]:
-        cache_name = f"submissions_{cik}.json"
-        cached = self._load_cached_json(cache_name)
-        if cached and "data" in cached:
-            return cached["data"]
-        try:
-            url = self.SUBMISSIONS_URL.format(cik=cik)
-            response = self._session.get(url, timeout=30)
-            response.raise_for_status()
-            data = response.json()
-            self.logger.log({"tool": "edgar", "mode": "submissions", "cik": cik, "status": response.status_code})
-            self._save_cached_json(
-                cache_name,
-                {"fetched_at": datetime.utcnow().isoformat(), "data": data},
-            )
-            return data
-        except Exception as exc:  # noqa: BLE001
-            self.logger.log({"tool": "edgar", "mode": "submissions_error", "cik": cik, "error": str(exc)})
-            return None
+        entry = self._cached_fetch(
+            "submissions",
+            {"cik": cik},
+            self.SUBMISSIONS_URL.format(cik=cik),
+            error_mode="submissions_error",
+        )
+        return entry.data if entry else None
 
     def _latest_filings(self, submissions: Dict[str, Any], forms: Sequence[str]) -> List[Dict[str, Any]]:
         filings = submissions.get("filings", {}).get("recent", {})
@@ -161,7 +252,7 @@ class EdgarEvidenceFetcher:
         Example return:
         `EvidenceItem(type="edgar_filing", source="https://www.sec.gov/Archives/.../tm2530590d1_8k.htm", snippet="TSLA 8-K filed 2025-11-07", timestamp=datetime(...))`
         """
-        ticker = (event.tags[0] if event.tags else None) or (event.source.market_id if event.source else None)
+        ticker = self.ticker_for_event(event)
         cik = self._lookup_cik(ticker) if ticker else None
         if not cik:
             self.logger.log({"tool": "edgar", "mode": "skip", "reason": "no_cik", "event_id": event.id})
@@ -190,26 +281,36 @@ class EdgarEvidenceFetcher:
         return evidence_items
 
     # ---- XBRL facts (companyfacts API) ----
-    def _fetch_company_facts(self, cik: str) -> Optional[Dict[str, Any]]:
-        cache_name = f"companyfacts_{cik}.json"
-        cached = self._load_cached_json(cache_name)
-        if cached and "data" in cached:
-            return cached["data"]
+    def _fetch_company_facts(self, cik: str) -> Optional[CacheEntry]:
+        return self._cached_fetch(
+            "companyfacts",
+            {"cik": cik},
+            self.COMPANY_FACTS_URL.format(cik=cik),
+            error_mode="companyfacts_error",
+        )
+
+    def _fact_index_path(self, cik: str) -> Path:
+        return self._cache_path(f"companyfacts_{cik}.idx")
+
+    def _build_fact_index(self, cik: str, facts_doc: Dict[str, Any], fetched_at: datetime) -> Optional[FactIndex]:
         try:
-            url = self.COMPANY_FACTS_URL.format(cik=cik)
-            response = self._session.get(url, timeout=30)
-            response.raise_for_status()
-            data = response.json()
-            self.logger.log({"tool": "edgar", "mode": "companyfacts", "cik": cik, "status": response.status_code})
-            self._save_cached_json(
-                cache_name,
-                {"fetched_at": datetime.utcnow().isoformat(), "data": data},
-            )
-            return data
+            return FactIndex.build(facts_doc, self._fact_index_path(cik), fetched_at=fetched_at.isoformat())
         except Exception as exc:  # noqa: BLE001
-            self.logger.log({"tool": "edgar", "mode": "companyfacts_error", "cik": cik, "error": str(exc)})
+            self.logger.log({"tool": "edgar", "mode": "fact_index_error", "cik": cik, "error": str(exc)})
             return None
 
+    def _fact_index(self, cik: str) -> Optional[FactIndex]:
+        """Return the compiled fact index for a CIK, rebuilding it whenever companyfacts is refetched."""
+        index = self._fact_indexes.get(cik) or FactIndex.open(self._fact_index_path(cik))
+        if index is None or self.tool_cache.is_stale("edgar", index.fetched_at):
+            entry = self._fetch_company_facts(cik)
+            if entry is not None and (index is None or index.fetched_at != entry.fetched_at):
+                # Keep serving the previous index if compiling the new document fails.
+                index = self._build_fact_index(cik, entry.data, entry.fetched_at) or index
+        if index is not None:
+            self._fact_indexes[cik] = index
+        return index
+
     @staticmethod
     def _split_tag(tag: str) -> tuple[str, str]:
         if ":" in tag:
@@ -227,23 +328,6 @@ class EdgarEvidenceFetcher:
                 return candidate
         return next(iter(units.keys()), None)
 
-    @staticmethod
-    def _latest_fact_entry(entries: List[Dict[str, Any]], cutoff: Optional[str] = None) -> Optional[Dict[str, Any]]:
-        if not entries:
-            return None
-        # Filter by cutoff on filed date if provided (YYYY-MM-DD)
-        filtered = []
-        for entry in entries:
-            filed = entry.get("filed")
-            if cutoff and filed and filed > cutoff:
-                continue
-            filtered.append(entry)
-        use_entries = filtered or entries
-        return max(
-            use_entries,
-            key=lambda e: (e.get("filed") or "", e.get("end") or "", e.get("start") or ""),
-        )
-
     def fetch_facts(
         self,
         event: EventSpec,
@@ -271,37 +355,31 @@ class EdgarEvidenceFetcher:
         }
         ```
         """
-        ticker = (event.tags[0] if event.tags else None) or (event.source.market_id if event.source else None)
+        ticker = self.ticker_for_event(event)
         cik = self._lookup_cik(ticker) if ticker else None
         if not cik:
             self.logger.log({"tool": "edgar", "mode": "facts_skip", "reason": "no_cik", "event_id": event.id})
             return []
-        facts_doc = self._fetch_company_facts(cik)
-        if not facts_doc:
+        index = self._fact_index(cik)
+        if index is None:
             return []
-        facts_root = facts_doc.get("facts", {})
         results: List[Dict[str, Any]] = []
         cutoff = event.resolution_date.isoformat()[:10] if event.resolution_date else None
 
         for raw_tag in tags:
             prefix, name = self._split_tag(raw_tag)
-            namespace = facts_root.get(prefix, {})
-            tag_data = namespace.get(name)
-            if not tag_data:
-                continue
-            units = tag_data.get("units", {})
-            unit_key = self._select_unit(units)
+            tag = f"{prefix}:{name}"
+            unit_key = self._select_unit(dict.fromkeys(index.units(tag)))
             if not unit_key:
                 continue
-            entries = units.get(unit_key, [])
-            entry = self._latest_fact_entry(entries, cutoff=cutoff)
+            entry = index.latest(tag, unit_key, cutoff=cutoff)
             if not entry:
                 continue
             if forms and entry.get("form") not in forms:
                 continue
             results.append(
                 {
-                    "tag": f"{prefix}:{name}",
+                    "tag": tag,
                     "value": entry.get("val"),
                     "unit": unit_key,
                     "period_start": entry.get("start"),
@@ -0,0 +1,159 @@
+"""Shared HTTP transport: pooled keep-alive sessions plus per-host token-bucket rate limits."""
+
+from __future__ import annotations
+
+import os
+import threading
+import time
+from typing import Any, Dict, Mapping, Optional
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from .cassette import Cassette, cassette_from_env
+
+# Requests allowed per window (count, seconds), matched against the request host by suffix.
+DEFAULT_RATE_LIMITS: Dict[str, tuple[float, float]] = {
+    # SEC fair-access policy: 10 requests/second across www.sec.gov and data.sec.gov.
+    "sec.gov": (10, 1.0),
+    # Alpha Vantage free tier: 5 requests/minute (override for premium keys).
+    "alphavantage.co": (5, 60.0),
+}
+
+
+class RateLimiter:
+    """Thread-safe token bucket allowing `rate` requests per `per` seconds."""
+
+    def __init__(self, rate: float, per: float = 1.0):
+        if rate <= 0 or per <= 0:
+            raise ValueError(f"Rate limit must be positive, got {rate}/{per}")
+        # At least one whole token, so limits below one request per window (e.g. 0.5/1) still pass requests.
+        self.capacity = max(float(rate), 1.0)
+        self.fill_rate = float(rate) / float(per)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """Block until a token is available, then consume it."""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.fill_rate)
+                self._updated = now
+                if self._tokens >= 1.0:
+                    self._tokens -= 1.0
+                    return
+                wait = (1.0 - self._tokens) / self.fill_rate
+            time.sleep(wait)
+
+
+def _parse_rate_limits(spec: str) -> Dict[str, tuple[float, float]]:
+    """Parse `host=count/seconds` pairs, e.g. `alphavantage.co=75/60,sec.gov=10/1`."""
+    limits: Dict[str, tuple[float, float]] = {}
+    for part in spec.split(","):
+        if "=" not in part:
+            continue
+        host, _, value = part.partition("=")
+        count, _, window = value.partition("/")
+        try:
+            rate, per = float(count), float(window or 1.0)
+        except ValueError:
+            continue
+        if rate > 0 and per > 0:
+            limits[host.strip().lower()] = (rate, per)
+    return limits
+
+
+class HttpTransport:
+    """
+    Pooled `requests.Session` shared by tool clients, throttled per host.
+
+    With a `Cassette` attached, "record" mode stores every response it receives and "replay" mode
+    answers from the cassette without touching the network (or the rate limiters).
+    """
+
+    def __init__(
+        self,
+        rate_limits: Optional[Mapping[str, tuple[float, float]]] = None,
+        pool_maxsize: int = 32,
+        max_retries: int = 3,
+        cassette: Optional[Cassette] = None,
+    ):
+        self.cassette = cassette
+        limits = dict(DEFAULT_RATE_LIMITS)
+        limits.update(_parse_rate_limits(os.getenv("AGENTBEATS_RATE_LIMITS", "")))
+        if rate_limits:
+            limits.update(rate_limits)
+        self.rate_limits = limits
+        self._limiters: Dict[str, RateLimiter] = {}
+        self._host_limiters: Dict[str, Optional[RateLimiter]] = {}
+        self._lock = threading.Lock()
+        retry = Retry(
+            total=max_retries,
+            backoff_factor=0.5,
+            status_forcelist=(429, 502, 503, 504),
+            allowed_methods=("GET",),
+            respect_retry_after_header=True,
+            raise_on_status=False,
+        )
+        adapter = HTTPAdapter(pool_connections=16, pool_maxsize=pool_maxsize, max_retries=retry)
+        self.session = requests.Session()
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+    def _limiter_for(self, host: str) -> Optional[RateLimiter]:
+        with self._lock:
+            if host in self._host_limiters:
+                return self._host_limiters[host]
+            # Longest matching suffix wins so a specific host can override its domain.
+            matches = [key for key in self.rate_limits if host == key or host.endswith(f".{key}")]
+            limiter = None
+            if matches:
+                key = max(matches, key=len)
+                if key not in self._limiters:
+                    self._limiters[key] = RateLimiter(*self.rate_limits[key])
+                limiter = self._limiters[key]
+            self._host_limiters[host] = limiter
+            return limiter
+
+    def get(
+        self,
+        url: str,
+        params: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+        timeout: float = 30,
+        stream: bool = False,
+    ) -> requests.Response:
+        if self.cassette is not None and self.cassette.mode == "replay":
+            return self.cassette.replay("GET", url, params)
+        limiter = self._limiter_for((urlsplit(url).hostname or "").lower())
+        if limiter:
+            limiter.acquire()
+        started = time.monotonic()
+        response = self.session.get(url, params=params, headers=headers, timeout=timeout, stream=stream)
+        if self.cassette is not None and self.cassette.mode == "record":
+            self.cassette.record("GET", url, params, response, time.monotonic() - started)
+        return response
+
+
+_default_transport: Optional[HttpTransport] = None
+_default_lock = threading.Lock()
+
+
+def get_transport() -> HttpTransport:
+    """Return the process-wide transport shared by all tool clients (cassette from the environment)."""
+    global _default_transport
+    with _default_lock:
+        if _default_transport is None:
+            _default_transport = HttpTransport(cassette=cassette_from_env())
+        return _default_transport
+
+
+def set_cassette(cassette: Optional[Cassette]) -> HttpTransport:
+    """Attach (or with None, detach) a cassette on the process-wide transport."""
+    transport = get_transport()
+    transport.cassette = cassette
+    return transport
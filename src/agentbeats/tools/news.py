@@ -5,35 +5,102 @@ from __future__ import annotations
 import json
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, Iterator, List, Optional
 from urllib.parse import quote_plus
 import xml.etree.ElementTree as ET
 
-import requests
-
 from ..models import EventSpec, EvidenceItem
-from .base import ToolLogger
+from .base import SingleFlight, ToolLogger
+from .http import HttpTransport, get_transport
+from .cassette import CassetteMiss
+from .store import CacheEntry, ToolCache, tool_cache_for
 
 
 class NewsEvidenceFetcher:
     """Fetch articles for a given event using Google News RSS (fallback to fixtures)."""
 
     GOOGLE_NEWS_URL = "https://news.google.com/rss/search"
+    CHUNK_SIZE = 16 * 1024
 
-    def __init__(self, fixtures_path: Optional[Path] = None, logger: Optional[ToolLogger] = None):
+    def __init__(
+        self,
+        fixtures_path: Optional[Path] = None,
+        logger: Optional[ToolLogger] = None,
+        transport: Optional[HttpTransport] = None,
+        tool_cache: Optional[ToolCache] = None,
+    ):
         self.fixtures_path = fixtures_path
         self.logger = logger or ToolLogger("news")
+        self.transport = transport or get_transport()
+        self.tool_cache = tool_cache or tool_cache_for(self.transport)
+        self._inflight = SingleFlight()
         self._fixture_articles = self._load_fixture() if fixtures_path and fixtures_path.exists() else []
 
     def _load_fixture(self) -> List[Dict[str, Any]]:
         with self.fixtures_path.open("r", encoding="utf-8") as handle:
             return json.load(handle)
 
+    def query_for_event(self, event: EventSpec) -> str:
+        """Normalized query `fetch_articles` will search for this event (the cache key)."""
+        return self._normalize_query(self._build_query(event))
+
     def _build_query(self, event: EventSpec) -> str:
         if event.tags:
             return " ".join(event.tags)
         return event.question.split("?")[0]
 
+    @staticmethod
+    def _normalize_query(query: str) -> str:
+        return " ".join(query.lower().split())
+
+    @staticmethod
+    def _parse_item(item: ET.Element) -> Dict[str, Any]:
+        published = item.findtext("pubDate")
+        timestamp = None
+        if published:
+            try:
+                timestamp = datetime.strptime(published, "%a, %d %b %Y %H:%M:%S %Z").isoformat()
+            except ValueError:
+                timestamp = None
+        return {
+            "id": item.findtext("guid") or item.findtext("link"),
+            "title": item.findtext("title"),
+            "url": item.findtext("link"),
+            "published_at": timestamp,
+            "summary": item.findtext("description"),
+            "sentiment": 0.0,
+            "tags": [],
+        }
+
+    def _iter_items(self, chunks: Iterable[bytes], limit: int) -> Iterator[Dict[str, Any]]:
+        """
+        Incrementally parse `<rss><channel><item>` elements from raw chunks.
+
+        Stops consuming input once `limit` items have been produced, and drops each item from the
+        tree once parsed, so work and memory follow the items used rather than the feed size.
+        """
+        if limit <= 0:
+            return
+        parser = ET.XMLPullParser(events=("start", "end"))
+        stack: List[ET.Element] = []
+        produced = 0
+        for chunk in chunks:
+            if not chunk:
+                continue
+            parser.feed(chunk)
+            for event, element in parser.read_events():
+                if event == "start":
+                    stack.append(element)
+                    continue
+                stack.pop()
+                if element.tag == "item" and len(stack) == 2 and stack[-1].tag == "channel":
+                    yield self._parse_item(element)
+                    stack[-1].remove(element)
+                    produced += 1
+                    if produced >= limit:
+                        return
+        parser.close()
+
     def _fetch_rss(self, query: str, limit: int) -> List[Dict[str, Any]]:
         params = {
             "q": quote_plus(query),
@@ -41,41 +108,49 @@ class NewsEvidenceFetcher:
             "gl": "US",
             "ceid": "US:en",
         }
-        response = requests.get(self.GOOGLE_NEWS_URL, params=params, timeout=30)
-        response.raise_for_status()
-        self.logger.log({"tool": "news", "mode": "rss", "query": query, "status": response.status_code})
-        root = ET.fromstring(response.content)
-        items = root.findall("./channel/item")
-        articles: List[Dict[str, Any]] = []
-        for item in items[:limit]:
-            published = item.findtext("pubDate")
-            timestamp = None
-            if published:
-                try:
-                    timestamp = datetime.strptime(published, "%a, %d %b %Y %H:%M:%S %Z").isoformat()
-                except ValueError:
-                    timestamp = None
-            articles.append(
-                {
-                    "id": item.findtext("guid") or item.findtext("link"),
-                    "title": item.findtext("title"),
-                    "url": item.findtext("link"),
-                    "published_at": timestamp,
-                    "summary": item.findtext("description"),
-                    "sentiment": 0.0,
-                    "tags": [],
-                }
-            )
-        return articles
+        response = self.transport.get(self.GOOGLE_NEWS_URL, params=params, timeout=30, stream=True)
+        try:
+            response.raise_for_status()
+            self.logger.log({"tool": "news", "mode": "rss", "query": query, "status": response.status_code})
+            return list(self._iter_items(response.iter_content(chunk_size=self.CHUNK_SIZE), limit))
+        finally:
+            # Closing mid-body drops the rest of the feed instead of downloading it.
+            response.close()
 
-    def fetch_articles(self, event: EventSpec, limit: int = 3) -> List[Dict[str, Any]]:
-        query = self._build_query(event)
+    def _refresh(self, query: str, limit: int) -> List[Dict[str, Any]]:
+        params = {"q": query, "limit": limit}
+        # Another caller may have stored the result between our lookup and taking the flight.
+        entry: Optional[CacheEntry] = self.tool_cache.lookup("news", "rss", params)
+        if entry is not None and entry.fresh:
+            return entry.data
         try:
             articles = self._fetch_rss(query, limit)
-            if articles:
-                return articles
+        except CassetteMiss:
+            raise
         except Exception as exc:  # noqa: BLE001
             self.logger.log({"tool": "news", "mode": "rss_error", "error": str(exc), "query": query})
+            return entry.data if entry is not None else []
+        self.tool_cache.store("news", "rss", params, articles)
+        return articles
+
+    def search(self, query: str, limit: int = 3) -> List[Dict[str, Any]]:
+        """
+        Return up to `limit` RSS articles for `query`.
+
+        Results are cached per normalized query (TTL from the tool cache), and concurrent callers
+        asking for the same query share a single in-flight request. A stale copy is served if the
+        feed cannot be reached.
+        """
+        query = self._normalize_query(query)
+        entry = self.tool_cache.lookup("news", "rss", {"q": query, "limit": limit})
+        if entry is not None and entry.fresh:
+            return entry.data
+        return self._inflight.do((query, limit), lambda: self._refresh(query, limit))
+
+    def fetch_articles(self, event: EventSpec, limit: int = 3) -> List[Dict[str, Any]]:
+        articles = self.search(self._build_query(event), limit)
+        if articles:
+            return articles
         return self._fixture_articles[:limit]
 
     def to_evidence(self, article: Dict[str, Any]) -> EvidenceItem:
@@ -2,23 +2,35 @@
 
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, Iterator, List, Optional
 
 import requests
 
-from .base import ToolLogger
+from .base import SingleFlight, ToolLogger
+from .http import HttpTransport, get_transport
+from .cassette import CassetteMiss
+from .store import ToolCache, tool_cache_for
 
 
 class PolymarketClient:
     BASE_URL = "https://gamma-api.polymarket.com"
 
-    def __init__(self, logger: Optional[ToolLogger] = None):
+    def __init__(
+        self,
+        logger: Optional[ToolLogger] = None,
+        transport: Optional[HttpTransport] = None,
+        tool_cache: Optional[ToolCache] = None,
+    ):
         self.logger = logger or ToolLogger("polymarket", Path("data/generated/tool_logs"))
+        self.transport = transport or get_transport()
+        self.tool_cache = tool_cache or tool_cache_for(self.transport)
+        self._inflight = SingleFlight()
 
     def _request(self, path: str, params: Optional[Dict[str, Any]] = None) -> Any:
         url = f"{self.BASE_URL}{path}"
-        response = requests.get(url, params=params, timeout=30)
+        response = self.transport.get(url, params=params, timeout=30)
         response.raise_for_status()
         payload = response.json()
         self.logger.log({
@@ -29,12 +41,104 @@ class PolymarketClient:
         })
         return payload
 
-    def fetch_markets(self, limit: int = 20, active_only: bool = True) -> List[Dict[str, Any]]:
+    @staticmethod
+    def _market_params(limit: int, active_only: bool) -> Dict[str, Any]:
+        """`/markets` query parameters shared by paged and single-request listings."""
         params: Dict[str, Any] = {"limit": limit}
         if active_only:
             params["active"] = "true"
             params["closed"] = "false"
-        return self._request("/markets", params=params)
+        return params
+
+    def _fetch_page(self, offset: int, page_size: int, active_only: bool) -> List[Dict[str, Any]]:
+        params = {**self._market_params(page_size, active_only), "offset": offset}
+        return self._request("/markets", params=params) or []
+
+    def iter_markets(
+        self,
+        limit: Optional[int] = None,
+        active_only: bool = True,
+        page_size: int = 100,
+        concurrency: int = 1,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Yield markets page by page (offset pagination) until `limit` markets or the last page.
+
+        With `concurrency > 1`, that many consecutive pages are requested at once; markets are
+        still yielded in offset order and only one wave of pages is held in memory.
+        """
+        if page_size < 1:
+            raise ValueError(f"page_size must be at least 1, got {page_size}")
+        if limit is not None and limit <= 0:
+            limit = None
+        if limit is not None:
+            page_size = min(page_size, limit)
+        yielded = 0
+        offset = 0
+        with ThreadPoolExecutor(max_workers=max(concurrency, 1)) as pool:
+            while True:
+                wave = max(concurrency, 1)
+                if limit is not None:
+                    wave = min(wave, -(-(limit - yielded) // page_size))
+                offsets = [offset + i * page_size for i in range(wave)]
+                pages = pool.map(lambda page_offset: self._fetch_page(page_offset, page_size, active_only), offsets)
+                for page in pages:
+                    for market in page:
+                        yield market
+                        yielded += 1
+                        if limit is not None and yielded >= limit:
+                            return
+                    if len(page) < page_size:
+                        return
+                offset += wave * page_size
+
+    def fetch_markets(self, limit: int = 20, active_only: bool = True) -> List[Dict[str, Any]]:
+        if limit <= 0:
+            # No limit to page towards: one request, leaving the page size to the API.
+            return self._request("/markets", params=self._market_params(limit, active_only)) or []
+        return list(self.iter_markets(limit=limit, active_only=active_only, page_size=limit))
 
     def fetch_market(self, market_id: str) -> Dict[str, Any]:
         return self._request(f"/markets/{market_id}")
+
+    def _fetch_id_batches(self, market_ids: List[str], batch_size: int) -> Dict[str, Dict[str, Any]]:
+        found: Dict[str, Dict[str, Any]] = {}
+        for start in range(0, len(market_ids), batch_size):
+            batch = market_ids[start:start + batch_size]
+            try:
+                markets = self._request("/markets", params={"id": batch, "limit": len(batch)}) or []
+            except CassetteMiss:
+                raise
+            except (requests.RequestException, ValueError) as exc:
+                self.logger.log({"tool": "polymarket", "path": "/markets", "ids": len(batch), "error": str(exc)})
+                # Serve whatever we had before, even if it is past its TTL.
+                for market_id in batch:
+                    entry = self.tool_cache.lookup("polymarket", "market", {"id": market_id})
+                    if entry is not None:
+                        found[market_id] = entry.data
+                continue
+            for market in markets:
+                market_id = str(market.get("id"))
+                found[market_id] = market
+                self.tool_cache.store("polymarket", "market", {"id": market_id}, market)
+        return found
+
+    def fetch_markets_by_ids(self, market_ids: Iterable[str], batch_size: int = 50) -> Dict[str, Dict[str, Any]]:
+        """
+        Return {market_id: market} for the requested ids; unknown ids are omitted.
+
+        Fresh cached markets are served locally, the rest are requested `batch_size` ids at a time,
+        and ids another thread is already fetching are awaited rather than requested again.
+        """
+        found: Dict[str, Dict[str, Any]] = {}
+        missing: List[str] = []
+        for market_id in dict.fromkeys(str(market_id) for market_id in market_ids):
+            entry = self.tool_cache.lookup("polymarket", "market", {"id": market_id})
+            if entry is not None and entry.fresh:
+                found[market_id] = entry.data
+            else:
+                missing.append(market_id)
+        if missing:
+            fetched = self._inflight.do_many(missing, lambda ids: self._fetch_id_batches(ids, batch_size))
+            found.update({market_id: market for market_id, market in fetched.items() if market is not None})
+        return found
@@ -0,0 +1,109 @@
+"""Columnar OHLCV series built from Alpha Vantage time-series payloads."""
+
+from __future__ import annotations
+
+from datetime import date, datetime
+from typing import Any, Dict, Optional, Union
+
+import numpy as np
+
+DateLike = Union[str, date, datetime, np.datetime64]
+
+_FIELDS = ("open", "high", "low", "close", "volume")
+
+
+def _day(value: DateLike) -> np.datetime64:
+    if isinstance(value, datetime):
+        value = value.date()
+    if isinstance(value, str):
+        value = value[:10]
+    return np.datetime64(value, "D")
+
+
+def _number(raw: Any) -> float:
+    try:
+        return float(raw)
+    except (TypeError, ValueError):
+        return np.nan
+
+
+class PriceSeries:
+    """
+    Daily (or coarser) bars as ascending `datetime64[D]` dates plus float64 OHLCV columns.
+
+    Built once per payload, then every lookup is array arithmetic: as-of queries are a
+    `searchsorted` over `dates`, window averages are slices of the columns.
+    Missing or unparsable values are NaN.
+
+    Examples
+    --------
+    >>> series = PriceSeries.from_alpha_vantage(client.fetch_time_series("TSLA"))
+    >>> series.close_asof("2025-10-31", max_lag_days=5)
+    456.56
+    """
+
+    def __init__(self, dates: np.ndarray, columns: Dict[str, np.ndarray]):
+        self.dates = dates
+        self.open = columns["open"]
+        self.high = columns["high"]
+        self.low = columns["low"]
+        self.close = columns["close"]
+        self.volume = columns["volume"]
+
+    @classmethod
+    def from_alpha_vantage(cls, payload: Dict[str, Any], series_key: Optional[str] = None) -> "PriceSeries":
+        """Build from a raw payload; the series key defaults to the first `... Time Series ...` entry."""
+        if series_key is None:
+            series_key = next((key for key in payload if "Time Series" in key), None)
+        points: Dict[str, Dict[str, Any]] = (payload.get(series_key) or {}) if series_key else {}
+        days = sorted(points)
+        dates = np.array([day[:10] for day in days], dtype="datetime64[D]")
+        columns: Dict[str, np.ndarray] = {}
+        for field in _FIELDS:
+            # Keys look like "4. close" (or "6. volume" for adjusted series); match on the name.
+            columns[field] = np.fromiter(
+                (
+                    _number(next((v for k, v in points[day].items() if k.split(". ", 1)[-1] == field), None))
+                    for day in days
+                ),
+                dtype="f8",
+                count=len(days),
+            )
+        return cls(dates, columns)
+
+    def __len__(self) -> int:
+        return len(self.dates)
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes held by the date and OHLCV arrays."""
+        return self.dates.nbytes + sum(self.column(field).nbytes for field in _FIELDS)
+
+    def column(self, field: str) -> np.ndarray:
+        if field not in _FIELDS:
+            raise KeyError(field)
+        return getattr(self, field)
+
+    def asof_index(self, when: DateLike, max_lag_days: Optional[int] = None) -> Optional[int]:
+        """Index of the last bar on or before `when` (no more than `max_lag_days` earlier), else None."""
+        target = _day(when)
+        index = int(np.searchsorted(self.dates, target, side="right")) - 1
+        if index < 0:
+            return None
+        if max_lag_days is not None and (target - self.dates[index]) > np.timedelta64(max_lag_days, "D"):
+            return None
+        return index
+
+    def close_asof(self, when: DateLike, max_lag_days: Optional[int] = None) -> Optional[float]:
+        index = self.asof_index(when, max_lag_days)
+        if index is None or np.isnan(self.close[index]):
+            return None
+        return float(self.close[index])
+
+    def window_mean(self, length: int, end: Optional[int] = None, field: str = "close") -> Optional[float]:
+        """Mean of the `length` bars before index `end` (exclusive; default: through the last bar)."""
+        end = len(self) if end is None else end
+        window = self.column(field)[max(end - length, 0):end]
+        if not len(window):
+            return None
+        return float(window.mean())
@@ -0,0 +1,216 @@
+"""SQLite-backed persistent cache shared by all tool clients."""
+
+from __future__ import annotations
+
+import json
+import os
+import sqlite3
+import threading
+import weakref
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any, Dict, Mapping, Optional
+
+from .cache import MemoryCache, get_memory_cache
+
+try:  # Optional: compress payloads when zstandard is installed.
+    import zstandard
+except ImportError:  # pragma: no cover - depends on environment
+    zstandard = None
+
+DEFAULT_DB_PATH = Path("data/generated/tool_cache/tools.sqlite3")
+
+# How long a cached payload is served before the client refetches it.
+DEFAULT_TTLS: Dict[str, timedelta] = {
+    "alpha_vantage": timedelta(hours=12),
+    "edgar": timedelta(days=1),
+    "news": timedelta(hours=1),
+    "polymarket": timedelta(minutes=5),
+}
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS tool_cache (
+    tool TEXT NOT NULL,
+    endpoint TEXT NOT NULL,
+    params TEXT NOT NULL,
+    fetched_at REAL NOT NULL,
+    codec TEXT NOT NULL,
+    payload BLOB NOT NULL,
+    PRIMARY KEY (tool, endpoint, params)
+)
+"""
+
+
+@dataclass
+class CacheEntry:
+    data: Any
+    fetched_at: datetime
+    fresh: bool
+
+
+def params_key(params: Optional[Mapping[str, Any]]) -> str:
+    """Canonical cache key for request parameters (never include secrets such as API keys)."""
+    return json.dumps(dict(params or {}), sort_keys=True, separators=(",", ":"), default=str)
+
+
+class ToolCache:
+    """
+    Durable cache keyed by (tool, endpoint, params) with per-tool TTLs.
+
+    Rows live in one SQLite database in WAL mode, so several pipeline processes on a host can read
+    concurrently while one writes; each write is a single atomic upsert. Payloads are JSON,
+    zstd-compressed when `zstandard` is available, and decoded documents are kept in the shared
+    in-process `MemoryCache` in front of the database.
+
+    Examples
+    --------
+    >>> cache = ToolCache(Path("/tmp/tools.sqlite3"))
+    >>> _ = cache.store("edgar", "submissions", {"cik": "0001318605"}, {"filings": {}})
+    >>> cache.lookup("edgar", "submissions", {"cik": "0001318605"}).fresh
+    True
+    """
+
+    def __init__(
+        self,
+        path: Optional[Path] = None,
+        ttls: Optional[Mapping[str, timedelta]] = None,
+        compress: Optional[bool] = None,
+        compression_level: int = 3,
+        memory_cache: Optional[MemoryCache] = None,
+    ):
+        self.path = Path(path or os.getenv("AGENTBEATS_TOOL_CACHE_DB") or DEFAULT_DB_PATH)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.ttls = dict(DEFAULT_TTLS)
+        self.ttls.update(ttls or {})
+        self.compress = (zstandard is not None) if compress is None else (compress and zstandard is not None)
+        self.compression_level = compression_level
+        self.memory_cache = memory_cache or get_memory_cache()
+        self._local = threading.local()
+
+    def _connection(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=30)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute(_SCHEMA)
+            conn.commit()
+            self._local.conn = conn
+        return conn
+
+    def ttl_for(self, tool: str) -> timedelta:
+        return self.ttls.get(tool, timedelta(hours=1))
+
+    def is_stale(self, tool: str, fetched_at: Optional[datetime]) -> bool:
+        if fetched_at is None:
+            return True
+        if fetched_at.tzinfo is None:
+            fetched_at = fetched_at.replace(tzinfo=timezone.utc)
+        return datetime.now(timezone.utc) - fetched_at > self.ttl_for(tool)
+
+    def _encode(self, data: Any) -> tuple[str, bytes, int]:
+        raw = json.dumps(data, separators=(",", ":")).encode("utf-8")
+        if self.compress:
+            return "zstd", zstandard.ZstdCompressor(level=self.compression_level).compress(raw), len(raw)
+        return "json", raw, len(raw)
+
+    @staticmethod
+    def _decode(codec: str, payload: bytes) -> Optional[bytes]:
+        if codec == "json":
+            return payload
+        if codec == "zstd" and zstandard is not None:
+            return zstandard.ZstdDecompressor().decompress(payload)
+        return None
+
+    def lookup(self, tool: str, endpoint: str, params: Optional[Mapping[str, Any]] = None) -> Optional[CacheEntry]:
+        """Return the cached entry (fresh or stale) or None; check `entry.fresh` before trusting it."""
+        key = params_key(params)
+        memory_key = ("tool_cache", str(self.path), tool, endpoint, key)
+        hit = self.memory_cache.get(memory_key)
+        if hit is None:
+            row = self._connection().execute(
+                "SELECT fetched_at, codec, payload FROM tool_cache WHERE tool = ? AND endpoint = ? AND params = ?",
+                (tool, endpoint, key),
+            ).fetchone()
+            if row is None:
+                return None
+            raw = self._decode(row[1], row[2])
+            if raw is None:
+                return None
+            try:
+                data = json.loads(raw)
+            except ValueError:
+                return None
+            hit = (data, datetime.fromtimestamp(row[0], tz=timezone.utc))
+            self.memory_cache.put(memory_key, hit, len(raw))
+        data, fetched_at = hit
+        return CacheEntry(data=data, fetched_at=fetched_at, fresh=not self.is_stale(tool, fetched_at))
+
+    def store(
+        self,
+        tool: str,
+        endpoint: str,
+        params: Optional[Mapping[str, Any]],
+        data: Any,
+        fetched_at: Optional[datetime] = None,
+    ) -> CacheEntry:
+        fetched_at = fetched_at or datetime.now(timezone.utc)
+        if fetched_at.tzinfo is None:
+            fetched_at = fetched_at.replace(tzinfo=timezone.utc)
+        key = params_key(params)
+        codec, payload, raw_size = self._encode(data)
+        conn = self._connection()
+        with conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO tool_cache (tool, endpoint, params, fetched_at, codec, payload) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (tool, endpoint, key, fetched_at.timestamp(), codec, payload),
+            )
+        self.memory_cache.put(("tool_cache", str(self.path), tool, endpoint, key), (data, fetched_at), raw_size)
+        return CacheEntry(data=data, fetched_at=fetched_at, fresh=not self.is_stale(tool, fetched_at))
+
+
+_default_store: Optional[ToolCache] = None
+_default_lock = threading.Lock()
+
+
+# Scratch tool cache per active cassette (see `tool_cache_for`).
+_cassette_stores: "weakref.WeakKeyDictionary[Any, ToolCache]" = weakref.WeakKeyDictionary()
+
+
+def _active_cassette(transport: Any) -> Any:
+    cassette = getattr(transport, "cassette", None)
+    return cassette if cassette is not None and cassette.active else None
+
+
+def tool_cache_for(transport: Any) -> ToolCache:
+    """
+    The shared tool cache, or while `transport` records/replays a cassette, a scratch one (temp
+    SQLite file, own `MemoryCache`) that starts empty, so no response is served around the cassette.
+    """
+    cassette = _active_cassette(transport)
+    if cassette is None:
+        return get_tool_cache()
+    with _default_lock:
+        store = _cassette_stores.get(cassette)
+        if store is None:
+            store = _cassette_stores[cassette] = ToolCache(
+                cassette.scratch_dir("tool_cache") / "tools.sqlite3", memory_cache=MemoryCache()
+            )
+        return store
+
+
+def cache_dir_for(transport: Any, default: Path) -> Path:
+    """`default`, or a scratch directory of the same name while `transport` has an active cassette."""
+    cassette = _active_cassette(transport)
+    return default if cassette is None else cassette.scratch_dir(default.name)
+
+
+def get_tool_cache() -> ToolCache:
+    """Return the process-wide tool cache (path from AGENTBEATS_TOOL_CACHE_DB)."""
+    global _default_store
+    with _default_lock:
+        if _default_store is None:
+            _default_store = ToolCache()
+        return _default_store
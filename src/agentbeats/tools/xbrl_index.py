@@ -0,0 +1,229 @@
+"""Columnar, memory-mapped index over SEC companyfacts documents."""
+
+from __future__ import annotations
+
+import json
+import os
+import tempfile
+from datetime import date, datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+# Bumped whenever the column layout changes, so older index files are rebuilt rather than misread.
+_MAGIC = b"ABFIDX02"
+_ALIGN = 8
+
+# `val_kind` per row: companyfacts values may be ints (kept exact in `val_int`), floats (`val`) or absent.
+_VAL_MISSING, _VAL_INT, _VAL_FLOAT = 0, 1, 2
+_INT64 = np.iinfo(np.int64)
+
+
+def _val_kind(value: Any) -> int:
+    if isinstance(value, float):
+        return _VAL_FLOAT
+    if isinstance(value, int):
+        return _VAL_INT
+    return _VAL_MISSING
+
+
+def _ordinal(value: Optional[str]) -> int:
+    """Map a YYYY-MM-DD string to a day ordinal; 0 sorts missing dates first like ''."""
+    if not value:
+        return 0
+    try:
+        return date.fromisoformat(value[:10]).toordinal()
+    except ValueError:
+        return 0
+
+
+def _date_str(ordinal: int) -> Optional[str]:
+    return date.fromordinal(ordinal).isoformat() if ordinal else None
+
+
+def _text(raw: bytes) -> Optional[str]:
+    return raw.decode("utf-8") if raw else None
+
+
+class FactIndex:
+    """
+    Per-CIK fact table stored as one file of fixed-width columns plus a small JSON header.
+
+    Rows are grouped by (tag, unit) and sorted by (filed, end, start) within each group, so the
+    latest fact filed on or before a cutoff is a binary search over the group's `filed` column.
+    Columns are memory-mapped on first use; a lookup only pages in the rows it touches.
+
+    Examples
+    --------
+    >>> index = FactIndex.build(companyfacts_doc, Path("companyfacts_0001318605.idx"))
+    >>> unit = index.units("us-gaap:EarningsPerShareDiluted")[0]
+    >>> index.latest("us-gaap:EarningsPerShareDiluted", unit, cutoff="2025-12-31")["val"]
+    2.27
+    """
+
+    def __init__(self, path: Path, header: Dict[str, Any]):
+        self.path = path
+        self.header = header
+        self.tags: Dict[str, Dict[str, List[int]]] = header["tags"]
+        self._columns: Dict[str, np.ndarray] = {}
+
+    @classmethod
+    def open(cls, path: Path) -> Optional["FactIndex"]:
+        """Open an existing index file, returning None if it is missing or unreadable."""
+        try:
+            with path.open("rb") as handle:
+                if handle.read(len(_MAGIC)) != _MAGIC:
+                    return None
+                header_len = int.from_bytes(handle.read(8), "little")
+                header = json.loads(handle.read(header_len))
+        except (OSError, ValueError):
+            return None
+        return cls(path, header)
+
+    @classmethod
+    def build(cls, facts_doc: Dict[str, Any], path: Path, fetched_at: Optional[str] = None) -> "FactIndex":
+        """Compile a companyfacts document into an index file (written atomically)."""
+        groups: List[tuple[str, str, List[Dict[str, Any]]]] = []
+        for prefix, namespace in (facts_doc.get("facts") or {}).items():
+            for name, tag_data in (namespace or {}).items():
+                for unit, entries in (tag_data.get("units") or {}).items():
+                    groups.append((f"{prefix}:{name}", unit, entries or []))
+
+        filed_parts, end_parts, start_parts = [], [], []
+        tags: Dict[str, Dict[str, List[int]]] = {}
+        rows: List[Dict[str, Any]] = []
+        offset = 0
+        for tag, unit, entries in groups:
+            filed = np.fromiter((_ordinal(e.get("filed")) for e in entries), dtype="<i4", count=len(entries))
+            end = np.fromiter((_ordinal(e.get("end")) for e in entries), dtype="<i4", count=len(entries))
+            start = np.fromiter((_ordinal(e.get("start")) for e in entries), dtype="<i4", count=len(entries))
+            # Ties keep the earliest document entry last, matching max() over the raw list.
+            order = np.lexsort((-np.arange(len(entries)), start, end, filed))
+            filed_parts.append(filed[order])
+            end_parts.append(end[order])
+            start_parts.append(start[order])
+            rows.extend(entries[i] for i in order)
+            tags.setdefault(tag, {})[unit] = [offset, offset + len(entries)]
+            offset += len(entries)
+
+        def concat(parts: List[np.ndarray], dtype: str) -> np.ndarray:
+            return np.concatenate(parts).astype(dtype) if parts else np.zeros(0, dtype=dtype)
+
+        def strings(key: str) -> np.ndarray:
+            values = [str(row.get(key) or "").encode("utf-8") for row in rows]
+            return np.array(values, dtype=f"S{max((len(v) for v in values), default=0) or 1}")
+
+        raw_values = [row.get("val") for row in rows]
+        kinds = np.fromiter((_val_kind(value) for value in raw_values), dtype="i1", count=len(rows))
+        # Integers get their own column: a float64 one would round anything above 2**53.
+        for value, kind in zip(raw_values, kinds):
+            if kind == _VAL_INT and not _INT64.min <= value <= _INT64.max:
+                raise ValueError(f"XBRL value {value} does not fit the index's 64-bit integer column")
+        values = np.array(
+            [value if kind == _VAL_FLOAT else np.nan for value, kind in zip(raw_values, kinds)], dtype="<f8"
+        )
+        int_values = np.array(
+            [value if kind == _VAL_INT else 0 for value, kind in zip(raw_values, kinds)], dtype="<i8"
+        )
+        columns = {
+            "filed": concat(filed_parts, "<i4"),
+            "end": concat(end_parts, "<i4"),
+            "start": concat(start_parts, "<i4"),
+            "val": values,
+            "val_int": int_values,
+            "val_kind": kinds,
+            "form": strings("form"),
+            "accn": strings("accn"),
+            "context_ref": strings("contextRef"),
+        }
+        header: Dict[str, Any] = {"rows": offset, "fetched_at": fetched_at, "tags": tags, "columns": {}}
+
+        # Column offsets depend on the header size and vice versa; iterate until the layout settles.
+        header_bytes = b""
+        while True:
+            position = len(_MAGIC) + 8 + len(header_bytes)
+            for name, column in columns.items():
+                position += -position % _ALIGN
+                header["columns"][name] = {"dtype": column.dtype.str, "offset": position}
+                position += column.nbytes
+            encoded = json.dumps(header).encode("utf-8")
+            encoded += b" " * (-len(encoded) % _ALIGN)
+            if len(encoded) == len(header_bytes):
+                header_bytes = encoded
+                break
+            header_bytes = encoded
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.")
+        try:
+            with os.fdopen(fd, "wb") as handle:
+                handle.write(_MAGIC)
+                handle.write(len(header_bytes).to_bytes(8, "little"))
+                handle.write(header_bytes)
+                for name, column in columns.items():
+                    handle.write(b"\0" * (header["columns"][name]["offset"] - handle.tell()))
+                    handle.write(column.tobytes())
+            os.replace(tmp_name, path)
+        except BaseException:
+            Path(tmp_name).unlink(missing_ok=True)
+            raise
+        return cls(path, json.loads(header_bytes))
+
+    @property
+    def fetched_at(self) -> Optional[datetime]:
+        """When the source companyfacts document was fetched (None for unversioned indexes)."""
+        raw = self.header.get("fetched_at")
+        if not raw:
+            return None
+        fetched_at = datetime.fromisoformat(raw)
+        return fetched_at if fetched_at.tzinfo else fetched_at.replace(tzinfo=timezone.utc)
+
+    def _column(self, name: str) -> np.ndarray:
+        column = self._columns.get(name)
+        if column is None:
+            spec = self.header["columns"][name]
+            rows = self.header["rows"]
+            if rows == 0:
+                column = np.zeros(0, dtype=spec["dtype"])
+            else:
+                column = np.memmap(self.path, dtype=spec["dtype"], mode="r", offset=spec["offset"], shape=(rows,))
+            self._columns[name] = column
+        return column
+
+    def units(self, tag: str) -> List[str]:
+        """Units recorded for `tag`, in companyfacts document order."""
+        return list(self.tags.get(tag, {}).keys())
+
+    def latest(self, tag: str, unit: str, cutoff: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        """
+        Return the latest entry for (tag, unit) filed on or before `cutoff` (YYYY-MM-DD).
+
+        Entries without a filed date always qualify; if nothing qualifies, the latest entry overall is
+        returned. The result uses companyfacts field names (`val`, `start`, `end`, `filed`, ...).
+        """
+        bounds = self.tags.get(tag, {}).get(unit)
+        if not bounds or bounds[0] == bounds[1]:
+            return None
+        lo, hi = bounds
+        row = hi - 1
+        if cutoff:
+            filed = self._column("filed")[lo:hi]
+            qualifying = int(np.searchsorted(filed, _ordinal(cutoff), side="right"))
+            if qualifying:
+                row = lo + qualifying - 1
+        kind = int(self._column("val_kind")[row])
+        value: Any = None
+        if kind == _VAL_FLOAT:
+            value = float(self._column("val")[row])
+        elif kind == _VAL_INT:
+            value = int(self._column("val_int")[row])
+        return {
+            "val": value,
+            "start": _date_str(int(self._column("start")[row])),
+            "end": _date_str(int(self._column("end")[row])),
+            "filed": _date_str(int(self._column("filed")[row])),
+            "accn": _text(self._column("accn")[row]),
+            "contextRef": _text(self._column("context_ref")[row]),
+            "form": _text(self._column("form")[row]),
+        }